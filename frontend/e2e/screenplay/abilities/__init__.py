@@ -0,0 +1,4 @@
+"""
+Vallmere Abilities
+Extra abilities given to the actor by tests/conftest.py
+"""
@@ -0,0 +1,109 @@
+"""
+Reuse Storage State
+Per-role snapshots of an authenticated browser (localStorage, sessionStorage
+and cookies), captured once per session and restored into later tests
+"""
+import base64
+import json
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+
+def token_expiry(token: Optional[str]) -> Optional[float]:
+    """Return the `exp` claim of a JWT access token, or None if the token is not a JWT"""
+    if not token or token.count(".") != 2:
+        return None
+    payload = token.split(".")[1]
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except ValueError:
+        return None
+    exp = claims.get("exp")
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+class StorageStateCache:
+    """Storage-state files keyed by role, valid until the captured token expires
+
+    Files outlive the session: a later run restores them while they are still
+    valid and were captured on the same origin, and logs in again otherwise.
+    """
+
+    def __init__(self, directory, ttl_seconds: float = 1800, origin: Optional[str] = None):
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_seconds
+        self.origin = origin
+        self._states: Dict[str, dict] = {}
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Keep the snapshots this run can restore, drop the expired and foreign ones
+        for path in self.directory.glob("*.json"):
+            if self._read(path) is None:
+                path.unlink()
+
+    def path_for(self, role: str) -> Path:
+        return self.directory / f"{role}.json"
+
+    def get(self, role: str) -> Optional[dict]:
+        """Return the cached state for the role, or None when missing or expired"""
+        state = self._states.get(role)
+        if state is None and self.path_for(role).exists():
+            state = self._read(self.path_for(role))
+        if state is None or state["expires_at"] <= time.time():
+            self.invalidate(role)
+            return None
+        self._states[role] = state
+        return state
+
+    def put(self, role: str, state: dict) -> dict:
+        """Stamp the state with its expiry and store it for the role"""
+        now = time.time()
+        token = state["local_storage"].get("access_token")
+        state = dict(state, role=role, captured_at=now)
+        state["expires_at"] = token_expiry(token) or now + self.ttl_seconds
+        self._states[role] = state
+        self.path_for(role).write_text(json.dumps(state, indent=2), encoding="utf-8")
+        return state
+
+    def invalidate(self, role: str) -> None:
+        self._states.pop(role, None)
+        self.path_for(role).unlink(missing_ok=True)
+
+    def _read(self, path: Path) -> Optional[dict]:
+        """The state in a file, or None when it is unreadable, expired or from another origin"""
+        try:
+            state = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(state, dict) or state.get("expires_at", 0) <= time.time():
+            return None
+        if self.origin is not None and state.get("origin") != self.origin:
+            return None
+        return state
+
+
+class ReuseStorageState:
+    """Ability to restore per-role authenticated storage snapshots instead of logging in again
+
+    Examples::
+
+        Actor.named("User").who_can(
+            BrowseTheWeb.using(driver),
+            ReuseStorageState.from_cache(cache),
+        )
+    """
+
+    @classmethod
+    def from_cache(cls, cache: StorageStateCache) -> "ReuseStorageState":
+        return cls(cache)
+
+    def forget(self) -> None:
+        """The cache outlives the actor; it is owned by the session fixture"""
+
+    def __repr__(self) -> str:
+        return "Reuse Storage State"
+
+    __str__ = __repr__
+
+    def __init__(self, cache: StorageStateCache) -> None:
+        self.cache = cache
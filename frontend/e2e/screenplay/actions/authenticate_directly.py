@@ -0,0 +1,86 @@
+from typing import Optional
+
+from screenpy import Actor, settings
+from screenpy.exceptions import DeliveryError
+from screenpy.pacing import beat
+from screenpy_selenium.abilities import BrowseTheWeb
+
+from abilities.reuse_storage_state import ReuseStorageState
+from actions.in_page import allow_script_to_run
+from actions.storage_state import RestoreStorageState
+from actions.wait_for_angular import WaitForAngular
+from settings import BASE_URL
+
+# Waits for LocalUserService to seed the demo users, then stores the same
+# `currentUser` / `access_token` pair that AuthService.login() writes.
+INJECT_SESSION_SCRIPT = """
+const [email, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const started = performance.now();
+
+(function inject() {
+    const users = JSON.parse(localStorage.getItem('vallmere_users') || '[]');
+    const user = users.find(u => u.email === email);
+    if (user) {
+        const { password, ...userWithoutPassword } = user;
+        localStorage.setItem('access_token', 'local_token_' + Date.now());
+        localStorage.setItem('currentUser', JSON.stringify(userWithoutPassword));
+        done(userWithoutPassword);
+    } else if (performance.now() - started > timeoutMs) {
+        done(null);
+    } else {
+        setTimeout(inject, 25);
+    }
+})();
+"""
+
+
+class AuthenticateDirectly:
+    """Inicia sesión sin pasar por el formulario: escribe en localStorage la sesión que deja el login y abre la ruta indicada.
+
+    Si el actor puede ReuseStorageState, restaura la sesión real capturada para el rol en lugar de construirla.
+    """
+
+    CLIENT_EMAIL = "cliente@vallmere.com"
+    ADMIN_EMAIL = "admin@vallmere.com"
+
+    @classmethod
+    def as_client(cls) -> "AuthenticateDirectly":
+        return cls(cls.CLIENT_EMAIL, route="/profile", role="client")
+
+    @classmethod
+    def as_admin(cls) -> "AuthenticateDirectly":
+        return cls(cls.ADMIN_EMAIL, route="/admin", role="admin")
+
+    @classmethod
+    def as_user(cls, email: str) -> "AuthenticateDirectly":
+        return cls(email, route="/")
+
+    def then_open(self, route: str) -> "AuthenticateDirectly":
+        self.route = route
+        return self
+
+    def describe(self) -> str:
+        return f"Authenticate directly as {self.email} and open {self.route}."
+
+    @beat("{} inicia sesión directamente como {email} y abre {route}.")
+    def perform_as(self, the_actor: Actor) -> None:
+        if self.role and the_actor.has_ability_to(ReuseStorageState):
+            the_actor.attempts_to(RestoreStorageState.for_role(self.role).then_open(self.route))
+            return
+
+        browser = the_actor.ability_to(BrowseTheWeb).browser
+        # The login page is the lightest route that creates AuthService and seeds the users
+        browser.get(f"{BASE_URL}/login")
+        allow_script_to_run(browser, settings.TIMEOUT)
+        user = browser.execute_async_script(INJECT_SESSION_SCRIPT, self.email, int(settings.TIMEOUT * 1000))
+        if user is None:
+            raise DeliveryError(f"User {self.email} was not found in the app's local user store.")
+        # A full page load makes AuthService pick up the stored session on startup
+        browser.get(f"{BASE_URL}{self.route}")
+        the_actor.attempts_to(WaitForAngular.to_settle())
+
+    def __init__(self, email: str, route: str = "/", role: Optional[str] = None) -> None:
+        self.email = email
+        self.route = route
+        self.role = role
@@ -0,0 +1,118 @@
+import statistics
+from typing import Dict, List
+
+from screenpy import Actor
+from screenpy.exceptions import DeliveryError
+from screenpy.pacing import beat
+from screenpy_selenium.abilities import BrowseTheWeb
+from selenium.common.exceptions import WebDriverException
+
+# Performance.getMetrics names sampled after every iteration, and the growth
+# per iteration (slope of the linear fit) allowed by default for each one
+DEFAULT_ALLOWED_GROWTH = {
+    "JSHeapUsedSize": 64 * 1024,  # bytes
+    "Nodes": 5,
+    "JSEventListeners": 2,
+    "Documents": 0.1,
+}
+# A slope needs at least two measured iterations after the first sample
+MIN_ITERATIONS = 2
+
+
+class CheckForLeaks:
+    """Repite un recorrido del usuario varias veces y falla si la memoria de la app crece con cada vuelta.
+
+    Antes de cada muestra fuerza la recolección de basura (HeapProfiler.collectGarbage)
+    y lee el heap de JS, los nodos del DOM, los listeners y los documentos con
+    Performance.getMetrics. Las primeras vueltas no se miden: Angular carga módulos
+    y cachés la primera vez que se visita una ruta.
+
+        CheckForLeaks.while_repeating(
+            VallmereCartPage.open_cart(),
+            VallmereCartPage.close_cart(),
+        ).named("open and close the cart").times(20)
+
+    Después de ejecutarla, `samples` tiene las métricas de cada vuelta y `slopes`
+    el crecimiento por vuelta de cada métrica.
+    """
+
+    samples: List[Dict[str, float]]
+    slopes: Dict[str, float]
+
+    @classmethod
+    def while_repeating(cls, *actions) -> "CheckForLeaks":
+        return cls(list(actions))
+
+    def named(self, description: str) -> "CheckForLeaks":
+        self.description = description
+        return self
+
+    def times(self, iterations: int) -> "CheckForLeaks":
+        if iterations < MIN_ITERATIONS:
+            raise ValueError(f"Leak checks need at least {MIN_ITERATIONS} measured iterations")
+        self.iterations = iterations
+        return self
+
+    def after_warming_up(self, iterations: int) -> "CheckForLeaks":
+        self.warm_up = iterations
+        return self
+
+    def allowing(self, **growth_per_iteration: float) -> "CheckForLeaks":
+        """Override the allowed growth per iteration, e.g. allowing(JSHeapUsedSize=128 * 1024, Nodes=0)"""
+        self.allowed_growth = {**self.allowed_growth, **growth_per_iteration}
+        return self
+
+    def describe(self) -> str:
+        return f"Repeat {self.description} {self.iterations} times checking for leaks."
+
+    def _sample(self, browser) -> Dict[str, float]:
+        browser.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+        metrics = browser.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+        values = {metric["name"]: metric["value"] for metric in metrics}
+        return {name: values[name] for name in self.allowed_growth if name in values}
+
+    def report(self) -> str:
+        lines = [f"{'metric':<18}{'first':>14}{'last':>14}{'per iteration':>16}{'allowed':>12}"]
+        for name, slope in self.slopes.items():
+            lines.append(
+                f"{name:<18}{self.samples[0][name]:>14.0f}{self.samples[-1][name]:>14.0f}"
+                f"{slope:>16.1f}{self.allowed_growth[name]:>12g}"
+            )
+        return "\n".join(lines)
+
+    @beat("{} repite {description} {iterations} veces midiendo la memoria.")
+    def perform_as(self, the_actor: Actor) -> None:
+        browser = the_actor.ability_to(BrowseTheWeb).browser
+        try:
+            browser.execute_cdp_cmd("Performance.enable", {})
+            browser.execute_cdp_cmd("HeapProfiler.enable", {})
+        except WebDriverException as e:
+            raise DeliveryError(f"Leak checks need a Chromium browser with CDP: {e.__class__.__name__}") from e
+
+        for _ in range(self.warm_up):
+            the_actor.attempts_to(*self._actions)
+        self.samples = [self._sample(browser)]
+        for _ in range(self.iterations):
+            the_actor.attempts_to(*self._actions)
+            self.samples.append(self._sample(browser))
+
+        rounds = list(range(len(self.samples)))
+        self.slopes = {
+            name: statistics.linear_regression(rounds, [sample[name] for sample in self.samples]).slope
+            for name in self.samples[0]
+        }
+        leaking = [name for name, slope in self.slopes.items() if slope > self.allowed_growth[name]]
+        if leaking:
+            raise DeliveryError(
+                f"{', '.join(leaking)} kept growing while repeating {self.description} "
+                f"{self.iterations} times:\n{self.report()}"
+            )
+
+    def __init__(self, actions: list) -> None:
+        self._actions = actions
+        self.description = "the journey"
+        self.iterations = 10
+        self.warm_up = 2
+        self.allowed_growth = dict(DEFAULT_ALLOWED_GROWTH)
+        self.samples = []
+        self.slopes = {}
@@ -0,0 +1,146 @@
+"""
+In-Page Helpers
+JavaScript snippets shared by the actions that do their work inside the browser
+in a single WebDriver call
+"""
+from typing import Dict, Union
+
+from screenpy_selenium.target import Target
+from selenium.webdriver.common.by import By
+
+
+def locator_of(target: Union[Target, str, tuple]) -> Dict[str, str]:
+    """Serialize a Target, a (By, value) tuple or a CSS selector for the in-page helpers"""
+    if isinstance(target, Target):
+        by, value = target.get_locator()
+    elif isinstance(target, tuple):
+        by, value = target
+    else:
+        by, value = By.CSS_SELECTOR, target
+    return {"by": by, "value": value}
+
+
+def name_of(target: Union[Target, str, tuple]) -> str:
+    """Human readable name used in logs and error messages"""
+    if isinstance(target, Target):
+        return target.target_name
+    if isinstance(target, tuple):
+        return target[1]
+    return target
+
+
+# Room between an in-page deadline and the driver's script timeout, so the
+# script reports its own failure (which step, which element) before WebDriver
+# gives up on it with a bare ScriptTimeoutException
+SCRIPT_TIMEOUT_MARGIN = 5.0
+# What WebDriver allows an async script when nobody set a script timeout
+DEFAULT_SCRIPT_TIMEOUT = 30.0
+
+
+def allow_script_to_run(browser, seconds: float) -> None:
+    """Raise the driver's script timeout, when needed, for a script that stops itself after `seconds`
+
+    The timeout is remembered on the driver, so the usual case costs no WebDriver call.
+    """
+    needed = seconds + SCRIPT_TIMEOUT_MARGIN
+    if needed > getattr(browser, "_vallmere_script_timeout", DEFAULT_SCRIPT_TIMEOUT):
+        browser.set_script_timeout(needed)
+        browser._vallmere_script_timeout = needed
+
+
+# Defines findAll(locator) and isVisible(element) in the script that includes it.
+# Visibility follows Selenium's rules closely enough for waits: the element has
+# a box, and neither it nor an ancestor is hidden or fully transparent.
+LOCATOR_HELPERS_JS = """
+function findAll(locator) {
+    const value = locator.value;
+    switch (locator.by) {
+        case 'css selector':
+            return Array.from(document.querySelectorAll(value));
+        case 'id':
+            return Array.from(document.querySelectorAll('[id="' + CSS.escape(value) + '"]'));
+        case 'name':
+            return Array.from(document.querySelectorAll('[name="' + CSS.escape(value) + '"]'));
+        case 'class name':
+            return Array.from(document.getElementsByClassName(value));
+        case 'tag name':
+            return Array.from(document.getElementsByTagName(value));
+        case 'link text':
+            return Array.from(document.querySelectorAll('a')).filter(a => a.textContent.trim() === value);
+        case 'partial link text':
+            return Array.from(document.querySelectorAll('a')).filter(a => a.textContent.includes(value));
+        case 'xpath': {
+            const snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            const nodes = [];
+            for (let i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+            return nodes;
+        }
+        default:
+            throw new Error('Unsupported locator strategy: ' + locator.by);
+    }
+}
+
+function isVisible(element) {
+    const rect = element.getBoundingClientRect();
+    if (rect.width === 0 || rect.height === 0) return false;
+    for (let node = element; node && node.nodeType === Node.ELEMENT_NODE; node = node.parentElement) {
+        const style = getComputedStyle(node);
+        if (style.display === 'none' || style.visibility === 'hidden' || Number(style.opacity) === 0) return false;
+    }
+    return true;
+}
+"""
+
+
+# Promise-based waiting shared by the batched actions; needs LOCATOR_HELPERS_JS.
+# waitUntil resolves true as soon as the predicate holds (checked on DOM
+# mutations, transition/animation end and a 100 ms tick) or false on timeout.
+# waitForElement resolves with the first element matching the locator (and
+# optional text, contained or, with `exact`, the whole trimmed text) that
+# passes `accept`, or rejects explaining what was missing.
+ELEMENT_WAIT_JS = """
+function waitUntil(predicate, timeoutMs) {
+    return new Promise(resolve => {
+        if (predicate()) return resolve(true);
+        const events = ['transitionend', 'animationend', 'load'];
+        const check = () => { if (predicate()) finish(true); };
+        const observer = new MutationObserver(check);
+        const tick = setInterval(check, 100);
+        const timer = setTimeout(() => finish(predicate()), timeoutMs);
+        function finish(result) {
+            observer.disconnect();
+            clearInterval(tick);
+            clearTimeout(timer);
+            events.forEach(name => document.removeEventListener(name, check, true));
+            resolve(result);
+        }
+        observer.observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+        events.forEach(name => document.addEventListener(name, check, true));
+    });
+}
+
+function matching(locator, text, exact) {
+    const elements = findAll(locator);
+    if (!text) return elements;
+    return elements.filter(e => exact ? e.textContent.trim() === text : e.textContent.includes(text));
+}
+
+function isEnabled(element) {
+    return !element.disabled && !element.closest('fieldset[disabled]') && getComputedStyle(element).pointerEvents !== 'none';
+}
+
+function isClickable(element) {
+    return isVisible(element) && isEnabled(element);
+}
+
+async function waitForElement(locator, text, accept, timeoutMs, exact) {
+    let found = null;
+    await waitUntil(() => (found = matching(locator, text, exact).find(accept) || null) !== null, timeoutMs);
+    if (found) return found;
+    const candidates = matching(locator, text, exact);
+    const description = locator.value + (text ? (exact ? ' reading "' : ' containing "') + text + '"' : '');
+    if (candidates.length === 0) throw new Error(description + ' was not found after ' + timeoutMs + ' ms');
+    if (!candidates.some(isVisible)) throw new Error(description + ' was not visible after ' + timeoutMs + ' ms');
+    throw new Error(description + ' was not enabled after ' + timeoutMs + ' ms');
+}
+"""
@@ -0,0 +1,185 @@
+from typing import Any, List, Optional, Union
+
+from screenpy import Actor, settings
+from screenpy.exceptions import DeliveryError
+from screenpy.pacing import beat
+from screenpy_selenium.abilities import BrowseTheWeb
+from screenpy_selenium.target import Target
+from selenium.common.exceptions import WebDriverException
+
+from actions.in_page import ELEMENT_WAIT_JS, LOCATOR_HELPERS_JS, allow_script_to_run, locator_of, name_of
+
+# Runs the steps one after the other inside the page and reports the index of
+# the first step that fails, so a whole sequence costs one WebDriver call.
+# The timeout is one deadline for the whole batch: each wait gets what is left.
+RUN_IN_PAGE_SCRIPT = LOCATOR_HELPERS_JS + ELEMENT_WAIT_JS + """
+const [steps, batchTimeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const deadline = performance.now() + batchTimeoutMs;
+
+async function run(step) {
+    const timeoutMs = Math.max(0, deadline - performance.now());
+    switch (step.kind) {
+        case 'click': {
+            const element = await waitForElement(step.locator, step.text, isClickable, timeoutMs);
+            element.click();
+            return null;
+        }
+        case 'wait_visible':
+            await waitForElement(step.locator, step.text, isVisible, timeoutMs, step.exact);
+            return null;
+        case 'wait_hidden':
+            if (!await waitUntil(() => !matching(step.locator, step.text).some(isVisible), timeoutMs)) {
+                throw new Error(step.locator.value + ' was still visible after ' + timeoutMs + ' ms');
+            }
+            return null;
+        case 'read_text': {
+            const element = await waitForElement(step.locator, step.text, isVisible, timeoutMs);
+            return element.textContent.trim();
+        }
+        case 'set_value': {
+            const element = await waitForElement(step.locator, step.text, isClickable, timeoutMs);
+            element.value = step.value;
+            element.dispatchEvent(new Event('input', { bubbles: true }));
+            element.dispatchEvent(new Event('change', { bubbles: true }));
+            return null;
+        }
+        default:
+            throw new Error('Unknown step kind: ' + step.kind);
+    }
+}
+
+(async () => {
+    const results = [];
+    const timings = [];
+    for (let index = 0; index < steps.length; index++) {
+        const started = performance.now();
+        try {
+            results.push(await run(steps[index]));
+        } catch (error) {
+            done({ ok: false, failed: index, error: String(error && error.message || error), results, timings });
+            return;
+        }
+        timings.push(performance.now() - started);
+    }
+    done({ ok: true, results, timings });
+})();
+"""
+
+Locatable = Union[Target, str, tuple]
+
+
+class Step:
+    """One DOM action or in-page wait of a RunInPage batch."""
+
+    @classmethod
+    def click(cls, target: Locatable, containing_text: Optional[str] = None) -> "Step":
+        return cls("click", target, containing_text, f"click on the {name_of(target)}")
+
+    @classmethod
+    def wait_for(
+        cls, target: Locatable, containing_text: Optional[str] = None, equal_text: Optional[str] = None
+    ) -> "Step":
+        """Wait for the target to be visible; `equal_text` must be its whole text, `containing_text` only part of it"""
+        if equal_text is not None:
+            step = cls("wait_visible", target, equal_text, f'wait for the {name_of(target)} to read "{equal_text}"')
+            step.exact = True
+            return step
+        return cls("wait_visible", target, containing_text, f"wait for the {name_of(target)} to appear")
+
+    @classmethod
+    def wait_until_gone(cls, target: Locatable) -> "Step":
+        return cls("wait_hidden", target, None, f"wait for the {name_of(target)} to disappear")
+
+    @classmethod
+    def read_text(cls, target: Locatable) -> "Step":
+        return cls("read_text", target, None, f"read the text of the {name_of(target)}")
+
+    @classmethod
+    def set_value(cls, target: Locatable, value: str) -> "Step":
+        step = cls("set_value", target, None, f'set the {name_of(target)} to "{value}"')
+        step.value = value
+        return step
+
+    def to_script_argument(self) -> dict:
+        return {
+            "kind": self.kind,
+            "locator": locator_of(self.target),
+            "text": self.text,
+            "exact": self.exact,
+            "value": self.value,
+        }
+
+    def __repr__(self) -> str:
+        return self.description
+
+    def __init__(self, kind: str, target: Locatable, text: Optional[str], description: str) -> None:
+        self.kind = kind
+        self.target = target
+        self.text = text
+        self.description = description
+        self.value = None
+        self.exact = False
+
+
+class RunInPage:
+    """Ejecuta una secuencia de acciones del DOM y esperas en una sola llamada a execute_async_script.
+
+    Sirve cuando no hace falta decidir nada en Python entre un paso y otro:
+
+        RunInPage.steps(
+            Step.click(CART_ICON),
+            Step.wait_for(CART_CONTAINER_SHOW),
+            Step.click(QUANTITY_BTN_INCREASE),
+        ).named("increase the first cart item")
+
+    Si un paso falla, el error indica exactamente cuál. El tiempo de espera
+    (for_up_to) es para toda la secuencia, no para cada paso. Los valores de
+    Step.read_text quedan en `results` después de ejecutar la acción.
+    """
+
+    results: List[Any]
+
+    @classmethod
+    def steps(cls, *steps: Step) -> "RunInPage":
+        return cls(list(steps))
+
+    def named(self, description: str) -> "RunInPage":
+        self.description = description
+        return self
+
+    def for_up_to(self, seconds: float) -> "RunInPage":
+        self.timeout = seconds
+        return self
+
+    def describe(self) -> str:
+        return f"Run in the page: {self.description}."
+
+    @beat("{} ejecuta en la página: {description}.")
+    def perform_as(self, the_actor: Actor) -> None:
+        browser = the_actor.ability_to(BrowseTheWeb).browser
+        allow_script_to_run(browser, self.timeout)
+        try:
+            outcome = browser.execute_async_script(
+                RUN_IN_PAGE_SCRIPT,
+                [step.to_script_argument() for step in self._steps],
+                int(self.timeout * 1000),
+            )
+        except WebDriverException as e:
+            raise DeliveryError(f"Could not run in the page ({self.description}): {e.__class__.__name__}") from e
+
+        self.results = outcome["results"]
+        self.timings = outcome["timings"]
+        if not outcome["ok"]:
+            index = outcome["failed"]
+            raise DeliveryError(
+                f"Step {index + 1} of {len(self._steps)} ({self._steps[index]}) failed "
+                f"while trying to {self.description}: {outcome['error']}"
+            )
+
+    def __init__(self, steps: List[Step], seconds: Optional[float] = None) -> None:
+        self._steps = steps
+        self.timeout = seconds if seconds is not None else settings.TIMEOUT
+        self.description = ", then ".join(map(repr, steps))
+        self.results = []
+        self.timings = []
@@ -0,0 +1,134 @@
+import json
+
+from screenpy import Actor
+from screenpy.exceptions import DeliveryError
+from screenpy.pacing import beat
+from screenpy_selenium.abilities import BrowseTheWeb
+from screenpy_selenium.actions import Open
+
+from abilities.reuse_storage_state import ReuseStorageState
+from actions.wait_for_angular import WaitForAngular
+from pages.vallmere_admin_login_page import VallmereAdminLoginPage
+from pages.vallmere_login_page import VallmereLoginPage
+from settings import BASE_URL
+
+# Login page, page object and credentials used to capture each role once per session
+ROLE_LOGINS = {
+    "client": ("/login", VallmereLoginPage, "cliente@vallmere.com", "cliente123"),
+    "admin": ("/admin-login", VallmereAdminLoginPage, "admin@vallmere.com", "admin123"),
+}
+
+CAPTURE_STORAGE_SCRIPT = """
+const dump = storage => Object.fromEntries(
+    Array.from({ length: storage.length }, (_, i) => storage.key(i)).map(key => [key, storage.getItem(key)])
+);
+return { origin: location.origin, local_storage: dump(localStorage), session_storage: dump(sessionStorage) };
+"""
+
+# Evaluated by Chrome before any app script of the next document, so Angular
+# boots straight into the restored session.
+RESTORE_STORAGE_SCRIPT = """
+(() => {
+    const state = %s;
+    if (location.origin !== state.origin) return;
+    localStorage.clear();
+    sessionStorage.clear();
+    for (const [key, value] of Object.entries(state.local_storage)) localStorage.setItem(key, value);
+    for (const [key, value] of Object.entries(state.session_storage)) sessionStorage.setItem(key, value);
+})();
+"""
+
+
+def _cdp_cookie(cookie: dict) -> dict:
+    """Translate a WebDriver cookie into a CDP Network.CookieParam"""
+    param = {key: cookie[key] for key in ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite") if key in cookie}
+    if "expiry" in cookie:
+        param["expires"] = cookie["expiry"]
+    return param
+
+
+class LogInThroughTheForm:
+    """Inicia sesión con el formulario real de la aplicación para el rol indicado."""
+
+    @classmethod
+    def as_role(cls, role: str) -> "LogInThroughTheForm":
+        return cls(role)
+
+    @beat("{} inicia sesión con el formulario como {role}.")
+    def perform_as(self, the_actor: Actor) -> None:
+        path, page, email, password = ROLE_LOGINS[self.role]
+        the_actor.attempts_to(
+            Open.browser_on(f"{BASE_URL}{path}"),
+            page.wait_for_email_field(),
+            page.enter_email(email),
+            page.enter_password(password),
+            page.click_login_button(),
+            WaitForAngular.to_settle(),
+        )
+
+    def __init__(self, role: str) -> None:
+        if role not in ROLE_LOGINS:
+            raise ValueError(f"Unknown role {role!r}; expected one of {sorted(ROLE_LOGINS)}")
+        self.role = role
+
+
+class CaptureStorageState:
+    """Guarda localStorage, sessionStorage y cookies del navegador como la sesión del rol."""
+
+    @classmethod
+    def for_role(cls, role: str) -> "CaptureStorageState":
+        return cls(role)
+
+    @beat("{} guarda el estado de sesión del rol {role}.")
+    def perform_as(self, the_actor: Actor) -> None:
+        browser = the_actor.ability_to(BrowseTheWeb).browser
+        cache = the_actor.ability_to(ReuseStorageState).cache
+        state = browser.execute_script(CAPTURE_STORAGE_SCRIPT)
+        if "currentUser" not in state["local_storage"]:
+            raise DeliveryError(f"There is no logged-in user to capture for the {self.role} role.")
+        state["cookies"] = browser.get_cookies()
+        cache.put(self.role, state)
+
+    def __init__(self, role: str) -> None:
+        self.role = role
+
+
+class RestoreStorageState:
+    """Abre una ruta con la sesión guardada del rol; si no hay una vigente, inicia sesión por el formulario y la guarda."""
+
+    @classmethod
+    def for_role(cls, role: str) -> "RestoreStorageState":
+        return cls(role)
+
+    def then_open(self, route: str) -> "RestoreStorageState":
+        self.route = route
+        return self
+
+    @beat("{} restaura la sesión del rol {role} y abre {route}.")
+    def perform_as(self, the_actor: Actor) -> None:
+        browser = the_actor.ability_to(BrowseTheWeb).browser
+        state = the_actor.ability_to(ReuseStorageState).cache.get(self.role)
+
+        if state is None:
+            the_actor.attempts_to(
+                LogInThroughTheForm.as_role(self.role),
+                CaptureStorageState.for_role(self.role),
+            )
+            browser.get(f"{BASE_URL}{self.route}")
+        else:
+            if state["cookies"]:
+                browser.execute_cdp_cmd("Network.setCookies", {"cookies": [_cdp_cookie(c) for c in state["cookies"]]})
+            script = browser.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument",
+                {"source": RESTORE_STORAGE_SCRIPT % json.dumps(state)},
+            )
+            try:
+                browser.get(f"{BASE_URL}{self.route}")
+            finally:
+                browser.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script["identifier"]})
+
+        the_actor.attempts_to(WaitForAngular.to_settle())
+
+    def __init__(self, role: str, route: str = "/") -> None:
+        self.role = role
+        self.route = route
@@ -0,0 +1,98 @@
+from typing import Optional, Union
+
+from screenpy import Actor, settings
+from screenpy.exceptions import DeliveryError
+from screenpy.pacing import beat
+from screenpy_selenium.abilities import BrowseTheWeb
+from screenpy_selenium.target import Target
+from selenium.common.exceptions import WebDriverException
+
+from actions.in_page import ELEMENT_WAIT_JS, LOCATOR_HELPERS_JS, allow_script_to_run, locator_of, name_of
+
+# Waits until an element matching the locator (and text) is visible and
+# enabled, then clicks it. When the click opens a native dialog (confirm,
+# alert) it is dispatched after the script has returned, otherwise the dialog
+# would block the script and chromedriver would dismiss it.
+WAIT_AND_CLICK_SCRIPT = LOCATOR_HELPERS_JS + ELEMENT_WAIT_JS + """
+const [locator, text, timeoutMs, opensDialog] = arguments;
+const done = arguments[arguments.length - 1];
+const started = performance.now();
+
+waitForElement(locator, text, isClickable, timeoutMs).then(element => {
+    const waited = performance.now() - started;
+    if (opensDialog) {
+        done({ ok: true, waited, clicked: 0 });
+        setTimeout(() => element.click(), 0);
+        return;
+    }
+    const clickStarted = performance.now();
+    element.click();
+    done({ ok: true, waited, clicked: performance.now() - clickStarted });
+}, error => done({ ok: false, waited: performance.now() - started, error: String(error && error.message || error) }));
+"""
+
+
+class WaitAndClick:
+    """Espera dentro de la página a que el elemento exista, sea visible y esté habilitado, y le hace clic en una sola llamada.
+
+    Acepta un Target, una tupla (By, valor) o un selector CSS, y opcionalmente
+    un texto que el elemento debe contener:
+
+        WaitAndClick.on(VallmereAdminPage.SUBMIT_BTN)
+        WaitAndClick.on("a").containing_text("Hombre")
+
+    Después de ejecutarse, `waited_ms` y `click_ms` guardan cuánto tardó la espera y el clic.
+    """
+
+    @classmethod
+    def on(cls, target: Union[Target, str, tuple]) -> "WaitAndClick":
+        return cls(target)
+
+    def containing_text(self, text: str) -> "WaitAndClick":
+        self.text = text
+        return self
+
+    def for_up_to(self, seconds: float) -> "WaitAndClick":
+        self.timeout = seconds
+        return self
+
+    def that_opens_a_dialog(self) -> "WaitAndClick":
+        """Click after the script returns so a confirm() or alert() can stay open"""
+        self.opens_dialog = True
+        return self
+
+    @property
+    def element_name(self) -> str:
+        name = name_of(self.target)
+        return f'{name} containing "{self.text}"' if self.text else name
+
+    def describe(self) -> str:
+        return f"Wait for and click on the {self.element_name}."
+
+    @beat("{} espera y hace clic en {element_name}.")
+    def perform_as(self, the_actor: Actor) -> None:
+        browser = the_actor.ability_to(BrowseTheWeb).browser
+        allow_script_to_run(browser, self.timeout)
+        try:
+            outcome = browser.execute_async_script(
+                WAIT_AND_CLICK_SCRIPT,
+                locator_of(self.target),
+                self.text,
+                int(self.timeout * 1000),
+                self.opens_dialog,
+            )
+        except WebDriverException as e:
+            raise DeliveryError(f"Could not click on the {self.element_name}: {e.__class__.__name__}") from e
+
+        self.waited_ms = outcome["waited"]
+        if not outcome["ok"]:
+            raise DeliveryError(f"Could not click on the {self.element_name}: {outcome['error']}")
+        self.click_ms = outcome["clicked"]
+
+    def __init__(self, target: Union[Target, str, tuple], text: Optional[str] = None, seconds: Optional[float] = None) -> None:
+        self.target = target
+        self.text = text
+        self.timeout = seconds if seconds is not None else settings.TIMEOUT
+        self.opens_dialog = False
+        self.waited_ms: Optional[float] = None
+        self.click_ms: Optional[float] = None
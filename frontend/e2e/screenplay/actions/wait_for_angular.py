@@ -0,0 +1,114 @@
+from typing import Optional
+
+from screenpy import Actor, settings
+from screenpy.exceptions import DeliveryError
+from screenpy.pacing import beat
+from screenpy_selenium.abilities import BrowseTheWeb
+from selenium.common.exceptions import WebDriverException
+
+from actions.in_page import allow_script_to_run
+
+# Runs entirely inside the page: one WebDriver round trip per wait.
+# Stability means Angular's testabilities report whenStable, no XHR/fetch is
+# pending and no router navigation (history change) happened while checking.
+# The quiet window re-checks after a short pause to cover async work zone.js
+# cannot see (e.g. crypto.subtle promises during login).
+WAIT_FOR_ANGULAR_SCRIPT = """
+const [timeoutMs, quietMs] = arguments;
+const done = arguments[arguments.length - 1];
+const started = performance.now();
+
+if (!window.__vallmereNet) {
+    const net = window.__vallmereNet = { pending: 0, navigations: 0 };
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function (...args) {
+        net.pending++;
+        this.addEventListener('loadend', () => net.pending--, { once: true });
+        return send.apply(this, args);
+    };
+    const fetch = window.fetch;
+    window.fetch = function (...args) {
+        net.pending++;
+        return fetch.apply(this, args).finally(() => net.pending--);
+    };
+    for (const method of ['pushState', 'replaceState']) {
+        const original = history[method];
+        history[method] = function (...args) {
+            net.navigations++;
+            return original.apply(this, args);
+        };
+    }
+    window.addEventListener('popstate', () => net.navigations++);
+}
+const net = window.__vallmereNet;
+
+const testabilities = () => window.getAllAngularTestabilities ? window.getAllAngularTestabilities() : [];
+const angularIsStable = () => testabilities().every(t => t.isStable());
+const whenAngularStable = () => Promise.all(testabilities().map(t => new Promise(resolve => t.whenStable(resolve))));
+
+function check() {
+    const elapsed = performance.now() - started;
+    if (elapsed > timeoutMs) {
+        done({ stable: false, elapsed, pending: net.pending, angular: testabilities().length > 0 });
+        return;
+    }
+    if (document.readyState !== 'complete' || testabilities().length === 0 || net.pending > 0) {
+        setTimeout(check, 25);
+        return;
+    }
+    const navigations = net.navigations;
+    whenAngularStable().then(() => setTimeout(() => {
+        if (net.pending === 0 && net.navigations === navigations && angularIsStable()) {
+            done({ stable: true, elapsed: performance.now() - started });
+        } else {
+            check();
+        }
+    }, quietMs));
+}
+check();
+"""
+
+
+class WaitForAngular:
+    """Espera a que la aplicación Angular quede estable: zona sin tareas, sin HTTP pendiente y sin navegaciones."""
+
+    @classmethod
+    def to_settle(cls) -> "WaitForAngular":
+        return cls()
+
+    def for_up_to(self, seconds: float) -> "WaitForAngular":
+        self.timeout = seconds
+        return self
+
+    def with_quiet_window_of(self, milliseconds: int) -> "WaitForAngular":
+        self.quiet_ms = milliseconds
+        return self
+
+    def describe(self) -> str:
+        return f"Wait up to {self.timeout} seconds for Angular to settle."
+
+    @beat("{} espera hasta {timeout} segundos a que Angular se estabilice.")
+    def perform_as(self, the_actor: Actor) -> None:
+        browser = the_actor.ability_to(BrowseTheWeb).browser
+        allow_script_to_run(browser, self.timeout)
+        try:
+            result = browser.execute_async_script(
+                WAIT_FOR_ANGULAR_SCRIPT, int(self.timeout * 1000), self.quiet_ms
+            )
+        except WebDriverException as e:
+            raise DeliveryError(f"Could not wait for Angular to settle: {e.__class__.__name__}") from e
+
+        if not result["stable"] and not result["angular"]:
+            raise DeliveryError(
+                f"Angular exposed no testability within {self.timeout} seconds; "
+                "production builds leave it out, build with `ng build --configuration e2e`"
+            )
+        if not result["stable"]:
+            raise DeliveryError(
+                f"Angular did not settle within {self.timeout} seconds "
+                f"(pending requests: {result['pending']}, testability found: {result['angular']})"
+            )
+
+    def __init__(self, seconds: Optional[float] = None, quiet_ms: int = 50) -> None:
+        self.timeout = seconds if seconds is not None else settings.TIMEOUT
+        self.quiet_ms = quiet_ms
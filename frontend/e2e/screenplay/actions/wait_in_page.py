@@ -0,0 +1,171 @@
+from typing import List, Optional
+
+from screenpy import Actor, settings
+from screenpy.exceptions import DeliveryError
+from screenpy.pacing import beat
+from screenpy_selenium.abilities import BrowseTheWeb
+from screenpy_selenium.target import Target
+from selenium.common.exceptions import WebDriverException
+
+from actions.in_page import LOCATOR_HELPERS_JS, allow_script_to_run, locator_of, name_of
+
+# Resolves from a MutationObserver callback as soon as the conditions hold, so
+# the whole wait costs one WebDriver round trip. Visibility can also change
+# without DOM mutations (CSS transitions, images finishing loading), which the
+# transition/animation listeners and a slow safety tick cover.
+WAIT_IN_PAGE_SCRIPT = LOCATOR_HELPERS_JS + """
+const [conditions, mode, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const started = performance.now();
+
+function holds(condition) {
+    const elements = findAll(condition.locator);
+    switch (condition.state) {
+        case 'visible':
+            return elements.some(isVisible);
+        case 'hidden':
+            return !elements.some(isVisible);
+        case 'text':
+            return elements.some(e => e.textContent.includes(condition.text));
+        default:
+            throw new Error('Unknown wait state: ' + condition.state);
+    }
+}
+
+function evaluate() {
+    const met = conditions.map(holds);
+    return { met, ok: mode === 'all' ? met.every(Boolean) : met.some(Boolean) };
+}
+
+let finished = false;
+let observer = null;
+let tick = null;
+let timer = null;
+const events = ['transitionend', 'animationend', 'load'];
+
+function finish(result) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearInterval(tick);
+    clearTimeout(timer);
+    events.forEach(name => document.removeEventListener(name, check, true));
+    result.elapsed = performance.now() - started;
+    done(result);
+}
+
+function check() {
+    try {
+        const result = evaluate();
+        if (result.ok) finish(result);
+    } catch (error) {
+        finish({ ok: false, met: [], error: String(error) });
+    }
+}
+
+check();
+if (!finished) {
+    observer = new MutationObserver(check);
+    observer.observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+    events.forEach(name => document.addEventListener(name, check, true));
+    tick = setInterval(check, 100);
+    timer = setTimeout(() => finish(evaluate()), timeoutMs);
+}
+"""
+
+
+class WaitInPage:
+    """Espera dentro de la página (MutationObserver) a que uno o varios Targets cumplan una condición.
+
+    Se usa igual que Wait de screenpy_selenium:
+
+        Wait.for_the(CART).to_appear()  ->  WaitInPage.for_the(CART).to_appear()
+
+    y además permite esperar varios Targets en una sola llamada:
+
+        WaitInPage.for_all_of(TITLE, PRICE, DESCRIPTION).to_appear()
+        WaitInPage.for_any_of(SUCCESS_TOAST, ERROR_TOAST).to_appear()
+    """
+
+    targets: List[Target]
+
+    @classmethod
+    def for_the(cls, target: Target) -> "WaitInPage":
+        return cls(targets=[target])
+
+    for_ = for_the
+
+    @classmethod
+    def for_all_of(cls, *targets: Target) -> "WaitInPage":
+        return cls(targets=list(targets), mode="all")
+
+    @classmethod
+    def for_any_of(cls, *targets: Target) -> "WaitInPage":
+        return cls(targets=list(targets), mode="any")
+
+    def seconds_for_the(self, *targets: Target) -> "WaitInPage":
+        self.targets = list(targets)
+        return self
+
+    seconds_for = seconds_for_the
+
+    def to_appear(self) -> "WaitInPage":
+        self.state = "visible"
+        self.log_detail = "to appear"
+        return self
+
+    def to_disappear(self) -> "WaitInPage":
+        self.state = "hidden"
+        self.log_detail = "to disappear"
+        return self
+
+    def to_contain_text(self, text: str) -> "WaitInPage":
+        self.state = "text"
+        self.text = text
+        self.log_detail = f'to contain "{text}"'
+        return self
+
+    @property
+    def log_message(self) -> str:
+        joiner = " and " if self.mode == "all" else " or "
+        return f"for the {joiner.join(map(name_of, self.targets))} {self.log_detail}"
+
+    def describe(self) -> str:
+        return f"Wait {self.timeout} seconds {self.log_message}."
+
+    @beat("{} espera hasta {timeout} segundos {log_message}...")
+    def perform_as(self, the_actor: Actor) -> None:
+        browser = the_actor.ability_to(BrowseTheWeb).browser
+        conditions = [
+            {"locator": locator_of(target), "state": self.state, "text": self.text}
+            for target in self.targets
+        ]
+        allow_script_to_run(browser, self.timeout)
+        try:
+            result = browser.execute_async_script(
+                WAIT_IN_PAGE_SCRIPT, conditions, self.mode, int(self.timeout * 1000)
+            )
+        except WebDriverException as e:
+            raise DeliveryError(f"Could not wait {self.log_message}: {e.__class__.__name__}") from e
+
+        if not result["ok"]:
+            if "error" in result:
+                raise DeliveryError(f"Could not wait {self.log_message}: {result['error']}")
+            missing = [name_of(t) for t, met in zip(self.targets, result["met"]) if not met]
+            raise DeliveryError(
+                f"Waited {self.timeout} seconds {self.log_message}, "
+                f"but it did not happen for: {', '.join(missing)}"
+            )
+
+    def __init__(
+        self,
+        seconds: Optional[float] = None,
+        targets: Optional[List[Target]] = None,
+        mode: str = "all",
+    ) -> None:
+        self.timeout = seconds if seconds is not None else settings.TIMEOUT
+        self.targets = targets if targets is not None else []
+        self.mode = mode
+        self.state = "visible"
+        self.text = None
+        self.log_detail = "to appear"
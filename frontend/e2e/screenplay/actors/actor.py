@@ -1,18 +1,83 @@
-from screenpy import Actor
+from contextlib import ExitStack
+from typing import Optional
+
+from screenpy import Actor, See, SeeAllOf, SeeAnyOf
 from screenpy_selenium.abilities import BrowseTheWeb
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 
-def create_actor_named(name: str) -> Actor:
+from actors.animations import configure_rendering
+from settings import BROWSER_LOGS
+
+
+def chrome_options(network_log: bool = False) -> Options:
+    """Opciones de Chrome compartidas por todos los navegadores de la suite.
+
+    Con network_log=True Chrome también guarda los eventos de red (log "performance").
+    """
     options = Options()
+    options.add_argument("--window-size=1920,1080")
     options.add_argument("--headless=new")  # quítala si quieres ver el navegador
     options.add_argument("--disable-gpu")
     options.add_argument("--no-sandbox")
-    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--disable-dev-shm-usage")  # Prevent shared memory issues
+    # Consola y, si se pide, eventos de red, que plugins/browser_logs.py adjunta a los tests fallidos
+    logging_prefs = {"browser": "ALL"} if BROWSER_LOGS else {}
+    if network_log:
+        logging_prefs["performance"] = "ALL"
+        options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+    if logging_prefs:
+        options.set_capability("goog:loggingPrefs", logging_prefs)
+    return options
+
 
+def create_driver(
+    animations: bool = True, toastr_timeout: Optional[int] = None, network_log: bool = False
+) -> webdriver.Chrome:
+    """Crea un navegador Chrome nuevo con las opciones de la suite.
+
+    Con animations=False las transiciones y animaciones terminan en el primer frame
+    (ver actors/animations.py); toastr_timeout cambia cuántos ms se ven los toasts.
+    """
     # ¡Sin ruta! Selenium Manager resuelve el driver correcto automáticamente.
-    service = Service()
-    driver = webdriver.Chrome(service=service, options=options)
+    driver = webdriver.Chrome(service=Service(), options=chrome_options(network_log))
+    configure_rendering(driver, animations, toastr_timeout)
+    return driver
+
+
+# Assertions only read the page, so they do not count as a step that may have changed it
+READ_ONLY_ACTIONS = (See, SeeAllOf, SeeAnyOf)
+
+
+class VallmereActor(Actor):
+    """Actor que cuenta las acciones que realiza.
+
+    Las preguntas caras (por ejemplo CartContents) guardan su respuesta junto con
+    `actions_performed` y la reutilizan mientras el actor no haya hecho nada más.
+    Cada observador (ver plugins/step_trace.py y plugins/command_profile.py) ve
+    todas las acciones, incluidas las anidadas, a través de su `step(action)`.
+    """
+
+    actions_performed: int = 0
+    observers: tuple = ()
+
+    def observe_with(self, observer) -> None:
+        self.observers += (observer,)
+
+    def stop_observing(self, observer) -> None:
+        self.observers = tuple(o for o in self.observers if o is not observer)
+
+    def perform(self, action) -> None:
+        try:
+            with ExitStack() as steps:
+                for observer in self.observers:
+                    steps.enter_context(observer.step(action))
+                super().perform(action)
+        finally:
+            if not isinstance(action, READ_ONLY_ACTIONS):
+                self.actions_performed += 1
+
 
-    return Actor.named(name).who_can(BrowseTheWeb.using(driver))
+def create_actor_named(name: str) -> VallmereActor:
+    return VallmereActor.named(name).who_can(BrowseTheWeb.using(create_driver()))
@@ -0,0 +1,79 @@
+"""
+Animation-Free Rendering
+A script Chrome runs at the start of every document (Page.addScriptToEvaluateOnNewDocument)
+that makes CSS transitions and animations and the Web Animations API finish on
+the first frame, plus reduced-motion emulation and ngx-toastr overrides
+"""
+import json
+from typing import Optional
+
+RENDERING_SCRIPT = """
+(() => {
+  const settings = %(settings)s;
+  // Read by app.config.ts when the app boots, which is after this script (e2e builds only)
+  window.__vallmereE2E = Object.assign(window.__vallmereE2E || {}, settings);
+  if (settings.animations) {
+    return;
+  }
+
+  // Duration 0 rather than `animation: none`: elements still end in their last keyframe,
+  // and animationend still fires
+  const css = `*, *::before, *::after {
+    transition-duration: 0s !important;
+    transition-delay: 0s !important;
+    animation-duration: 0s !important;
+    animation-delay: 0s !important;
+    scroll-behavior: auto !important;
+  }`;
+  const addStyle = () => {
+    const style = document.createElement('style');
+    style.id = 'vallmere-no-animations';
+    style.textContent = css;
+    (document.head || document.documentElement).appendChild(style);
+  };
+  // The script runs before the document has an <html> element to attach the style to
+  if (document.documentElement) {
+    addStyle();
+  } else {
+    new MutationObserver((records, observer) => {
+      if (document.documentElement) {
+        observer.disconnect();
+        addStyle();
+      }
+    }).observe(document, { childList: true });
+  }
+
+  // @angular/animations (ngx-toastr's fade in/out) runs on element.animate(), which CSS does not reach
+  const animate = Element.prototype.animate;
+  Element.prototype.animate = function (keyframes, options) {
+    const timing = options !== null && typeof options === 'object'
+      ? { ...options, duration: 0, delay: 0, endDelay: 0 }
+      : 0;
+    return animate.call(this, keyframes, timing);
+  };
+})();
+"""
+
+
+def rendering_settings(animations: bool = True, toastr_timeout: Optional[int] = None) -> dict:
+    toastr = {}
+    if toastr_timeout is not None:
+        toastr.update(timeOut=toastr_timeout, extendedTimeOut=toastr_timeout)
+    if not animations:
+        # ngx-toastr also waits easeTime before it removes a toast, outside the animation
+        toastr["easeTime"] = 0
+    return {"animations": animations, "toastr": toastr}
+
+
+def configure_rendering(driver, animations: bool = True, toastr_timeout: Optional[int] = None) -> None:
+    """Install the overrides in every document the driver's tab loads from now on"""
+    if animations and toastr_timeout is None:
+        return
+    settings = rendering_settings(animations, toastr_timeout)
+    driver.execute_cdp_cmd(
+        "Page.addScriptToEvaluateOnNewDocument", {"source": RENDERING_SCRIPT % {"settings": json.dumps(settings)}}
+    )
+    if not animations:
+        driver.execute_cdp_cmd(
+            "Emulation.setEmulatedMedia", {"features": [{"name": "prefers-reduced-motion", "value": "reduce"}]}
+        )
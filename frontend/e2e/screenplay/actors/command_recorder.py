@@ -0,0 +1,86 @@
+"""
+WebDriver Command Recorder
+Times every command a driver sends to chromedriver by wrapping the
+RemoteConnection it talks through
+"""
+import time
+from contextlib import contextmanager
+from typing import Callable, List, NamedTuple
+
+
+class Command(NamedTuple):
+    name: str
+    started: float  # time.perf_counter() seconds
+    ended: float
+
+    @property
+    def duration(self) -> float:
+        return self.ended - self.started
+
+
+class CommandRecorder:
+    """Records the name and timing of each command sent through a driver's RemoteConnection
+
+    One recorder is attached per driver, so pooled browsers keep theirs between
+    tests; call clear() when a new test starts using the driver.
+    """
+
+    @classmethod
+    def of(cls, driver) -> "CommandRecorder":
+        """Return the recorder attached to the driver, attaching one the first time"""
+        connection = driver.command_executor
+        recorder = getattr(connection, "_vallmere_recorder", None)
+        if recorder is None:
+            recorder = cls(connection)
+            connection._vallmere_recorder = recorder
+        return recorder
+
+    def clear(self) -> None:
+        self.commands.clear()
+        self.excluded_seconds = 0.0
+
+    @contextmanager
+    def unrecorded(self):
+        """Send commands that are not part of the test, such as measurement probes
+
+        They are neither recorded nor passed to listeners, and the time spent in
+        the block is added to `excluded_seconds` so timers can leave it out.
+        """
+        started = time.perf_counter()
+        self._paused += 1
+        try:
+            yield
+        finally:
+            self._paused -= 1
+            self.excluded_seconds += time.perf_counter() - started
+
+    def since(self, index: int) -> List[Command]:
+        """Commands recorded after the first `index` ones"""
+        return self.commands[index:]
+
+    def add_listener(self, listener: Callable[[str, dict], None]) -> None:
+        """Call `listener(command, params)` after every command that succeeds"""
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str, dict], None]) -> None:
+        self.listeners.remove(listener)
+
+    def _timed_execute(self, command: str, params: dict):
+        if self._paused:
+            return self._execute(command, params)
+        started = time.perf_counter()
+        try:
+            response = self._execute(command, params)
+        finally:
+            self.commands.append(Command(command, started, time.perf_counter()))
+        for listener in list(self.listeners):
+            listener(command, params)
+        return response
+
+    def __init__(self, connection) -> None:
+        self.commands: List[Command] = []
+        self.listeners: List[Callable[[str, dict], None]] = []
+        self.excluded_seconds = 0.0
+        self._paused = 0
+        self._execute = connection.execute
+        connection.execute = self._timed_execute
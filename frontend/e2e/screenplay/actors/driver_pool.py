@@ -0,0 +1,99 @@
+"""
+Browser Pool
+Keeps Chrome instances alive across tests and resets them between uses
+"""
+from typing import Callable, Dict, List
+from urllib.parse import urlparse
+
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from actors.actor import create_driver
+from settings import BASE_URL
+
+
+def _origin_of(url: str) -> str:
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https"):
+        return ""
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+class BrowserPool:
+    """Hands out reusable browsers and recycles them after a number of tests"""
+
+    def __init__(self, factory: Callable[[], WebDriver] = create_driver, max_uses: int = 20):
+        self.factory = factory
+        self.max_uses = max_uses
+        self._idle: List[WebDriver] = []
+        self._uses: Dict[int, int] = {}
+        self.launched = 0
+
+    def acquire(self) -> WebDriver:
+        """Return an idle browser, launching a new one if none is available"""
+        if self._idle:
+            return self._idle.pop()
+        driver = self.factory()
+        self._uses[id(driver)] = 0
+        self.launched += 1
+        return driver
+
+    def release(self, driver: WebDriver) -> None:
+        """Reset the browser and keep it for the next test, or quit it when it is worn out"""
+        self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+        if self._uses[id(driver)] >= self.max_uses or not self.reset(driver):
+            self._discard(driver)
+            return
+        self._idle.append(driver)
+
+    def reset(self, driver: WebDriver) -> bool:
+        """Bring the browser back to a blank state; returns False if it could not be reset"""
+        try:
+            self._dismiss_alerts(driver)
+            self._close_extra_windows(driver)
+            self._clear_storage(driver)
+            driver.get("about:blank")
+            return True
+        except WebDriverException:
+            return False
+
+    def close(self) -> None:
+        """Quit every browser the pool still holds"""
+        while self._idle:
+            self._discard(self._idle.pop())
+
+    def _discard(self, driver: WebDriver) -> None:
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    @staticmethod
+    def _dismiss_alerts(driver: WebDriver) -> None:
+        # An alert can open another one from its handler, so keep going until none is left
+        for _ in range(5):
+            try:
+                driver.switch_to.alert.dismiss()
+            except NoAlertPresentException:
+                return
+
+    @staticmethod
+    def _close_extra_windows(driver: WebDriver) -> None:
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+    @staticmethod
+    def _clear_storage(driver: WebDriver) -> None:
+        current_origin = _origin_of(driver.current_url)
+        if current_origin:
+            # sessionStorage belongs to the tab, so it has to be cleared from inside the page
+            driver.execute_script("window.sessionStorage.clear(); window.localStorage.clear();")
+        origins = {_origin_of(BASE_URL), current_origin} - {""}
+        for origin in origins:
+            # Clears localStorage, sessionStorage, IndexedDB, cache storage and cookies of the origin
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        driver.delete_all_cookies()
@@ -0,0 +1,205 @@
+"""
+Test Environment Orchestrator
+Starts the frontend and the backend, waits for both in parallel, runs pytest
+and always stops what it started:
+
+    python orchestrate.py                                 # build if present, stand-in backend, all tests
+    python orchestrate.py --frontend dev --backend nest -- -n auto tests/test_0*.py
+"""
+import argparse
+import json
+import os
+import re
+import signal
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import List, Optional
+from urllib.parse import urlparse
+
+from plugins.static_frontend import DEFAULT_DIST
+from settings import API_URL, BASE_URL
+
+SUITE_DIR = Path(__file__).resolve().parent
+LOG_DIR = SUITE_DIR / ".services"
+FRONTEND_DIR = SUITE_DIR.parents[1]
+REPO_DIR = FRONTEND_DIR.parent
+
+FRONTEND_MODES = ("auto", "dist", "dev", "external")
+BACKEND_MODES = ("stub", "node-stub", "nest", "external", "none")
+
+# Readiness polling: first retry after 50 ms, growing by half each time up to 1 s between polls
+POLL_FIRST_DELAY = 0.05
+POLL_BACKOFF = 1.5
+POLL_MAX_DELAY = 1.0
+POLL_REQUEST_TIMEOUT = 2.0
+
+
+def _port(url: str) -> str:
+    return str(urlparse(url).port or 80)
+
+
+def answers(url: str) -> bool:
+    """True once the URL answers with anything but a server error"""
+    try:
+        with urllib.request.urlopen(url, timeout=POLL_REQUEST_TIMEOUT) as response:
+            return response.status < 500
+    except urllib.error.HTTPError as e:
+        return e.code < 500
+    except (urllib.error.URLError, OSError):
+        return False
+
+
+class Service:
+    """A process the suite needs, the URL that says it is ready and how long that took"""
+
+    def __init__(self, name: str, url: str, command: Optional[List[str]] = None, cwd=SUITE_DIR, env=None, timeout: float = 60) -> None:
+        self.name = name
+        self.url = url
+        self.command = command
+        self.cwd = cwd
+        self.env = env
+        self.timeout = timeout
+        self.process: Optional[subprocess.Popen] = None
+        self.started_at = 0.0
+        self.ready_seconds: Optional[float] = None
+        self.reused = False
+        self.log_path = LOG_DIR / (re.sub(r"\W+", "-", name).strip("-") + ".log")
+        self._stopping = threading.Event()
+
+    def start(self) -> None:
+        self.started_at = time.perf_counter()
+        if self.command is None or answers(self.url):
+            # External service, or one a developer already has running: use it and leave it alone
+            self.reused = True
+            return
+        LOG_DIR.mkdir(exist_ok=True)
+        with open(self.log_path, "wb") as log:
+            self.process = subprocess.Popen(
+                self.command,
+                cwd=self.cwd,
+                env={**os.environ, **(self.env or {})},
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                # Its own process group, so npm's children are stopped with it
+                start_new_session=os.name != "nt",
+                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if os.name == "nt" else 0,
+            )
+
+    def wait_until_ready(self) -> None:
+        delay = POLL_FIRST_DELAY
+        deadline = self.started_at + self.timeout
+        while not answers(self.url):
+            if self._stopping.is_set():
+                return
+            if self.process is not None and self.process.poll() is not None:
+                output = self.log_path.read_text(encoding="utf-8", errors="replace").strip()
+                raise RuntimeError(f"{self.name} exited with {self.process.returncode} (log: {self.log_path}):\n{output[-2000:]}")
+            if time.perf_counter() >= deadline:
+                raise TimeoutError(f"{self.name} did not answer on {self.url} within {self.timeout:.0f} s")
+            self._stopping.wait(min(delay, max(0.0, deadline - time.perf_counter())))
+            delay = min(delay * POLL_BACKOFF, POLL_MAX_DELAY)
+        self.ready_seconds = time.perf_counter() - self.started_at
+
+    def stop(self) -> None:
+        self._stopping.set()
+        if self.process is None or self.process.poll() is not None:
+            return
+        if os.name == "nt":
+            self.process.send_signal(signal.CTRL_BREAK_EVENT)
+        else:
+            os.killpg(self.process.pid, signal.SIGTERM)
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            if os.name == "nt":
+                self.process.kill()
+            else:
+                os.killpg(self.process.pid, signal.SIGKILL)
+            self.process.wait()
+
+
+def frontend_service(mode: str) -> Service:
+    if mode == "auto":
+        mode = "dist" if (DEFAULT_DIST / "browser" / "index.html").is_file() else "dev"
+    if mode == "dist":
+        command = [sys.executable, "-m", "plugins.static_frontend", str(DEFAULT_DIST), "--port", _port(BASE_URL)]
+        return Service("frontend (dist)", BASE_URL, command, timeout=15)
+    if mode == "dev":
+        # The dev server compiles the whole app before it answers
+        command = ["npm", "start", "--", "--port", _port(BASE_URL)]
+        return Service("frontend (ng serve)", BASE_URL, command, cwd=FRONTEND_DIR, timeout=300)
+    return Service("frontend", BASE_URL)
+
+
+def backend_service(mode: str) -> Optional[Service]:
+    health = f"{API_URL}/"
+    if mode == "stub":
+        command = [sys.executable, "-m", "stub_backend", "--port", _port(API_URL)]
+        return Service("backend (stub_backend)", health, command, timeout=15)
+    if mode == "node-stub":
+        command = ["node", str(REPO_DIR / "test-stub-server.js")]
+        return Service("backend (test-stub-server.js)", health, command, env={"PORT": _port(API_URL)}, timeout=15)
+    if mode == "nest":
+        command = ["npm", "run", "start"]
+        return Service("backend (nest)", health, command, cwd=REPO_DIR / "backend", env={"PORT": _port(API_URL)}, timeout=180)
+    if mode == "external":
+        return Service("backend", health)
+    return None
+
+
+def report(services: List[Service], startup_log: Optional[str]) -> None:
+    for service in services:
+        source = "already running" if service.reused else "started"
+        print(f"  {service.name:<32} ready in {service.ready_seconds:6.2f} s ({source}) {service.url}")
+    if startup_log:
+        line = {
+            "at": time.time(),
+            "services": {service.name: {"ready_seconds": round(service.ready_seconds, 3), "reused": service.reused} for service in services},
+        }
+        Path(startup_log).parent.mkdir(parents=True, exist_ok=True)
+        with open(startup_log, "a", encoding="utf-8") as log:
+            log.write(json.dumps(line) + "\n")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frontend", choices=FRONTEND_MODES, default="auto", help="auto: the build in dist/ if there is one, else ng serve")
+    parser.add_argument("--backend", choices=BACKEND_MODES, default="stub")
+    parser.add_argument("--startup-log", default=None, metavar="PATH", help="Append each service's time-to-ready to this JSONL file")
+    parser.add_argument("pytest_args", nargs=argparse.REMAINDER, help="Arguments for pytest, after --")
+    args = parser.parse_args(argv)
+    pytest_args = args.pytest_args[1:] if args.pytest_args[:1] == ["--"] else args.pytest_args
+
+    services = [service for service in (frontend_service(args.frontend), backend_service(args.backend)) if service]
+    # Ctrl+C and CI cancellation (SIGTERM) still reach the finally block below
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    pool = ThreadPoolExecutor(max_workers=len(services))
+    try:
+        for service in services:
+            service.start()
+        # The first failure ends the wait; stopping the services releases the other pollers
+        done, _ = wait([pool.submit(service.wait_until_ready) for service in services], return_when=FIRST_EXCEPTION)
+        for waiting in done:
+            waiting.result()
+        print("Services ready:")
+        report(services, args.startup_log)
+        return subprocess.call([sys.executable, "-m", "pytest", *pytest_args], cwd=SUITE_DIR)
+    except (RuntimeError, TimeoutError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        for service in reversed(services):
+            service.stop()
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,10 +3,13 @@ Vallmere Admin Login Page
 Page Object following ScreenPlay pattern for the admin login page
 """
 from screenpy import See
-from screenpy_selenium.actions import Click, Enter, Wait
+from screenpy_selenium.actions import Click, Enter
 from screenpy_selenium.target import Target
 from selenium.webdriver.common.by import By
 
+from actions.wait_and_click import WaitAndClick
+from actions.wait_in_page import WaitInPage
+
 
 class VallmereAdminLoginPage:
     """Page Object for Vallmere Admin Login Page"""
@@ -36,17 +39,8 @@ class VallmereAdminLoginPage:
     
     @staticmethod
     def click_login_button():
-        """Click the admin login button using JavaScript"""
-        class ClickAdminLoginJS:
-            def perform_as(self, actor):
-                from screenpy_selenium.abilities import BrowseTheWeb
-                browser = actor.ability_to(BrowseTheWeb).browser
-                browser.execute_script("""
-                    const btn = document.querySelector('button.admin-login-btn') || 
-                                document.querySelector('button[type="submit"]');
-                    if (btn) btn.click();
-                """)
-        return ClickAdminLoginJS()
+        """Click the admin login button"""
+        return WaitAndClick.on("button.admin-login-btn, button[type='submit']")
     
     @staticmethod
     def click_admin_login_button():
@@ -56,35 +50,35 @@ class VallmereAdminLoginPage:
     @staticmethod
     def wait_for_email_field():
         """Wait for the email field to be visible"""
-        return Wait.for_the(VallmereAdminLoginPage.EMAIL_FIELD).to_appear()
+        return WaitInPage.for_the(VallmereAdminLoginPage.EMAIL_FIELD).to_appear()
     
     @staticmethod
     def wait_for_admin_panel():
         """Wait for admin panel to be visible (after login)"""
-        return Wait.for_the(VallmereAdminLoginPage.ADMIN_PANEL).to_appear()
+        return WaitInPage.for_the(VallmereAdminLoginPage.ADMIN_PANEL).to_appear()
     
     @staticmethod
     def wait_for_error_toast():
         """Wait for error toast to appear"""
-        return Wait.for_the(VallmereAdminLoginPage.ERROR_TOAST).to_appear()
+        return WaitInPage.for_the(VallmereAdminLoginPage.ERROR_TOAST).to_appear()
     
     @staticmethod
     def admin_panel_is_visible():
         """Assert that admin panel is visible"""
-        return Wait.for_the(VallmereAdminLoginPage.ADMIN_PANEL).to_appear()
+        return WaitInPage.for_the(VallmereAdminLoginPage.ADMIN_PANEL).to_appear()
     
     @staticmethod
     def admin_sidebar_is_visible():
         """Assert that admin sidebar is visible"""
-        return Wait.for_the(VallmereAdminLoginPage.ADMIN_SIDEBAR).to_appear()
+        return WaitInPage.for_the(VallmereAdminLoginPage.ADMIN_SIDEBAR).to_appear()
     
     @staticmethod
     def error_toast_is_visible():
         """Assert that error toast is visible"""
-        return Wait.for_the(VallmereAdminLoginPage.ERROR_TOAST).to_appear()
+        return WaitInPage.for_the(VallmereAdminLoginPage.ERROR_TOAST).to_appear()
     
     @staticmethod
     def admin_login_container_is_visible():
         """Assert that admin login container is visible"""
-        return Wait.for_the(VallmereAdminLoginPage.ADMIN_LOGIN_CONTAINER).to_appear()
+        return WaitInPage.for_the(VallmereAdminLoginPage.ADMIN_LOGIN_CONTAINER).to_appear()
 
@@ -3,12 +3,15 @@ Vallmere Admin Page
 Page Object following ScreenPlay pattern for admin panel
 """
 from screenpy import See
-from screenpy_selenium.actions import Click, Enter, Wait
+from screenpy_selenium.actions import Click, Enter
 from screenpy_selenium.questions import Text
 from screenpy_selenium.target import Target
 from screenpy.resolutions import IsEqualTo, ContainsTheText
 from selenium.webdriver.common.by import By
 
+from actions.wait_and_click import WaitAndClick
+from actions.wait_in_page import WaitInPage
+
 
 class VallmereAdminPage:
     """Page Object for Vallmere Admin Panel"""
@@ -56,55 +59,37 @@ class VallmereAdminPage:
     @staticmethod
     def wait_for_admin_panel():
         """Wait for admin panel to be visible"""
-        return Wait.for_the(VallmereAdminPage.ADMIN_PANEL).to_appear()
+        return WaitInPage.for_the(VallmereAdminPage.ADMIN_PANEL).to_appear()
     
     @staticmethod
     def admin_panel_is_visible():
         """Assert that admin panel is visible"""
-        return Wait.for_the(VallmereAdminPage.ADMIN_PANEL).to_appear()
+        return WaitInPage.for_the(VallmereAdminPage.ADMIN_PANEL).to_appear()
     
     @staticmethod
     def admin_sidebar_is_visible():
         """Assert that admin sidebar is visible"""
-        return Wait.for_the(VallmereAdminPage.ADMIN_SIDEBAR).to_appear()
+        return WaitInPage.for_the(VallmereAdminPage.ADMIN_SIDEBAR).to_appear()
     
     @staticmethod
     def click_view_products():
-        """Click view products button using JavaScript"""
-        class ClickViewProductsJS:
-            def perform_as(self, actor):
-                from screenpy_selenium.abilities import BrowseTheWeb
-                browser = actor.ability_to(BrowseTheWeb).browser
-                browser.execute_script("""
-                    const btn = document.querySelector('.nav-item[class*="active"]') || 
-                                document.querySelector('button.nav-item');
-                    if (btn && btn.textContent.includes('View Products')) btn.click();
-                """)
-        return ClickViewProductsJS()
+        """Click view products button"""
+        return WaitAndClick.on("button.nav-item").containing_text("View Products")
     
     @staticmethod
     def click_add_product():
-        """Click add product button using JavaScript"""
-        class ClickAddProductJS:
-            def perform_as(self, actor):
-                from screenpy_selenium.abilities import BrowseTheWeb
-                browser = actor.ability_to(BrowseTheWeb).browser
-                browser.execute_script("""
-                    const buttons = document.querySelectorAll('button.nav-item');
-                    const btn = Array.from(buttons).find(b => b.textContent.includes('Add Product'));
-                    if (btn) btn.click();
-                """)
-        return ClickAddProductJS()
+        """Click add product button"""
+        return WaitAndClick.on("button.nav-item").containing_text("Add Product")
     
     @staticmethod
     def admin_table_is_visible():
         """Assert that admin table is visible"""
-        return Wait.for_the(VallmereAdminPage.ADMIN_TABLE).to_appear()
+        return WaitInPage.for_the(VallmereAdminPage.ADMIN_TABLE).to_appear()
     
     @staticmethod
     def table_header_is_visible():
         """Assert that table header is visible"""
-        return Wait.for_the(VallmereAdminPage.TABLE_THEAD).to_appear()
+        return WaitInPage.for_the(VallmereAdminPage.TABLE_THEAD).to_appear()
     
     @staticmethod
     def enter_search_term(term: str):
@@ -114,53 +99,37 @@ class VallmereAdminPage:
     @staticmethod
     def search_results_info_is_visible():
         """Assert that search results info is visible"""
-        return Wait.for_the(VallmereAdminPage.SEARCH_RESULTS_INFO).to_appear()
+        return WaitInPage.for_the(VallmereAdminPage.SEARCH_RESULTS_INFO).to_appear()
     
     @staticmethod
     def admin_form_is_visible():
         """Assert that admin form is visible"""
-        return Wait.for_the(VallmereAdminPage.ADMIN_FORM).to_appear()
+        return WaitInPage.for_the(VallmereAdminPage.ADMIN_FORM).to_appear()
     
     @staticmethod
     def name_field_is_visible():
         """Assert that name field is visible"""
-        return Wait.for_the(VallmereAdminPage.NAME_FIELD).to_appear()
+        return WaitInPage.for_the(VallmereAdminPage.NAME_FIELD).to_appear()
     
     @staticmethod
     def click_submit():
         """Click submit button"""
-        class ClickSubmitJS:
-            def perform_as(self, actor):
-                from screenpy_selenium.abilities import BrowseTheWeb
-                browser = actor.ability_to(BrowseTheWeb).browser
-                browser.execute_script("""
-                    const btn = document.querySelector('button[type="submit"]');
-                    if (btn) btn.click();
-                """)
-        return ClickSubmitJS()
+        return WaitAndClick.on(VallmereAdminPage.SUBMIT_BTN)
     
     @staticmethod
     def error_toast_is_visible():
         """Assert that error toast is visible"""
-        return Wait.for_the(VallmereAdminPage.ERROR_TOAST).to_appear()
+        return WaitInPage.for_the(VallmereAdminPage.ERROR_TOAST).to_appear()
     
     @staticmethod
     def success_toast_is_visible():
         """Assert that success toast is visible"""
-        return Wait.for_the(VallmereAdminPage.SUCCESS_TOAST).to_appear()
+        return WaitInPage.for_the(VallmereAdminPage.SUCCESS_TOAST).to_appear()
     
     @staticmethod
     def click_edit_first():
         """Click first edit button"""
-        class ClickEditJS:
-            def perform_as(self, actor):
-                from screenpy_selenium.abilities import BrowseTheWeb
-                browser = actor.ability_to(BrowseTheWeb).browser
-                browser.execute_script("""
-                    const editButtons = document.querySelectorAll('button.btn-icon.edit');
-                    if (editButtons.length > 0) editButtons[0].click();
-                """)
-        return ClickEditJS()
+        return WaitAndClick.on(VallmereAdminPage.EDIT_BTN_FIRST)
     
     @staticmethod
     def content_title_is(expected_text: str):
@@ -238,15 +207,7 @@ class VallmereAdminPage:
     @staticmethod
     def click_delete_image():
         """Click delete image button"""
-        class ClickDeleteImageJS:
-            def perform_as(self, actor):
-                from screenpy_selenium.abilities import BrowseTheWeb
-                browser = actor.ability_to(BrowseTheWeb).browser
-                browser.execute_script("""
-                    const btn = document.querySelector('.delete');
-                    if (btn) btn.click();
-                """)
-        return ClickDeleteImageJS()
+        return WaitAndClick.on(VallmereAdminPage.DELETE_IMAGE_BTN)
     
     @staticmethod
     def enter_image_url(url: str):
@@ -261,15 +222,7 @@ class VallmereAdminPage:
     @staticmethod
     def click_delete_first():
         """Click first delete button"""
-        class ClickDeleteJS:
-            def perform_as(self, actor):
-                from screenpy_selenium.abilities import BrowseTheWeb
-                browser = actor.ability_to(BrowseTheWeb).browser
-                browser.execute_script("""
-                    const deleteButtons = document.querySelectorAll('button.btn-icon.delete[title="Delete Product"]');
-                    if (deleteButtons.length > 0) deleteButtons[0].click();
-                """)
-        return ClickDeleteJS()
+        return WaitAndClick.on(VallmereAdminPage.DELETE_BTN_FIRST).that_opens_a_dialog()
     
     @staticmethod
     def accept_confirmation():
@@ -290,13 +243,5 @@ class VallmereAdminPage:
     @staticmethod
     def click_logout():
         """Click logout button"""
-        class ClickLogoutJS:
-            def perform_as(self, actor):
-                from screenpy_selenium.abilities import BrowseTheWeb
-                browser = actor.ability_to(BrowseTheWeb).browser
-                browser.execute_script("""
-                    const btn = document.querySelector('.logout-btn');
-                    if (btn) btn.click();
-                """)
-        return ClickLogoutJS()
+        return WaitAndClick.on(VallmereAdminPage.LOGOUT_BTN)
 
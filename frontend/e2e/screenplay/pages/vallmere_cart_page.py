@@ -3,12 +3,16 @@ Vallmere Cart Page
 Page Object following ScreenPlay pattern for shopping cart
 """
 from screenpy import See
-from screenpy_selenium.actions import Click, Enter, Wait
+from screenpy_selenium.actions import Click, Enter
 from screenpy_selenium.questions import Text
 from screenpy_selenium.target import Target
 from screenpy.resolutions import IsEqualTo, ContainsTheText
 from selenium.webdriver.common.by import By
 
+from actions.run_in_page import RunInPage, Step
+from actions.wait_and_click import WaitAndClick
+from actions.wait_in_page import WaitInPage
+
 
 class VallmereCartPage:
     """Page Object for Vallmere Shopping Cart"""
@@ -17,6 +21,7 @@ class VallmereCartPage:
     CART_ICON = Target.the("cart icon").located_by((By.CSS_SELECTOR, ".cart-icon"))
     CART_CONTAINER = Target.the("cart container").located_by((By.CSS_SELECTOR, ".cart-container"))
     CART_CONTAINER_SHOW = Target.the("cart container shown").located_by((By.CSS_SELECTOR, ".cart-container.show"))
+    CLOSE_BTN = Target.the("close cart button").located_by((By.CSS_SELECTOR, ".cart-container .close-btn"))
     CART_HEADER = Target.the("cart header").located_by((By.XPATH, "//h3[contains(text(),'Shopping Cart')]"))
     EMPTY_CART = Target.the("empty cart message").located_by((By.CSS_SELECTOR, ".empty-cart"))
     
@@ -24,6 +29,7 @@ class VallmereCartPage:
     CART_ITEM = Target.the("cart item").located_by((By.CSS_SELECTOR, ".cart-item"))
     CART_ITEM_FIRST = Target.the("first cart item").located_by((By.CSS_SELECTOR, ".cart-item:first-child"))
     QUANTITY = Target.the("quantity").located_by((By.CSS_SELECTOR, ".quantity"))
+    QUANTITY_FIRST = Target.the("first item quantity").located_by((By.CSS_SELECTOR, ".cart-item:first-child .quantity"))
     QUANTITY_BTN_INCREASE = Target.the("increase quantity button").located_by((By.CSS_SELECTOR, ".quantity-btn:last-child"))
     QUANTITY_BTN_DECREASE = Target.the("decrease quantity button").located_by((By.CSS_SELECTOR, ".quantity-btn:first-child"))
     REMOVE_BTN = Target.the("remove button").located_by((By.CSS_SELECTOR, ".remove-btn"))
@@ -38,83 +44,87 @@ class VallmereCartPage:
     
     @staticmethod
     def click_cart_icon():
-        """Click the cart icon to open/close cart using JavaScript"""
-        class ClickCartIconJS:
-            def perform_as(self, actor):
-                from screenpy_selenium.abilities import BrowseTheWeb
-                browser = actor.ability_to(BrowseTheWeb).browser
-                browser.execute_script("""
-                    const cartIcon = document.querySelector('.cart-icon');
-                    if (cartIcon) cartIcon.click();
-                """)
-        return ClickCartIconJS()
+        """Click the cart icon to open/close cart"""
+        return WaitAndClick.on(VallmereCartPage.CART_ICON)
+    
+    @staticmethod
+    def open_cart():
+        """Click the cart icon and wait for the cart to slide in, in a single script call"""
+        return RunInPage.steps(
+            Step.click(VallmereCartPage.CART_ICON),
+            Step.wait_for(VallmereCartPage.CART_CONTAINER_SHOW),
+        ).named("open the cart")
+    
+    @staticmethod
+    def close_cart():
+        """Click the cart's close button and wait for the cart to slide out, in a single script call"""
+        return RunInPage.steps(
+            Step.click(VallmereCartPage.CLOSE_BTN),
+            Step.wait_until_gone(VallmereCartPage.CART_CONTAINER_SHOW),
+        ).named("close the cart")
     
     @staticmethod
     def wait_for_cart_container():
         """Wait for cart container to appear"""
-        return Wait.for_the(VallmereCartPage.CART_CONTAINER_SHOW).to_appear()
+        return WaitInPage.for_the(VallmereCartPage.CART_CONTAINER_SHOW).to_appear()
     
     @staticmethod
     def cart_container_is_visible():
         """Assert that cart container is visible"""
-        return Wait.for_the(VallmereCartPage.CART_CONTAINER_SHOW).to_appear()
+        return WaitInPage.for_the(VallmereCartPage.CART_CONTAINER_SHOW).to_appear()
     
     @staticmethod
     def empty_cart_is_visible():
         """Assert that empty cart message is visible"""
-        return Wait.for_the(VallmereCartPage.EMPTY_CART).to_appear()
+        return WaitInPage.for_the(VallmereCartPage.EMPTY_CART).to_appear()
     
     @staticmethod
     def cart_header_text_is(expected_text: str):
         """Assert that cart header has expected text"""
-        return Wait.for_the(VallmereCartPage.CART_HEADER).to_appear()
+        return WaitInPage.for_the(VallmereCartPage.CART_HEADER).to_appear()
     
     @staticmethod
     def cart_item_is_visible():
         """Assert that at least one cart item is visible"""
-        return Wait.for_the(VallmereCartPage.CART_ITEM).to_appear()
+        return WaitInPage.for_the(VallmereCartPage.CART_ITEM).to_appear()
     
     @staticmethod
     def click_increase_quantity():
         """Click to increase quantity of first item"""
-        class ClickIncreaseQuantityJS:
-            def perform_as(self, actor):
-                from screenpy_selenium.abilities import BrowseTheWeb
-                browser = actor.ability_to(BrowseTheWeb).browser
-                browser.execute_script("""
-                    const btn = document.querySelector('.cart-item:first-child .quantity-btn:last-child');
-                    if (btn) btn.click();
-                """)
-        return ClickIncreaseQuantityJS()
+        return WaitAndClick.on(".cart-item:first-child .quantity-btn:last-child")
+    
+    @staticmethod
+    def open_cart_and_increase_first_item():
+        """Open the cart, read the first item's quantity and increase it, in a single script call
+
+        The quantity read before the click is the action's `results[2]`.
+        """
+        return RunInPage.steps(
+            Step.click(VallmereCartPage.CART_ICON),
+            Step.wait_for(VallmereCartPage.CART_ITEM_FIRST),
+            Step.read_text(VallmereCartPage.QUANTITY_FIRST),
+            Step.click(".cart-item:first-child .quantity-btn:last-child"),
+        ).named("open the cart and increase the first item")
+    
+    @staticmethod
+    def first_item_quantity_becomes(quantity: int):
+        """Wait in the page until the first cart item shows this quantity"""
+        return RunInPage.steps(
+            Step.wait_for(VallmereCartPage.QUANTITY_FIRST, equal_text=str(quantity)),
+        ).named(f"see the first item quantity become {quantity}")
     
     @staticmethod
     def click_remove_first_item():
         """Click to remove first item from cart"""
-        class ClickRemoveJS:
-            def perform_as(self, actor):
-                from screenpy_selenium.abilities import BrowseTheWeb
-                browser = actor.ability_to(BrowseTheWeb).browser
-                browser.execute_script("""
-                    const btn = document.querySelector('.cart-item:first-child .remove-btn');
-                    if (btn) btn.click();
-                """)
-        return ClickRemoveJS()
+        return WaitAndClick.on(VallmereCartPage.REMOVE_BTN_FIRST)
     
     @staticmethod
     def click_clear_cart():
         """Click to clear all items from cart"""
-        class ClickClearJS:
-            def perform_as(self, actor):
-                from screenpy_selenium.abilities import BrowseTheWeb
-                browser = actor.ability_to(BrowseTheWeb).browser
-                browser.execute_script("""
-                    const btn = document.querySelector('.clear-btn');
-                    if (btn) btn.click();
-                """)
-        return ClickClearJS()
+        return WaitAndClick.on(VallmereCartPage.CLEAR_BTN).that_opens_a_dialog()
     
     @staticmethod
     def badge_is_visible():
         """Assert that cart badge is visible"""
-        return Wait.for_the(VallmereCartPage.BADGE).to_appear()
+        return WaitInPage.for_the(VallmereCartPage.BADGE).to_appear()
 
@@ -3,12 +3,15 @@ Vallmere Header Page
 Page Object following ScreenPlay pattern for app header and navigation
 """
 from screenpy import See
-from screenpy_selenium.actions import Click, Enter, Wait
+from screenpy_selenium.actions import Click, Enter
 from screenpy_selenium.questions import Text
 from screenpy_selenium.target import Target
 from screenpy.resolutions import IsEqualTo, ContainsTheText
 from selenium.webdriver.common.by import By
 
+from actions.wait_and_click import WaitAndClick
+from actions.wait_in_page import WaitInPage
+
 
 class VallmereHeaderPage:
     """Page Object for Vallmere App Header"""
@@ -30,12 +33,12 @@ class VallmereHeaderPage:
     @staticmethod
     def wait_for_header():
         """Wait for header to be visible"""
-        return Wait.for_the(VallmereHeaderPage.APP_HEADER).to_appear()
+        return WaitInPage.for_the(VallmereHeaderPage.APP_HEADER).to_appear()
     
     @staticmethod
     def app_header_is_visible():
         """Assert that app header is visible"""
-        return Wait.for_the(VallmereHeaderPage.APP_HEADER).to_appear()
+        return WaitInPage.for_the(VallmereHeaderPage.APP_HEADER).to_appear()
     
     @staticmethod
     def enter_search_term(term: str):
@@ -45,25 +48,17 @@ class VallmereHeaderPage:
     @staticmethod
     def search_results_are_visible():
         """Assert that search results are visible"""
-        return Wait.for_the(VallmereHeaderPage.SEARCH_RESULTS).to_appear()
+        return WaitInPage.for_the(VallmereHeaderPage.SEARCH_RESULTS).to_appear()
     
     @staticmethod
     def search_results_item_is_visible():
         """Assert that at least one search result item is visible"""
-        return Wait.for_the(VallmereHeaderPage.SEARCH_RESULTS_ITEM).to_appear()
+        return WaitInPage.for_the(VallmereHeaderPage.SEARCH_RESULTS_ITEM).to_appear()
     
     @staticmethod
     def click_first_search_result():
         """Click first search result"""
-        class ClickFirstResultJS:
-            def perform_as(self, actor):
-                from screenpy_selenium.abilities import BrowseTheWeb
-                browser = actor.ability_to(BrowseTheWeb).browser
-                browser.execute_script("""
-                    const result = document.querySelector('.search-results li:first-child');
-                    if (result) result.click();
-                """)
-        return ClickFirstResultJS()
+        return WaitAndClick.on(VallmereHeaderPage.SEARCH_RESULTS_FIRST)
     
     @staticmethod
     def click_back_home():
@@ -73,18 +68,10 @@ class VallmereHeaderPage:
     @staticmethod
     def sidebar_nav_is_visible():
         """Assert that sidebar navigation is visible"""
-        return Wait.for_the(VallmereHeaderPage.SIDEBAR_NAV).to_appear()
+        return WaitInPage.for_the(VallmereHeaderPage.SIDEBAR_NAV).to_appear()
     
     @staticmethod
     def click_category(category_name: str):
         """Click on a category link in sidebar"""
-        class ClickCategoryJS:
-            def perform_as(self, actor):
-                from screenpy_selenium.abilities import BrowseTheWeb
-                browser = actor.ability_to(BrowseTheWeb).browser
-                browser.execute_script(f"""
-                    const link = Array.from(document.querySelectorAll('a')).find(a => a.textContent.includes('{category_name}'));
-                    if (link) link.click();
-                """)
-        return ClickCategoryJS()
+        return WaitAndClick.on("a").containing_text(category_name)
 
@@ -3,10 +3,12 @@ Vallmere Landing Page (Home Page with Products)
 Page Object following ScreenPlay pattern for the main landing page
 """
 from screenpy import See
-from screenpy_selenium.actions import Click, Wait
+from screenpy_selenium.actions import Click
 from screenpy_selenium.target import Target
 from selenium.webdriver.common.by import By
 
+from actions.wait_in_page import WaitInPage
+
 
 class VallmereLandingPage:
     """Page Object for Vallmere Landing/Home Page"""
@@ -35,32 +37,32 @@ class VallmereLandingPage:
     @staticmethod
     def wait_for_product_cards():
         """Wait for product cards to be visible"""
-        return Wait.for_the(VallmereLandingPage.PRODUCT_CARD).to_appear()
+        return WaitInPage.for_the(VallmereLandingPage.PRODUCT_CARD).to_appear()
     
     @staticmethod
     def wait_for_app_header():
         """Wait for app header to be visible"""
-        return Wait.for_the(VallmereLandingPage.APP_HEADER).to_appear()
+        return WaitInPage.for_the(VallmereLandingPage.APP_HEADER).to_appear()
     
     @staticmethod
     def product_card_is_visible():
         """Assert that product card is visible"""
-        return Wait.for_the(VallmereLandingPage.PRODUCT_CARD).to_appear()
+        return WaitInPage.for_the(VallmereLandingPage.PRODUCT_CARD).to_appear()
     
     @staticmethod
     def product_image_is_visible():
         """Assert that product image is visible"""
-        return Wait.for_the(VallmereLandingPage.PRODUCT_IMAGE).to_appear()
+        return WaitInPage.for_the(VallmereLandingPage.PRODUCT_IMAGE).to_appear()
     
     @staticmethod
     def product_title_is_visible():
         """Assert that product title is visible"""
-        return Wait.for_the(VallmereLandingPage.PRODUCT_TITLE).to_appear()
+        return WaitInPage.for_the(VallmereLandingPage.PRODUCT_TITLE).to_appear()
     
     @staticmethod
     def product_price_is_visible():
         """Assert that product price is visible"""
-        return Wait.for_the(VallmereLandingPage.PRODUCT_PRICE).to_appear()
+        return WaitInPage.for_the(VallmereLandingPage.PRODUCT_PRICE).to_appear()
     
     @staticmethod
     def click_first_product():
@@ -3,12 +3,13 @@ Vallmere Login Page - Client Login
 Page Object following ScreenPlay pattern for the client login page
 """
 from screenpy import See
-from screenpy_selenium.actions import Click, Enter, Wait
+from screenpy_selenium.actions import Click, Enter
 from screenpy_selenium.questions import Text
 from screenpy_selenium.target import Target
 from screenpy.resolutions import IsEqualTo, ContainsTheText
 from selenium.webdriver.common.by import By
 
+from actions.wait_in_page import WaitInPage
 from questions.browser_url import BrowserURL
 
 
@@ -47,32 +48,32 @@ class VallmereLoginPage:
     @staticmethod
     def wait_for_email_field():
         """Wait for the email field to be visible"""
-        return Wait.for_the(VallmereLoginPage.EMAIL_FIELD).to_appear()
+        return WaitInPage.for_the(VallmereLoginPage.EMAIL_FIELD).to_appear()
     
     @staticmethod
     def wait_for_success_toast():
         """Wait for success toast to appear"""
-        return Wait.for_the(VallmereLoginPage.SUCCESS_TOAST).to_appear()
+        return WaitInPage.for_the(VallmereLoginPage.SUCCESS_TOAST).to_appear()
     
     @staticmethod
     def wait_for_error_toast():
         """Wait for error toast to appear"""
-        return Wait.for_the(VallmereLoginPage.ERROR_TOAST).to_appear()
+        return WaitInPage.for_the(VallmereLoginPage.ERROR_TOAST).to_appear()
     
     @staticmethod
     def success_toast_is_visible():
         """Assert that success toast is visible"""
-        return Wait.for_the(VallmereLoginPage.SUCCESS_TOAST).to_appear()
+        return WaitInPage.for_the(VallmereLoginPage.SUCCESS_TOAST).to_appear()
     
     @staticmethod
     def error_toast_is_visible():
         """Assert that error toast is visible"""
-        return Wait.for_the(VallmereLoginPage.ERROR_TOAST).to_appear()
+        return WaitInPage.for_the(VallmereLoginPage.ERROR_TOAST).to_appear()
     
     @staticmethod
     def error_message_is_visible():
         """Assert that error message is visible"""
-        return Wait.for_the(VallmereLoginPage.ERROR_MESSAGE).to_appear()
+        return WaitInPage.for_the(VallmereLoginPage.ERROR_MESSAGE).to_appear()
     
     @staticmethod
     def error_message_contains(text: str):
@@ -82,5 +83,5 @@ class VallmereLoginPage:
     @staticmethod
     def profile_container_is_visible():
         """Assert that profile container is visible after login"""
-        return Wait.for_the(VallmereLoginPage.PROFILE_CONTAINER).to_appear()
+        return WaitInPage.for_the(VallmereLoginPage.PROFILE_CONTAINER).to_appear()
 
@@ -3,12 +3,17 @@ Vallmere Product Detail Page
 Page Object following ScreenPlay pattern for individual product detail view
 """
 from screenpy import See
-from screenpy_selenium.actions import Click, Wait
+from screenpy_selenium.actions import Click
 from screenpy_selenium.questions import Text
 from screenpy_selenium.target import Target
 from screenpy.resolutions import IsEqualTo
 from selenium.webdriver.common.by import By
 
+from actions.wait_and_click import WaitAndClick
+from actions.wait_in_page import WaitInPage
+from questions.page_snapshot import PageSnapshot
+from resolutions.see_all_of import SeeAllOf
+
 
 class VallmereProductPage:
     """Page Object for Vallmere Product Detail Page"""
@@ -40,103 +45,83 @@ class VallmereProductPage:
     @staticmethod
     def wait_for_product_detail():
         """Wait for product detail container to be visible"""
-        return Wait.for_the(VallmereProductPage.PRODUCT_DETAIL).to_appear()
+        return WaitInPage.for_the(VallmereProductPage.PRODUCT_DETAIL).to_appear()
     
     @staticmethod
     def wait_for_add_to_cart_button():
         """Wait for add to cart button to be visible"""
-        return Wait.for_the(VallmereProductPage.ADD_TO_CART_BUTTON).to_appear()
+        return WaitInPage.for_the(VallmereProductPage.ADD_TO_CART_BUTTON).to_appear()
     
     @staticmethod
     def wait_for_success_toast():
         """Wait for success toast to appear"""
-        return Wait.for_the(VallmereProductPage.SUCCESS_TOAST).to_appear()
+        return WaitInPage.for_the(VallmereProductPage.SUCCESS_TOAST).to_appear()
     
     @staticmethod
     def product_detail_is_visible():
         """Assert that product detail container is visible"""
-        return Wait.for_the(VallmereProductPage.PRODUCT_DETAIL).to_appear()
+        return WaitInPage.for_the(VallmereProductPage.PRODUCT_DETAIL).to_appear()
     
     @staticmethod
     def product_title_is_visible():
         """Assert that product title is visible"""
-        return Wait.for_the(VallmereProductPage.PRODUCT_INFO_TITLE).to_appear()
+        return WaitInPage.for_the(VallmereProductPage.PRODUCT_INFO_TITLE).to_appear()
     
     @staticmethod
     def product_price_is_visible():
         """Assert that product price is visible"""
-        return Wait.for_the(VallmereProductPage.PRODUCT_PRICE).to_appear()
+        return WaitInPage.for_the(VallmereProductPage.PRODUCT_PRICE).to_appear()
     
     @staticmethod
     def product_description_is_visible():
         """Assert that product description is visible"""
-        return Wait.for_the(VallmereProductPage.PRODUCT_DESCRIPTION).to_appear()
+        return WaitInPage.for_the(VallmereProductPage.PRODUCT_DESCRIPTION).to_appear()
+    
+    @staticmethod
+    def product_information_is_visible():
+        """Assert in one script call that the detail, title, price and description are visible"""
+        information = (
+            VallmereProductPage.PRODUCT_DETAIL,
+            VallmereProductPage.PRODUCT_INFO_TITLE,
+            VallmereProductPage.PRODUCT_PRICE,
+            VallmereProductPage.PRODUCT_DESCRIPTION,
+        )
+        return See.the(PageSnapshot.of(*information).once_visible(), SeeAllOf.visible(*information))
     
     @staticmethod
     def click_add_to_cart():
-        """Click the add to cart button using JavaScript (more reliable with Angular)"""
-        # Custom action that uses JavaScript to click the button
-        # This is more reliable than Selenium's native click for Angular applications
-        class ClickAddToCartWithJS:
-            def perform_as(self, actor):
-                from screenpy_selenium.abilities import BrowseTheWeb
-                browser = actor.ability_to(BrowseTheWeb).browser
-                browser.execute_script("""
-                    const button = document.querySelector('button.add-to-cart');
-                    if (button) {
-                        button.click();
-                    } else {
-                        throw new Error('Add to Cart button not found');
-                    }
-                """)
-        
-        return ClickAddToCartWithJS()
+        """Click the add to cart button"""
+        return WaitAndClick.on(VallmereProductPage.ADD_TO_CART_BUTTON)
     
     @staticmethod
     def success_toast_is_visible():
         """Assert that success toast is visible"""
-        return Wait.for_the(VallmereProductPage.SUCCESS_TOAST).to_appear()
+        return WaitInPage.for_the(VallmereProductPage.SUCCESS_TOAST).to_appear()
     
     @staticmethod
     def cart_badge_is_visible():
         """Assert that cart badge is visible"""
-        return Wait.for_the(VallmereProductPage.CART_BADGE).to_appear()
+        return WaitInPage.for_the(VallmereProductPage.CART_BADGE).to_appear()
     
     @staticmethod
     def error_message_is_visible():
         """Assert that error message is visible (for sold out products)"""
-        return Wait.for_the(VallmereProductPage.ERROR_MESSAGE).to_appear()
+        return WaitInPage.for_the(VallmereProductPage.ERROR_MESSAGE).to_appear()
     
     @staticmethod
     def click_size_guide():
-        """Click on size guide link using JavaScript"""
-        class ClickSizeGuideJS:
-            def perform_as(self, actor):
-                from screenpy_selenium.abilities import BrowseTheWeb
-                browser = actor.ability_to(BrowseTheWeb).browser
-                browser.execute_script("""
-                    const link = Array.from(document.querySelectorAll('a')).find(a => a.textContent.includes('SIZE GUIDE'));
-                    if (link) link.click();
-                """)
-        return ClickSizeGuideJS()
+        """Click on size guide link"""
+        return WaitAndClick.on("a").containing_text("SIZE GUIDE")
     
     @staticmethod
     def click_shipping_policy():
-        """Click on shipping policy link using JavaScript"""
-        class ClickShippingPolicyJS:
-            def perform_as(self, actor):
-                from screenpy_selenium.abilities import BrowseTheWeb
-                browser = actor.ability_to(BrowseTheWeb).browser
-                browser.execute_script("""
-                    const link = Array.from(document.querySelectorAll('a')).find(a => a.textContent.includes('SHIPPING POLICY'));
-                    if (link) link.click();
-                """)
-        return ClickShippingPolicyJS()
+        """Click on shipping policy link"""
+        return WaitAndClick.on("a").containing_text("SHIPPING POLICY")
     
     @staticmethod
     def modal_is_visible():
         """Assert that modal is visible"""
-        return Wait.for_the(VallmereProductPage.MODAL).to_appear()
+        return WaitInPage.for_the(VallmereProductPage.MODAL).to_appear()
     
     @staticmethod
     def modal_title_is(expected_title: str):
@@ -145,14 +130,6 @@ class VallmereProductPage:
     
     @staticmethod
     def close_modal():
-        """Click the modal close button using JavaScript"""
-        class CloseModalJS:
-            def perform_as(self, actor):
-                from screenpy_selenium.abilities import BrowseTheWeb
-                browser = actor.ability_to(BrowseTheWeb).browser
-                browser.execute_script("""
-                    const closeBtn = document.querySelector('.modal-close');
-                    if (closeBtn) closeBtn.click();
-                """)
-        return CloseModalJS()
+        """Click the modal close button"""
+        return WaitAndClick.on(VallmereProductPage.MODAL_CLOSE)
 
@@ -3,12 +3,17 @@ Vallmere Profile Page
 Page Object following ScreenPlay pattern for user profile
 """
 from screenpy import See
-from screenpy_selenium.actions import Click, Enter, Wait
+from screenpy_selenium.actions import Click, Enter
 from screenpy_selenium.questions import Text
 from screenpy_selenium.target import Target
 from screenpy.resolutions import IsEqualTo, ContainsTheText
 from selenium.webdriver.common.by import By
 
+from actions.wait_and_click import WaitAndClick
+from actions.wait_in_page import WaitInPage
+from questions.page_snapshot import PageSnapshot
+from resolutions.see_all_of import SeeAllOf
+
 
 class VallmereProfilePage:
     """Page Object for Vallmere User Profile"""
@@ -39,50 +44,54 @@ class VallmereProfilePage:
     @staticmethod
     def wait_for_profile_container():
         """Wait for profile container to be visible"""
-        return Wait.for_the(VallmereProfilePage.PROFILE_CONTAINER).to_appear()
+        return WaitInPage.for_the(VallmereProfilePage.PROFILE_CONTAINER).to_appear()
     
     @staticmethod
     def profile_container_is_visible():
         """Assert that profile container is visible"""
-        return Wait.for_the(VallmereProfilePage.PROFILE_CONTAINER).to_appear()
+        return WaitInPage.for_the(VallmereProfilePage.PROFILE_CONTAINER).to_appear()
     
     @staticmethod
     def user_name_is_visible():
         """Assert that user name is visible"""
-        return Wait.for_the(VallmereProfilePage.USER_NAME).to_appear()
+        return WaitInPage.for_the(VallmereProfilePage.USER_NAME).to_appear()
     
     @staticmethod
     def email_is_visible():
         """Assert that email is visible"""
-        return Wait.for_the(VallmereProfilePage.EMAIL).to_appear()
+        return WaitInPage.for_the(VallmereProfilePage.EMAIL).to_appear()
+    
+    @staticmethod
+    def user_info_is_shown():
+        """Assert in one script call that name and email are visible and the role badge is rendered
+        
+        The badge is hidden by CSS for clients, so only its presence is checked.
+        """
+        page = VallmereProfilePage
+        return See.the(
+            PageSnapshot.of(page.USER_NAME, page.EMAIL, page.ROLE_BADGE).once_visible(page.USER_NAME, page.EMAIL),
+            SeeAllOf.visible(page.USER_NAME, page.EMAIL).with_count(page.ROLE_BADGE, 1),
+        )
     
     @staticmethod
     def role_badge_is_visible():
         """Assert that role badge is visible"""
-        return Wait.for_the(VallmereProfilePage.ROLE_BADGE).to_appear()
+        return WaitInPage.for_the(VallmereProfilePage.ROLE_BADGE).to_appear()
     
     @staticmethod
     def click_edit_profile():
-        """Click edit profile button using JavaScript"""
-        class ClickEditProfileJS:
-            def perform_as(self, actor):
-                from screenpy_selenium.abilities import BrowseTheWeb
-                browser = actor.ability_to(BrowseTheWeb).browser
-                browser.execute_script("""
-                    const btn = Array.from(document.querySelectorAll('button')).find(b => b.textContent.includes('Edit Profile'));
-                    if (btn) btn.click();
-                """)
-        return ClickEditProfileJS()
+        """Click edit profile button"""
+        return WaitAndClick.on("button").containing_text("Edit Profile")
     
     @staticmethod
     def profile_form_is_visible():
         """Assert that profile form is visible"""
-        return Wait.for_the(VallmereProfilePage.PROFILE_FORM).to_appear()
+        return WaitInPage.for_the(VallmereProfilePage.PROFILE_FORM).to_appear()
     
     @staticmethod
     def name_field_is_visible():
         """Assert that name field is visible"""
-        return Wait.for_the(VallmereProfilePage.NAME_FIELD).to_appear()
+        return WaitInPage.for_the(VallmereProfilePage.NAME_FIELD).to_appear()
     
     @staticmethod
     def enter_name(name: str):
@@ -117,36 +126,20 @@ class VallmereProfilePage:
     @staticmethod
     def success_toast_is_visible():
         """Assert that success toast is visible"""
-        return Wait.for_the(VallmereProfilePage.SUCCESS_TOAST).to_appear()
+        return WaitInPage.for_the(VallmereProfilePage.SUCCESS_TOAST).to_appear()
     
     @staticmethod
     def click_add_address():
-        """Click add address button using JavaScript"""
-        class ClickAddAddressJS:
-            def perform_as(self, actor):
-                from screenpy_selenium.abilities import BrowseTheWeb
-                browser = actor.ability_to(BrowseTheWeb).browser
-                browser.execute_script("""
-                    const btn = Array.from(document.querySelectorAll('button')).find(b => b.textContent.includes('Add Address'));
-                    if (btn) btn.click();
-                """)
-        return ClickAddAddressJS()
+        """Click add address button"""
+        return WaitAndClick.on("button").containing_text("Add Address")
     
     @staticmethod
     def address_form_is_visible():
         """Assert that address form is visible"""
-        return Wait.for_the(VallmereProfilePage.ADDRESS_MODAL).to_appear()
+        return WaitInPage.for_the(VallmereProfilePage.ADDRESS_MODAL).to_appear()
     
     @staticmethod
     def click_logout():
         """Click logout button"""
-        class ClickLogoutJS:
-            def perform_as(self, actor):
-                from screenpy_selenium.abilities import BrowseTheWeb
-                browser = actor.ability_to(BrowseTheWeb).browser
-                browser.execute_script("""
-                    const btn = document.querySelector('.logout-btn');
-                    if (btn) btn.click();
-                """)
-        return ClickLogoutJS()
+        return WaitAndClick.on(VallmereProfilePage.LOGOUT_BTN)
 
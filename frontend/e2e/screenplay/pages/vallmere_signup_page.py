@@ -3,12 +3,13 @@ Vallmere Sign Up Page
 Page Object following ScreenPlay pattern for the signup/registration page
 """
 from screenpy import See
-from screenpy_selenium.actions import Click, Enter, Wait
+from screenpy_selenium.actions import Click, Enter
 from screenpy_selenium.questions import Text
 from screenpy_selenium.target import Target
 from screenpy.resolutions import IsEqualTo, ContainsTheText
 from selenium.webdriver.common.by import By
 
+from actions.wait_in_page import WaitInPage
 from questions.browser_url import BrowserURL
 
 
@@ -55,17 +56,17 @@ class VallmereSignUpPage:
     @staticmethod
     def wait_for_name_field():
         """Wait for the name field to be visible"""
-        return Wait.for_the(VallmereSignUpPage.NAME_FIELD).to_appear()
+        return WaitInPage.for_the(VallmereSignUpPage.NAME_FIELD).to_appear()
     
     @staticmethod
     def wait_for_success_toast():
         """Wait for success toast to appear"""
-        return Wait.for_the(VallmereSignUpPage.SUCCESS_TOAST).to_appear()
+        return WaitInPage.for_the(VallmereSignUpPage.SUCCESS_TOAST).to_appear()
     
     @staticmethod
     def success_toast_is_visible():
         """Assert that success toast is visible"""
-        return Wait.for_the(VallmereSignUpPage.SUCCESS_TOAST).to_appear()
+        return WaitInPage.for_the(VallmereSignUpPage.SUCCESS_TOAST).to_appear()
     
     @staticmethod
     def error_message_contains(text: str):
@@ -0,0 +1,4 @@
+"""
+Vallmere Pytest Plugins
+Support code plugged into pytest from tests/conftest.py
+"""
@@ -0,0 +1,106 @@
+"""
+Browser Logs
+Chrome console messages and, with --browser-network-log, failed XHR/fetch
+requests of a test, read into a bounded ring and added to the report only when
+the test fails
+"""
+import json
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, List, Optional
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+# Only requests made by the app's code explain a failure; documents, scripts and images rarely do
+REQUEST_TYPES = ("XHR", "Fetch")
+
+
+def _clock(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp / 1000).strftime("%H:%M:%S.%f")[:-3]
+
+
+def console_lines(entries) -> List[str]:
+    return [f"{_clock(entry['timestamp'])} {entry['level']:<7} {entry['message']}" for entry in entries]
+
+
+def failed_request_lines(entries) -> List[str]:
+    """XHR/fetch requests that failed or answered with an HTTP error, from performance log entries"""
+    requests: Dict[str, dict] = {}
+    lines = []
+    for entry in entries:
+        message = json.loads(entry["message"])["message"]
+        method, params = message["method"], message.get("params", {})
+        if method == "Network.requestWillBeSent":
+            requests[params["requestId"]] = params["request"]
+        elif method == "Network.responseReceived" and params.get("type") in REQUEST_TYPES:
+            response = params["response"]
+            if response["status"] >= 400:
+                request = requests.get(params["requestId"], {})
+                lines.append(
+                    f"{_clock(entry['timestamp'])} {response['status']} {request.get('method', '')} {response['url']}"
+                )
+        elif method == "Network.loadingFailed" and params.get("type") in REQUEST_TYPES:
+            request = requests.get(params["requestId"], {})
+            reason = "canceled" if params.get("canceled") else params.get("errorText", "failed")
+            url = request.get("url", f"request {params['requestId']}")
+            lines.append(f"{_clock(entry['timestamp'])} {reason} {request.get('method', '')} {url}")
+    return lines
+
+
+class BrowserLogPlugin:
+    """Drains the console (and, opted in, the performance) log of the test's driver when the test fails
+
+    Chromedriver buffers each log until it is read. At the start of each test
+    the buffer is emptied (the entries belong to an earlier test of the pooled
+    browser) and nothing is parsed or stored; for the console that is one
+    local command returning a handful of messages. The performance log holds
+    every network event of the previous test, which is why it is only
+    recorded and drained with network=True (--browser-network-log).
+    """
+
+    def __init__(self, size: int, network: bool = False) -> None:
+        self.size = size
+        self.log_types = ("browser", "performance") if network else ("browser",)
+        self.driver = None
+        # Only the last `size` lines of each kind are kept, however chatty the page is
+        self.ring: Dict[str, Deque[str]] = {}
+
+    def _drain(self, log_type: str) -> List[dict]:
+        try:
+            return self.driver.get_log(log_type)
+        except WebDriverException:
+            # Chrome launched without logging (VALLMERE_BROWSER_LOGS=0)
+            return []
+
+    def start(self, actor, driver) -> None:
+        self.driver = driver
+        self.ring = {name: deque(maxlen=self.size) for name in ("console", "failed requests")}
+        for log_type in self.log_types:
+            self._drain(log_type)
+
+    def finish(self, item, actor) -> None:
+        self.driver = None
+
+    def collect(self) -> Optional[Dict[str, List[str]]]:
+        self.ring["console"].extend(console_lines(self._drain("browser")))
+        if "performance" in self.log_types:
+            self.ring["failed requests"].extend(failed_request_lines(self._drain("performance")))
+        logs = {name: list(lines) for name, lines in self.ring.items()}
+        return logs if any(logs.values()) else None
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        # By teardown the browser has already been reset for the next test
+        if self.driver is None or not report.failed or report.when == "teardown":
+            return
+
+        logs = self.collect()
+        if logs is None:
+            return
+        for name, lines in logs.items():
+            if lines:
+                report.sections.append((f"Browser {name} ({report.when})", "\n".join(lines)))
+        report.user_properties.append(("browser_log", logs))
@@ -0,0 +1,276 @@
+"""
+WebDriver Command Profile
+Number and latency of the WebDriver commands every test sends, broken down by
+command and by the page object method whose action sent them, with the tests
+that send unusually many commands flagged at the end of the run
+"""
+import bisect
+import functools
+import importlib
+import inspect
+import json
+import pkgutil
+import statistics
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from actors.command_recorder import CommandRecorder
+from plugins.workers import is_worker
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# A test is flagged when it sends this many times the run's median number of
+# commands (and at least FLAG_MIN_COMMANDS), or when the same command is sent
+# this many times in a row, which is what a polling loop looks like.
+FLAG_MEDIAN_FACTOR = 3
+FLAG_MIN_COMMANDS = 100
+POLLING_RUN_LENGTH = 20
+# Against a baseline profile, a test is flagged once its commands grow by this factor
+BASELINE_FACTOR = 1.5
+
+UNATTRIBUTED = "(test body and other actions)"
+
+
+def bucket_of(milliseconds: float) -> int:
+    return bisect.bisect_left(LATENCY_BUCKETS_MS, milliseconds)
+
+
+def bucket_label(index: int) -> str:
+    if index < len(LATENCY_BUCKETS_MS):
+        return f"<={LATENCY_BUCKETS_MS[index]}ms"
+    return f">{LATENCY_BUCKETS_MS[-1]}ms"
+
+
+def percentile_bound(histogram: List[int], fraction: float) -> str:
+    """Bucket the given fraction of the commands falls into, read from a histogram"""
+    total = sum(histogram)
+    if not total:
+        return "-"
+    seen = 0
+    for index, count in enumerate(histogram):
+        seen += count
+        if seen >= fraction * total:
+            return bucket_label(index)
+    return bucket_label(len(histogram) - 1)
+
+
+def tag_page_objects(package: str = "pages") -> int:
+    """Make every page object staticmethod label the action it returns with "Page.method"
+
+    Returns the number of methods wrapped. Values that cannot take an attribute
+    (strings, tuples) are returned untouched.
+    """
+    wrapped = 0
+    root = importlib.import_module(package)
+    for module_info in pkgutil.iter_modules(root.__path__):
+        module = importlib.import_module(f"{package}.{module_info.name}")
+        for page in vars(module).values():
+            if not inspect.isclass(page) or page.__module__ != module.__name__:
+                continue
+            for name, member in list(vars(page).items()):
+                if isinstance(member, staticmethod) and not hasattr(member.__func__, "_page_method"):
+                    setattr(page, name, staticmethod(_tagging(member.__func__, f"{page.__name__}.{name}")))
+                    wrapped += 1
+    return wrapped
+
+
+def _tagging(function, label: str):
+    @functools.wraps(function)
+    def tagged(*args, **kwargs):
+        result = function(*args, **kwargs)
+        try:
+            result.page_method = label
+        except (AttributeError, TypeError):
+            pass
+        return result
+
+    tagged._page_method = label
+    return tagged
+
+
+class CommandProfiler:
+    """Attributes each WebDriver command of a test to the innermost page object action that sent it"""
+
+    def __init__(self, recorder: CommandRecorder) -> None:
+        self.recorder = recorder
+        self.calls: Dict[str, int] = defaultdict(int)
+        self._owners: Dict[int, str] = {}
+
+    @contextmanager
+    def step(self, action):
+        label = getattr(action, "page_method", None)
+        if label is None:
+            yield
+            return
+        self.calls[label] += 1
+        first = len(self.recorder.commands)
+        try:
+            yield
+        finally:
+            # Nested page object actions finish first and keep their commands
+            for index in range(first, len(self.recorder.commands)):
+                self._owners.setdefault(index, label)
+
+    def profile(self) -> dict:
+        """Counts, time and latency histograms of the test's commands, ready for JSON"""
+        commands = self.recorder.commands
+        by_command: Dict[str, dict] = {}
+        by_page_method: Dict[str, dict] = {
+            label: {"calls": calls, "commands": 0, "ms": 0.0} for label, calls in self.calls.items()
+        }
+        longest = {"command": None, "count": 0}
+        run_name, run_length = None, 0
+        for index, command in enumerate(commands):
+            milliseconds = command.duration * 1000
+            entry = by_command.setdefault(
+                command.name, {"count": 0, "ms": 0.0, "histogram": [0] * (len(LATENCY_BUCKETS_MS) + 1)}
+            )
+            entry["count"] += 1
+            entry["ms"] += milliseconds
+            entry["histogram"][bucket_of(milliseconds)] += 1
+
+            owner = by_page_method.setdefault(
+                self._owners.get(index, UNATTRIBUTED), {"calls": 0, "commands": 0, "ms": 0.0}
+            )
+            owner["commands"] += 1
+            owner["ms"] += milliseconds
+
+            run_length = run_length + 1 if command.name == run_name else 1
+            run_name = command.name
+            if run_length > longest["count"]:
+                longest = {"command": run_name, "count": run_length}
+
+        for entry in list(by_command.values()) + list(by_page_method.values()):
+            entry["ms"] = round(entry["ms"], 1)
+        return {
+            "commands": len(commands),
+            "ms": round(sum(command.duration for command in commands) * 1000, 1),
+            "longest_repeat": longest,
+            "by_command": by_command,
+            "by_page_method": by_page_method,
+        }
+
+
+class CommandProfilePlugin:
+    """Profiles the WebDriver commands of every test that uses the actor fixture
+
+    Workers profile their tests; each profile travels in the report's
+    user_properties, so the process printing the summary and writing the
+    profile file sees the whole run.
+    """
+
+    def __init__(self, config) -> None:
+        self.path = Path(config.getoption("--profile-commands"))
+        self.max_commands: Optional[int] = config.getoption("--max-commands-per-test")
+        baseline = config.getoption("--command-baseline")
+        self.baseline: Dict[str, int] = {}
+        if baseline and Path(baseline).exists():
+            tests = json.loads(Path(baseline).read_text(encoding="utf-8"))["tests"]
+            self.baseline = {nodeid: test["commands"] for nodeid, test in tests.items()}
+        self.writes_file = not is_worker(config)
+        self.profiler: Optional[CommandProfiler] = None
+        self.tests: Dict[str, dict] = {}
+        tag_page_objects()
+
+    def start(self, actor, driver) -> None:
+        recorder = CommandRecorder.of(driver)
+        recorder.clear()
+        self.profiler = CommandProfiler(recorder)
+        actor.observe_with(self.profiler)
+
+    def finish(self, item, actor) -> None:
+        profiler, self.profiler = self.profiler, None
+        actor.stop_observing(profiler)
+        item.user_properties.append(("webdriver_profile", profiler.profile()))
+
+    def pytest_runtest_logreport(self, report):
+        for name, profile in report.user_properties:
+            if name == "webdriver_profile":
+                self.tests[report.nodeid] = profile
+
+    def flagged(self) -> Dict[str, List[str]]:
+        """Reasons each suspicious test was flagged for, by nodeid"""
+        if not self.tests:
+            return {}
+        median = statistics.median(test["commands"] for test in self.tests.values())
+        reasons: Dict[str, List[str]] = defaultdict(list)
+        for nodeid, test in self.tests.items():
+            count = test["commands"]
+            if self.max_commands is not None and count > self.max_commands:
+                reasons[nodeid].append(f"more than {self.max_commands} commands")
+            # A median of 0 (most tests send no commands) gives no ratio to compare with
+            if median and count >= FLAG_MIN_COMMANDS and count > FLAG_MEDIAN_FACTOR * median:
+                reasons[nodeid].append(f"{count / median:.1f}x the median of {median:g}")
+            if test["longest_repeat"]["count"] >= POLLING_RUN_LENGTH:
+                repeat = test["longest_repeat"]
+                reasons[nodeid].append(f"{repeat['command']} sent {repeat['count']} times in a row (polling?)")
+            previous = self.baseline.get(nodeid)
+            if previous and count >= BASELINE_FACTOR * previous:
+                reasons[nodeid].append(f"{previous} -> {count} commands since the baseline")
+        return reasons
+
+    def totals(self) -> dict:
+        by_command: Dict[str, dict] = {}
+        by_page_method: Dict[str, dict] = {}
+        for test in self.tests.values():
+            for name, entry in test["by_command"].items():
+                total = by_command.setdefault(
+                    name, {"count": 0, "ms": 0.0, "histogram": [0] * (len(LATENCY_BUCKETS_MS) + 1)}
+                )
+                total["count"] += entry["count"]
+                total["ms"] += entry["ms"]
+                total["histogram"] = [a + b for a, b in zip(total["histogram"], entry["histogram"])]
+            for label, entry in test["by_page_method"].items():
+                total = by_page_method.setdefault(label, {"calls": 0, "commands": 0, "ms": 0.0})
+                for key in total:
+                    total[key] += entry[key]
+        for total in list(by_command.values()) + list(by_page_method.values()):
+            total["ms"] = round(total["ms"], 1)
+        return {"by_command": by_command, "by_page_method": by_page_method}
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.tests:
+            return
+        totals = self.totals()
+        write = terminalreporter.write_line
+        count = sum(test["commands"] for test in self.tests.values())
+        terminalreporter.section(f"webdriver commands: {count} in {len(self.tests)} tests")
+        for name, entry in sorted(totals["by_command"].items(), key=lambda item: item[1]["count"], reverse=True):
+            write(
+                f"{entry['count']:7d} x  {entry['ms']:10.1f} ms  p50 {percentile_bound(entry['histogram'], 0.5):>9}  "
+                f"p95 {percentile_bound(entry['histogram'], 0.95):>9}  {name}"
+            )
+        write("")
+        write("page object methods by commands per call:")
+        methods = [(label, entry) for label, entry in totals["by_page_method"].items() if entry["calls"]]
+        for label, entry in sorted(methods, key=lambda item: item[1]["commands"] / item[1]["calls"], reverse=True)[:15]:
+            write(
+                f"{entry['commands'] / entry['calls']:7.1f} cmd/call  {entry['calls']:5d} calls  "
+                f"{entry['ms']:10.1f} ms  {label}"
+            )
+        unattributed = totals["by_page_method"].get(UNATTRIBUTED)
+        if unattributed:
+            write(f"{unattributed['commands']:7d} commands outside page object actions")
+        flagged = self.flagged()
+        if flagged:
+            write("")
+            write("tests with unusually many commands:", yellow=True)
+            for nodeid, reasons in flagged.items():
+                write(f"  {self.tests[nodeid]['commands']:6d}  {nodeid}: {'; '.join(reasons)}", yellow=True)
+        if self.writes_file:
+            write(f"Command profile: {self.path}")
+
+    def pytest_sessionfinish(self, session):
+        if not self.writes_file or not self.tests:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        profile = {
+            "buckets_ms": list(LATENCY_BUCKETS_MS),
+            "tests": self.tests,
+            "flagged": self.flagged(),
+            **self.totals(),
+        }
+        self.path.write_text(json.dumps(profile, indent=2), encoding="utf-8")
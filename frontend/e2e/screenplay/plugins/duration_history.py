@@ -0,0 +1,238 @@
+"""
+Duration History
+Per-test durations and top-level actor step timings kept in a local SQLite
+history, and a gate that warns about or fails on tests that got slower than
+their rolling baseline
+"""
+import sqlite3
+import statistics
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pytest
+from screenpy.speech_tools import get_additive_description
+
+from actors.command_recorder import CommandRecorder
+from plugins.workers import is_worker
+
+GATE_MODES = ("warn", "fail")
+
+# Baselines need this many earlier passing runs of the test (or step)
+MIN_SAMPLES = 5
+# Slowdowns smaller than this are noise for a browser test, whatever the percentage
+MIN_DELTA_SECONDS = 1.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tests (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tests_by_nodeid ON tests (nodeid, outcome, run_id);
+CREATE TABLE IF NOT EXISTS steps (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    step TEXT NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS steps_by_nodeid ON steps (nodeid, step, run_id);
+"""
+
+
+class Baseline:
+    """Median and 90th percentile of the last passing runs"""
+
+    def __init__(self, durations: List[float]) -> None:
+        self.samples = len(durations)
+        self.p50 = statistics.median(durations)
+        self.p90 = statistics.quantiles(durations, n=10, method="inclusive")[8]
+
+    def regressed(self, duration: float, tolerance: float) -> bool:
+        return duration > self.p90 * (1 + tolerance) and duration - self.p50 > MIN_DELTA_SECONDS
+
+
+class DurationHistory:
+    """SQLite store of test and step durations, one row set per run"""
+
+    def __init__(self, path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.path))
+        self.connection.executescript(SCHEMA)
+
+    def baseline_of(self, nodeid: str, window: int, step: Optional[str] = None) -> Optional[Baseline]:
+        if step is None:
+            query = "SELECT duration FROM tests WHERE nodeid = ? AND outcome = 'passed' ORDER BY run_id DESC LIMIT ?"
+            parameters = (nodeid, window)
+        else:
+            # Steps only count from runs in which the whole test passed
+            query = (
+                "SELECT steps.duration FROM steps JOIN tests USING (run_id, nodeid) "
+                "WHERE steps.nodeid = ? AND steps.step = ? AND tests.outcome = 'passed' "
+                "ORDER BY steps.run_id DESC LIMIT ?"
+            )
+            parameters = (nodeid, step, window)
+        durations = [row[0] for row in self.connection.execute(query, parameters)]
+        return Baseline(durations) if len(durations) >= MIN_SAMPLES else None
+
+    def typical_durations(self, window: int) -> Dict[str, float]:
+        """Median call duration of every test over its last `window` passing runs"""
+        durations: Dict[str, List[float]] = {}
+        rows = self.connection.execute(
+            "SELECT nodeid, duration FROM tests WHERE outcome = 'passed' ORDER BY run_id DESC"
+        )
+        for nodeid, duration in rows:
+            samples = durations.setdefault(nodeid, [])
+            if len(samples) < window:
+                samples.append(duration)
+        return {nodeid: statistics.median(samples) for nodeid, samples in durations.items()}
+
+    def record(self, results: Dict[str, dict]) -> int:
+        """Store one run; returns its id"""
+        with self.connection:
+            run_id = self.connection.execute("INSERT INTO runs (started_at) VALUES (?)", (time.time(),)).lastrowid
+            self.connection.executemany(
+                "INSERT INTO tests (run_id, nodeid, outcome, duration) VALUES (?, ?, ?, ?)",
+                [(run_id, nodeid, result["outcome"], result["duration"]) for nodeid, result in results.items()],
+            )
+            self.connection.executemany(
+                "INSERT INTO steps (run_id, nodeid, position, step, duration) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (run_id, nodeid, position, step, duration)
+                    for nodeid, result in results.items()
+                    for position, (step, duration) in enumerate(result["steps"])
+                ],
+            )
+        return run_id
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+class StepTimer:
+    """Times the steps an actor performs directly in the test (nested steps are part of their parent)
+
+    With a CommandRecorder, time spent in its unrecorded probes is left out.
+    """
+
+    def __init__(self, recorder: Optional[CommandRecorder] = None) -> None:
+        self.recorder = recorder
+        self.steps: List[tuple] = []
+        self._depth = 0
+
+    def excluded_seconds(self) -> float:
+        return self.recorder.excluded_seconds if self.recorder is not None else 0.0
+
+    @contextmanager
+    def step(self, action):
+        self._depth += 1
+        started = time.perf_counter()
+        excluded = self.excluded_seconds()
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                duration = time.perf_counter() - started - (self.excluded_seconds() - excluded)
+                self.steps.append((get_additive_description(action), duration))
+
+
+class DurationHistoryPlugin:
+    """Compares each test's call duration and step timings with its history, then records the run
+
+    Workers time the steps; the controller (or a serial run) owns the database,
+    so it is written once per run even under xdist.
+    """
+
+    def __init__(self, config) -> None:
+        self.path = config.getoption("--duration-history")
+        self.window = config.getoption("--duration-window")
+        self.tolerance = config.getoption("--duration-tolerance")
+        self.gate = config.getoption("--duration-gate")
+        self.owns_history = not is_worker(config)
+        self.timer: Optional[StepTimer] = None
+        self._excluded_at_start = 0.0
+        self.results: Dict[str, dict] = {}
+        self.regressions: List[str] = []
+        self.slower_steps: List[str] = []
+
+    def start(self, actor, driver) -> None:
+        self.timer = StepTimer(CommandRecorder.of(driver))
+        self._excluded_at_start = self.timer.excluded_seconds()
+        actor.observe_with(self.timer)
+
+    def finish(self, item, actor) -> None:
+        timer, self.timer = self.timer, None
+        actor.stop_observing(timer)
+        item.user_properties.append(("step_timings", timer.steps))
+        item.user_properties.append(("excluded_seconds", timer.excluded_seconds() - self._excluded_at_start))
+
+    def pytest_runtest_logreport(self, report):
+        result = self.results.setdefault(report.nodeid, {"outcome": "passed", "duration": 0.0, "steps": []})
+        if report.when == "call":
+            result["duration"] = report.duration
+        if report.failed:
+            result["outcome"] = "failed"
+        elif report.skipped:
+            result["outcome"] = "skipped"
+        for name, value in report.user_properties:
+            if name == "step_timings":
+                result["steps"] = [tuple(step) for step in value]
+            elif name == "excluded_seconds" and report.when == "teardown":
+                # Page-metrics probes ran during the call but are not the test's time
+                result["duration"] = max(0.0, result["duration"] - value)
+
+    def _compare(self, history: DurationHistory) -> None:
+        for nodeid, result in self.results.items():
+            if result["outcome"] != "passed":
+                continue
+            baseline = history.baseline_of(nodeid, self.window)
+            if baseline and baseline.regressed(result["duration"], self.tolerance):
+                self.regressions.append(
+                    f"{nodeid}: {result['duration']:.2f} s vs p50 {baseline.p50:.2f} s / "
+                    f"p90 {baseline.p90:.2f} s over {baseline.samples} runs"
+                )
+            for step, duration in result["steps"]:
+                step_baseline = history.baseline_of(nodeid, self.window, step)
+                if step_baseline and step_baseline.regressed(duration, self.tolerance):
+                    self.slower_steps.append(
+                        f"{nodeid}: {step} {duration:.2f} s vs p90 {step_baseline.p90:.2f} s"
+                    )
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionfinish(self, session):
+        if not self.owns_history or not self.results:
+            return
+        history = DurationHistory(self.path)
+        try:
+            self._compare(history)
+            history.record(self.results)
+        finally:
+            history.close()
+        if self.regressions and self.gate == "fail" and session.exitstatus == pytest.ExitCode.OK:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.owns_history or not self.results:
+            return
+        if not self.regressions and not self.slower_steps:
+            terminalreporter.write_line(f"Durations recorded in {self.path}; no test slower than its baseline")
+            return
+        failing = self.gate == "fail" and self.regressions
+        terminalreporter.section("duration regressions", red=bool(failing), yellow=not failing)
+        for line in self.regressions:
+            terminalreporter.write_line(line, red=bool(failing), yellow=not failing)
+        if self.slower_steps:
+            terminalreporter.write_line("slower steps:")
+            for line in self.slower_steps:
+                terminalreporter.write_line(f"  {line}")
+        if failing:
+            terminalreporter.write_line(f"--duration-gate=fail: {len(self.regressions)} test(s) got slower", red=True)
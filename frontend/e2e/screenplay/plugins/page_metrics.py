@@ -0,0 +1,123 @@
+"""
+Page Load Metrics
+Navigation Timing, FCP, LCP, CLS and transferred bytes of every page the
+suite loads, collected right after each Open.browser_on / browser.get and
+written to one JSONL file per run
+"""
+import json
+import re
+import statistics
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from actors.command_recorder import CommandRecorder
+from plugins.workers import is_worker
+from questions.page_load_metrics import PageLoadMetrics
+
+# WebDriver command sent by browser.get (and so by Open.browser_on / Visit)
+NAVIGATE_COMMAND = "get"
+
+SUMMARY_METRICS = ("ttfb_ms", "fcp_ms", "lcp_ms", "load_ms")
+
+
+def route_of(path: str) -> str:
+    """Group /product/5 and /product/7 under /product/:id"""
+    return re.sub(r"/\d+(?=/|$)", "/:id", path) or "/"
+
+
+class PageMetricsCollector:
+    """Measures the page after every navigation command a driver sends during one test"""
+
+    def __init__(self, driver, settle_ms: int) -> None:
+        self.driver = driver
+        self.recorder = CommandRecorder.of(driver)
+        self.settle_ms = settle_ms
+        self.pages: List[dict] = []
+
+    def __call__(self, command: str, params: dict) -> None:
+        if command != NAVIGATE_COMMAND:
+            return
+        try:
+            # The probe (up to settle_ms) is the suite's, not the test's: keep it out of
+            # the step trace, the command profile and the duration history
+            with self.recorder.unrecorded():
+                metrics = PageLoadMetrics.read(self.driver, self.settle_ms)
+        except Exception as e:
+            print(f"Error al medir la carga de {params.get('url')}: {e}")
+            return
+        metrics["requested_url"] = params.get("url")
+        metrics["route"] = route_of(metrics["path"])
+        self.pages.append(metrics)
+
+
+class PageMetricsPlugin:
+    """Collects page load metrics for the tests that use the actor fixture
+
+    Workers measure; the metrics travel in the reports' user_properties, and the
+    process that sees every report writes them to the per-run file and prints
+    the median per route.
+    """
+
+    def __init__(self, config) -> None:
+        self.path = Path(config.getoption("--page-metrics"))
+        self.settle_ms = config.getoption("--page-metrics-settle")
+        self.writes_file = not is_worker(config)
+        self.collector: Optional[PageMetricsCollector] = None
+        self.pages: List[dict] = []
+
+    def start(self, actor, driver) -> None:
+        self.collector = PageMetricsCollector(driver, self.settle_ms)
+        # Without the step trace or the command profile nobody else clears the
+        # pooled driver's recorder between tests
+        self.collector.recorder.clear()
+        self.collector.recorder.add_listener(self.collector)
+
+    def finish(self, item, actor) -> None:
+        collector, self.collector = self.collector, None
+        collector.recorder.remove_listener(collector)
+        item.user_properties.append(("page_metrics", collector.pages))
+
+    def pytest_runtest_logreport(self, report):
+        for name, pages in report.user_properties:
+            if name == "page_metrics":
+                self.pages += [dict(page, nodeid=report.nodeid) for page in pages]
+
+    def by_route(self) -> Dict[str, Dict[str, Optional[float]]]:
+        routes: Dict[str, List[dict]] = {}
+        for page in self.pages:
+            routes.setdefault(page["route"], []).append(page)
+        summary = {}
+        for route, pages in sorted(routes.items()):
+            summary[route] = {"loads": len(pages), "max_cls": max(page["cls"] for page in pages)}
+            for metric in SUMMARY_METRICS + ("transfer_bytes",):
+                values = [page[metric] for page in pages if page[metric] is not None]
+                summary[route][metric] = statistics.median(values) if values else None
+        return summary
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.pages:
+            return
+        terminalreporter.section(f"page load metrics: {len(self.pages)} loads (medians)")
+        terminalreporter.write_line(
+            f"{'route':<24}{'loads':>6}{'ttfb':>9}{'fcp':>9}{'lcp':>9}{'load':>9}{'cls max':>9}{'KB':>9}"
+        )
+
+        def cell(value) -> str:
+            return f"{value:9.0f}" if value is not None else f"{'-':>9}"
+
+        for route, metrics in self.by_route().items():
+            kilobytes = metrics["transfer_bytes"] / 1024 if metrics["transfer_bytes"] is not None else None
+            terminalreporter.write_line(
+                f"{route:<24}{metrics['loads']:>6}" + "".join(cell(metrics[m]) for m in SUMMARY_METRICS)
+                + f"{metrics['max_cls']:9.3f}" + cell(kilobytes)
+            )
+        if self.writes_file:
+            terminalreporter.write_line(f"Page metrics per load: {self.path}")
+
+    def pytest_sessionfinish(self, session):
+        if not self.writes_file:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as stream:
+            for page in self.pages:
+                stream.write(json.dumps(page) + "\n")
@@ -0,0 +1,213 @@
+"""
+Streaming Report
+Test results appended to a JSONL file as each test finishes, and a static HTML
+viewer rendered from it line by line
+
+Shards of a run (or runs on several machines) can be merged and rendered from
+the command line:
+
+    python -m plugins.report_stream merge results.jsonl shard-1.jsonl shard-2.jsonl
+    python -m plugins.report_stream render results.html results.jsonl
+"""
+import argparse
+import html
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator
+
+from plugins.screenshots import thumbnail_path
+from plugins.workers import is_worker
+
+VIEWER_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>%(title)s</title>
+<style>
+body { font-family: sans-serif; margin: 1.5rem; color: #222; }
+#summary span { margin-right: 1rem; font-weight: bold; }
+#filters { margin: 1rem 0; }
+table { border-collapse: collapse; width: 100%%; }
+td, th { border-bottom: 1px solid #ddd; padding: 0.4rem; text-align: left; vertical-align: top; }
+tr.passed td.outcome { color: #2e7d32; }
+tr.failed td.outcome, tr.error td.outcome { color: #c62828; }
+tr.skipped td.outcome { color: #9e9e9e; }
+pre { white-space: pre-wrap; font-size: 0.8rem; max-height: 30rem; overflow: auto; }
+img { max-width: 320px; border: 1px solid #ccc; margin: 0.25rem 0.5rem 0 0; }
+</style>
+</head>
+<body>
+<h1>%(title)s</h1>
+<div id="summary"></div>
+<div id="filters">
+<input id="search" type="search" placeholder="Filter tests">
+<label><input type="checkbox" id="only-failures"> Only failures</label>
+</div>
+<table>
+<thead><tr><th>Result</th><th>Test</th><th>Duration</th><th>Worker</th><th>Details</th></tr></thead>
+<tbody>
+"""
+
+# Rows show lazy-loaded thumbnails that link to the full screenshot; a
+# screenshot without a thumbnail (Pillow missing) falls back to the image.
+VIEWER_TAIL = """</tbody>
+</table>
+<script>
+const counts = %(counts)s;
+document.getElementById('summary').innerHTML = Object.entries(counts)
+    .map(([outcome, count]) => '<span class="' + outcome + '">' + count + ' ' + outcome + '</span>').join('');
+const rows = Array.from(document.querySelectorAll('tbody tr'));
+function filter() {
+    const text = document.getElementById('search').value.toLowerCase();
+    const onlyFailures = document.getElementById('only-failures').checked;
+    rows.forEach(row => {
+        const failure = row.classList.contains('failed') || row.classList.contains('error');
+        row.hidden = (onlyFailures && !failure) || !row.dataset.nodeid.toLowerCase().includes(text);
+    });
+}
+document.getElementById('search').addEventListener('input', filter);
+document.getElementById('only-failures').addEventListener('change', filter);
+</script>
+</body>
+</html>
+"""
+
+
+def read_results(paths: Iterable) -> Iterator[dict]:
+    """Yield the results of one or more JSONL files, one line at a time"""
+    for path in paths:
+        with open(path, encoding="utf-8") as stream:
+            for line in stream:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def merge(output, inputs: Iterable) -> int:
+    """Concatenate JSONL result files without loading them; returns the number of results"""
+    written = 0
+    with open(output, "w", encoding="utf-8") as stream:
+        for result in read_results(inputs):
+            stream.write(json.dumps(result) + "\n")
+            written += 1
+    return written
+
+
+def _relative(path, viewer_dir: Path) -> str:
+    return html.escape(Path(os.path.relpath(os.path.abspath(path), viewer_dir)).as_posix())
+
+
+def _row(result: dict, viewer_dir: Path) -> str:
+    details = []
+    if result.get("longrepr"):
+        details.append(f"<pre>{html.escape(result['longrepr'])}</pre>")
+    for name, lines in result.get("browser_log", {}).items():
+        if lines:
+            text = html.escape("\n".join(lines))
+            details.append(f"<h4>Browser {html.escape(name)}</h4><pre>{text}</pre>")
+    thumbnails = []
+    for screenshot in result.get("screenshots", []):
+        link = _relative(screenshot, viewer_dir)
+        thumb = _relative(thumbnail_path(screenshot), viewer_dir)
+        thumbnails.append(
+            f'<a href="{link}" target="_blank"><img loading="lazy" src="{thumb}" alt="screenshot" '
+            f"onerror=\"this.onerror=null;this.src='{link}'\"></a>"
+        )
+    cell = "".join(thumbnails)
+    if details:
+        cell += f"<details><summary>show</summary>{''.join(details)}</details>"
+    nodeid = html.escape(result["nodeid"])
+    return (
+        f'<tr class="{result["outcome"]}" data-nodeid="{nodeid}">'
+        f'<td class="outcome">{result["outcome"]}</td><td>{nodeid}</td>'
+        f'<td>{result["duration"]:.2f} s</td><td>{html.escape(result.get("worker") or "")}</td>'
+        f"<td>{cell}</td></tr>\n"
+    )
+
+
+def render(inputs: Iterable, output, title: str = "Vallmere E2E Results") -> Dict[str, int]:
+    """Write the HTML viewer for the given JSONL files, streaming row by row"""
+    output = Path(output)
+    viewer_dir = output.resolve().parent
+    counts: Dict[str, int] = {}
+    with open(output, "w", encoding="utf-8") as stream:
+        stream.write(VIEWER_HEAD % {"title": html.escape(title)})
+        for result in read_results(inputs):
+            counts[result["outcome"]] = counts.get(result["outcome"], 0) + 1
+            stream.write(_row(result, viewer_dir))
+        stream.write(VIEWER_TAIL % {"counts": json.dumps(counts)})
+    return counts
+
+
+class ReportStreamPlugin:
+    """Appends one JSON line per finished test and renders the viewer at the end of the session
+
+    Under xdist the controller receives every worker's reports, so the
+    results of all workers end up in the same stream as they finish.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._stream = open(self.path, "w", encoding="utf-8")
+        # Only tests that are still running are kept in memory
+        self._running: Dict[str, dict] = {}
+
+    def pytest_runtest_logreport(self, report):
+        result = self._running.setdefault(
+            report.nodeid, {"nodeid": report.nodeid, "outcome": None, "duration": 0.0, "screenshots": []}
+        )
+        result["duration"] += report.duration
+        if report.failed and result["outcome"] not in ("failed", "error"):
+            result["outcome"] = "failed" if report.when == "call" else "error"
+            result["longrepr"] = report.longreprtext
+        elif report.skipped and result["outcome"] is None:
+            result["outcome"] = "skipped"
+        result["screenshots"] += [value for name, value in report.user_properties if name == "screenshot"]
+        for name, logs in report.user_properties:
+            if name == "browser_log":
+                result["browser_log"] = logs
+        node = getattr(report, "node", None)
+        if node is not None:
+            result["worker"] = node.gateway.id
+
+        if report.when == "teardown":
+            result = self._running.pop(report.nodeid)
+            result["outcome"] = result["outcome"] or "passed"
+            result["finished_at"] = time.time()
+            self._stream.write(json.dumps(result) + "\n")
+            self._stream.flush()
+
+    def pytest_sessionfinish(self, session):
+        self._stream.close()
+        render([self.path], self.path.with_suffix(".html"))
+
+
+def register(config) -> None:
+    """Register the plugin in the process that sees every report (never inside an xdist worker)"""
+    path = config.getoption("--report-jsonl")
+    if path and not is_worker(config):
+        config.pluginmanager.register(ReportStreamPlugin(path), "vallmere-report-stream")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    merge_command = commands.add_parser("merge", help="Concatenate JSONL results from workers or shards")
+    merge_command.add_argument("output")
+    merge_command.add_argument("inputs", nargs="+")
+    render_command = commands.add_parser("render", help="Render the HTML viewer for JSONL results")
+    render_command.add_argument("output")
+    render_command.add_argument("inputs", nargs="+")
+    args = parser.parse_args(argv)
+
+    if args.command == "merge":
+        print(f"{merge(args.output, args.inputs)} results written to {args.output}")
+    else:
+        counts = render(args.inputs, args.output)
+        print(f"{args.output}: " + ", ".join(f"{count} {outcome}" for outcome, count in counts.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Duration Scheduler
+xdist scheduling that hands out tests longest-first so every worker finishes
+at about the same time (LPT bin packing), using the durations recorded by
+--duration-history and estimates from the test source for the rest
+"""
+import ast
+import heapq
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from xdist.scheduler import LoadScheduling
+
+from plugins.duration_history import DurationHistory
+
+# Estimate for a test without history: a fixed cost for the actor fixture,
+# plus its sleeps, plus a cost per navigation and per page object step
+ESTIMATE_BASE_SECONDS = 2.0
+ESTIMATE_NAVIGATION_SECONDS = 1.5
+ESTIMATE_STEP_SECONDS = 0.5
+NAVIGATION_CALLS = ("get", "browser_on", "refresh")
+# Share of the tests, the shortest ones, kept in xdist's queue instead of the
+# up-front LPT bins, to absorb estimate errors and a crashed worker's tests
+TAIL_SHARE = 0.2
+
+
+def _called_name(call: ast.Call) -> Optional[str]:
+    if isinstance(call.func, ast.Attribute):
+        return call.func.attr
+    if isinstance(call.func, ast.Name):
+        return call.func.id
+    return None
+
+
+def estimate_from_source(function: ast.FunctionDef) -> float:
+    """Seconds a test is expected to take, from its sleeps, navigations and page object calls"""
+    seconds = ESTIMATE_BASE_SECONDS
+    for node in ast.walk(function):
+        if not isinstance(node, ast.Call):
+            continue
+        name = _called_name(node)
+        if name == "sleep" and node.args and isinstance(node.args[0], ast.Constant):
+            seconds += float(node.args[0].value)
+        elif name in NAVIGATION_CALLS:
+            seconds += ESTIMATE_NAVIGATION_SECONDS
+        elif isinstance(node.func, ast.Attribute) and getattr(node.func.value, "id", "").startswith("Vallmere"):
+            seconds += ESTIMATE_STEP_SECONDS
+    return seconds
+
+
+class DurationEstimator:
+    """Expected duration per nodeid: recorded history first, source estimates otherwise"""
+
+    def __init__(self, rootdir, history_path=None, window: int = 20) -> None:
+        self.rootdir = Path(rootdir)
+        self.recorded: Dict[str, float] = {}
+        if history_path and Path(history_path).exists():
+            history = DurationHistory(history_path)
+            try:
+                self.recorded = history.typical_durations(window)
+            finally:
+                history.close()
+        self._functions: Dict[str, Dict[str, ast.FunctionDef]] = {}
+        self.estimated = 0
+
+    def _functions_in(self, path: str) -> Dict[str, ast.FunctionDef]:
+        if path not in self._functions:
+            try:
+                tree = ast.parse((self.rootdir / path).read_text(encoding="utf-8"))
+            except (OSError, SyntaxError):
+                tree = ast.Module(body=[], type_ignores=[])
+            self._functions[path] = {
+                node.name: node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)
+            }
+        return self._functions[path]
+
+    def duration_of(self, nodeid: str) -> float:
+        if nodeid in self.recorded:
+            return self.recorded[nodeid]
+        self.estimated += 1
+        path, _, name = nodeid.partition("::")
+        function = self._functions_in(path).get(re.sub(r"\[.*\]$", "", name.split("::")[-1]))
+        return estimate_from_source(function) if function is not None else ESTIMATE_BASE_SECONDS
+
+
+def lpt_assign(durations: List[float], workers: int) -> List[List[int]]:
+    """Longest processing time first: each test goes to the worker with the least work so far"""
+    bins: List[List[int]] = [[] for _ in range(workers)]
+    loads = [(0.0, worker) for worker in range(workers)]
+    for index in sorted(range(len(durations)), key=lambda i: durations[i], reverse=True):
+        load, worker = heapq.heappop(loads)
+        bins[worker].append(index)
+        heapq.heappush(loads, (load + durations[index], worker))
+    return bins
+
+
+class DurationScheduling(LoadScheduling):
+    """LoadScheduling whose initial distribution is an LPT plan over the expected durations
+
+    The longest tests are sent up front in LPT bins. The shortest TAIL_SHARE
+    of them stay in LoadScheduling's queue (`pending`), longest first, and the
+    workers stay up: each one takes tail tests as it runs low, which evens out
+    wrong estimates, and if a worker crashes LoadScheduling puts its unfinished
+    tests back in the queue for the others. Workers shut down once the queue is empty.
+    """
+
+    def __init__(self, config, log=None) -> None:
+        super().__init__(config, log)
+        self.estimator = DurationEstimator(
+            config.rootpath,
+            config.getoption("--duration-history"),
+            config.getoption("--duration-window"),
+        )
+
+    def schedule(self) -> None:
+        assert self.collection_is_completed
+        if self.collection is not None:
+            super().schedule()
+            return
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        if not self.collection:
+            return
+        if self.maxschedchunk is None:
+            self.maxschedchunk = len(self.collection)
+        durations = [self.estimator.duration_of(nodeid) for nodeid in self.collection]
+        longest_first = sorted(range(len(durations)), key=lambda index: durations[index], reverse=True)
+        # Too few tests to hold any back: every worker needs at least two to keep going
+        held_back = int(len(durations) * TAIL_SHARE) if len(durations) >= 2 * len(self.nodes) else 0
+        head = longest_first[: len(durations) - held_back]
+        self.pending[:] = longest_first[len(head):]
+        bins = [[head[i] for i in indices] for indices in lpt_assign([durations[i] for i in head], len(self.nodes))]
+        for node, indices in zip(self.nodes, bins):
+            if indices:
+                self.node2pending[node].extend(indices)
+                node.send_runtest_some(indices)
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+        self._report_plan(durations, bins)
+
+    def _report_plan(self, durations: List[float], bins: List[List[int]]) -> None:
+        terminal = self.config.pluginmanager.get_plugin("terminalreporter")
+        if terminal is None:
+            return
+        loads = [sum(durations[index] for index in indices) for indices in bins]
+        terminal.write_line(
+            f"duration scheduling: {len(durations)} tests ({self.estimator.estimated} estimated), "
+            f"expected per worker: {', '.join(f'{load:.1f}s' for load in loads)}, "
+            f"{len(self.pending)} short tests handed out as workers run low"
+        )
+
+
+class DurationSchedulerPlugin:
+    """Makes xdist use DurationScheduling for --dist load runs"""
+
+    def pytest_xdist_make_scheduler(self, config, log):
+        if config.getoption("dist") == "load":
+            return DurationScheduling(config, log)
+        return None
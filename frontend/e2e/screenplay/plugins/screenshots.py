@@ -0,0 +1,156 @@
+"""
+Screenshot Store
+Failure screenshots, encoded off the test's critical path and stored once per
+distinct image under the hash of its content
+"""
+import hashlib
+import io
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from threading import Lock
+from typing import Dict
+
+import pytest
+from screenpy_selenium.abilities import BrowseTheWeb
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional: without it screenshots are kept as PNG
+    Image = None
+
+CAPTURE_MODES = ("failed", "all", "none")
+IMAGE_FORMATS = {"jpeg": ("JPEG", "jpg"), "webp": ("WEBP", "webp"), "png": ("PNG", "png")}
+# Thumbnails shown in the streaming report's rows, linking to the full screenshot
+THUMBNAIL_WIDTH = 320
+THUMBNAIL_QUALITY = 70
+
+
+def encode(png: bytes, image_format: str, quality: int) -> bytes:
+    """Re-encode a PNG screenshot in the configured format"""
+    pil_format, _ = IMAGE_FORMATS[image_format]
+    if pil_format == "PNG":
+        return png
+    with Image.open(io.BytesIO(png)) as image:
+        output = io.BytesIO()
+        image.convert("RGB").save(output, pil_format, quality=quality)
+        return output.getvalue()
+
+
+def thumbnail_path(path) -> Path:
+    """Where the thumbnail of a stored screenshot is written"""
+    path = Path(path)
+    return path.with_name(f"{path.stem}.thumb.jpg")
+
+
+def thumbnail(png: bytes, width: int = THUMBNAIL_WIDTH) -> bytes:
+    """A small JPEG of a PNG screenshot, at most `width` pixels wide"""
+    with Image.open(io.BytesIO(png)) as image:
+        image = image.convert("RGB")
+        image.thumbnail((width, width * 4))
+        output = io.BytesIO()
+        image.save(output, "JPEG", quality=THUMBNAIL_QUALITY)
+        return output.getvalue()
+
+
+class ScreenshotStore:
+    """Content-addressed screenshot files written by a background thread pool
+
+    The file name is the hash of the PNG the browser returned, so it is known
+    as soon as the screenshot is taken and identical screenshots (also from
+    other xdist workers sharing the directory) are only encoded and written once.
+    """
+
+    def __init__(self, directory, image_format: str = "jpeg", quality: int = 80, workers: int = 2):
+        if Image is None:
+            image_format = "png"
+        self.directory = Path(directory)
+        self.image_format = image_format
+        self.quality = quality
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="screenshots")
+        self._pending: Dict[Path, Future] = {}
+        self._lock = Lock()
+
+    def path_for(self, png: bytes) -> Path:
+        digest = hashlib.sha256(png).hexdigest()[:32]
+        return self.directory / f"{digest}.{IMAGE_FORMATS[self.image_format][1]}"
+
+    def save(self, png: bytes) -> Path:
+        """Queue the screenshot for encoding and return the path it will have"""
+        path = self.path_for(png)
+        with self._lock:
+            if path in self._pending or path.exists():
+                return path
+            self._pending[path] = self._executor.submit(self._write, png, path)
+        return path
+
+    def _write(self, png: bytes, path: Path) -> None:
+        files = [(path, encode(png, self.image_format, self.quality))]
+        if Image is not None:
+            files.insert(0, (thumbnail_path(path), thumbnail(png)))
+        # The thumbnail goes first: once the screenshot exists, so does its thumbnail
+        for target, data in files:
+            temporary = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+            temporary.write_bytes(data)
+            os.replace(temporary, target)
+
+    def close(self) -> None:
+        """Wait for the queued screenshots and report the ones that could not be written"""
+        self._executor.shutdown(wait=True)
+        for path, future in self._pending.items():
+            if future.exception() is not None:
+                print(f"Error al guardar la captura {path.name}: {future.exception()}")
+
+
+class ScreenshotPlugin:
+    """Takes a screenshot of the actor's browser for failed (or all) tests and links it from pytest-html"""
+
+    def __init__(self, config):
+        self.mode = config.getoption("--screenshots")
+        self.store = ScreenshotStore(
+            "screenshots",
+            image_format=config.getoption("--screenshot-format"),
+            quality=config.getoption("--screenshot-quality"),
+        )
+        htmlpath = getattr(config.option, "htmlpath", None)
+        self.report_dir = Path(htmlpath).resolve().parent if htmlpath else None
+
+    def wants(self, report) -> bool:
+        # By teardown the browser has already been reset for the next test
+        if self.mode == "none" or report.when == "teardown":
+            return False
+        if report.failed:
+            return True
+        return self.mode == "all" and report.when == "call"
+
+    def link_for(self, path: Path) -> str:
+        if self.report_dir is None:
+            return str(path)
+        return Path(os.path.relpath(path.resolve(), self.report_dir)).as_posix()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        actor = getattr(item, "funcargs", {}).get("actor")
+        if actor is None or not self.wants(report):
+            return
+
+        try:
+            png = actor.ability_to(BrowseTheWeb).browser.get_screenshot_as_png()
+        except Exception as e:
+            print(f"Error al capturar la pantalla: {e}")
+            return
+
+        path = self.store.save(png)
+        report.user_properties.append(("screenshot", str(path)))
+        pytest_html = item.config.pluginmanager.get_plugin("html")
+        if pytest_html:
+            report.extras = getattr(report, "extras", []) + [
+                pytest_html.extras.url(self.link_for(path), name=f"Screenshot ({report.when})")
+            ]
+
+    def pytest_sessionfinish(self, session):
+        self.store.close()
+
@@ -0,0 +1,286 @@
+"""
+Static Frontend
+Serves the E2E production build (`ng build --configuration e2e`) from dist/ with a threaded HTTP
+server: SPA fallback to index.html, precompressed .br/.gz assets and
+immutable caching of hashed bundles, so page loads match production
+"""
+import argparse
+import gzip
+import mimetypes
+import re
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+from urllib.parse import unquote, urlparse
+
+import pytest
+
+from plugins.workers import is_worker
+from settings import BASE_URL
+
+try:
+    import brotli
+except ImportError:  # brotli is optional: without it assets are precompressed with gzip only
+    brotli = None
+
+# Where `ng build` writes the app, relative to the screenplay directory
+DEFAULT_DIST = Path(__file__).resolve().parents[3] / "dist" / "frontend"
+
+# Angular's output hashing: main-ABCD1234.js, styles-ABCD1234.css, chunk-ABCD1234.js
+HASHED_NAME = re.compile(r"-[A-Z0-9]{8,}\.\w+$")
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+COMPRESSIBLE_SUFFIXES = (".js", ".mjs", ".css", ".html", ".json", ".svg", ".txt", ".map", ".webmanifest", ".ico")
+# Compressing tiny files costs more bytes (headers) than it saves
+MIN_COMPRESS_BYTES = 1024
+# Preferred first; each encoding is served from the file with this suffix next to the asset
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+mimetypes.add_type("text/javascript", ".js")
+mimetypes.add_type("text/javascript", ".mjs")
+mimetypes.add_type("application/manifest+json", ".webmanifest")
+
+
+def browser_root(dist) -> Path:
+    """The folder with index.html: dist/<project>/browser for the application builder, or dist itself"""
+    dist = Path(dist)
+    for candidate in (dist / "browser", dist):
+        if (candidate / "index.html").is_file():
+            return candidate
+    raise FileNotFoundError(f"No index.html under {dist}; build the app first (cd frontend && npm run build:e2e)")
+
+
+def precompress(root) -> int:
+    """Write .gz (and .br, with brotli installed) next to every compressible asset that lacks a fresh one"""
+    written = 0
+    for path in Path(root).rglob("*"):
+        if path.suffix not in COMPRESSIBLE_SUFFIXES or not path.is_file() or path.stat().st_size < MIN_COMPRESS_BYTES:
+            continue
+        data = None
+        for suffix, compress in ((".gz", lambda raw: gzip.compress(raw, 9, mtime=0)), (".br", brotli and brotli.compress)):
+            target = path.with_name(path.name + suffix)
+            if compress is None or (target.exists() and target.stat().st_mtime >= path.stat().st_mtime):
+                continue
+            data = data if data is not None else path.read_bytes()
+            target.write_bytes(compress(data))
+            written += 1
+    return written
+
+
+def accepted_encodings(header: str) -> List[str]:
+    accepted = []
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        if name and params.replace(" ", "") not in ("q=0", "q=0.0"):
+            accepted.append(name.strip().lower())
+    return accepted
+
+
+class Asset(NamedTuple):
+    body: bytes
+    content_type: str
+    encoding: Optional[str]
+    cache_control: str
+    etag: str
+    last_modified: str
+
+
+class AssetCache:
+    """Files of the build read once and kept in memory, per path and content encoding"""
+
+    def __init__(self, root) -> None:
+        self.root = Path(root).resolve()
+        self.index = self.root / "index.html"
+        self._assets: Dict[tuple, Optional[Asset]] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, url_path: str) -> Optional[Path]:
+        """The file for a URL path, index.html for client-side routes, None for missing assets"""
+        relative = unquote(url_path).lstrip("/")
+        path = (self.root / relative).resolve()
+        if path != self.root and self.root not in path.parents:
+            return None
+        if path.is_file():
+            return path
+        # Routes like /product/5 have no extension; missing files (/main-XYZ.js) must stay a 404
+        if "." not in Path(relative).name:
+            return self.index
+        return None
+
+    def get(self, path: Path, accept_encoding: str) -> Asset:
+        accepted = accepted_encodings(accept_encoding)
+        for encoding, suffix in ENCODINGS:
+            if encoding in accepted:
+                asset = self._load(path, path.with_name(path.name + suffix), encoding)
+                if asset is not None:
+                    return asset
+        return self._load(path, path, None)
+
+    def _load(self, path: Path, source: Path, encoding: Optional[str]) -> Optional[Asset]:
+        key = (path, encoding)
+        if key not in self._assets:
+            asset = None
+            if source.is_file():
+                stat = source.stat()
+                content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+                if content_type.startswith("text/") or content_type.endswith(("json", "javascript")):
+                    content_type += "; charset=utf-8"
+                asset = Asset(
+                    body=source.read_bytes(),
+                    content_type=content_type,
+                    encoding=encoding,
+                    cache_control=IMMUTABLE if HASHED_NAME.search(path.name) else REVALIDATE,
+                    etag=f'"{stat.st_mtime_ns:x}-{stat.st_size:x}{"-" + encoding if encoding else ""}"',
+                    last_modified=formatdate(stat.st_mtime, usegmt=True),
+                )
+            with self._lock:
+                self._assets[key] = asset
+        return self._assets[key]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    assets: AssetCache  # set on the subclass made by StaticFrontend
+    protocol_version = "HTTP/1.1"  # keep-alive, like a production server
+
+    def do_GET(self) -> None:
+        self._serve(send_body=True)
+
+    def do_HEAD(self) -> None:
+        self._serve(send_body=False)
+
+    def _serve(self, send_body: bool) -> None:
+        path = self.assets.resolve(urlparse(self.path).path)
+        if path is None:
+            self.send_error(404)
+            return
+        asset = self.assets.get(path, self.headers.get("Accept-Encoding", ""))
+        if self.headers.get("If-None-Match") == asset.etag:
+            self.send_response(304)
+            self._headers(asset)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self._headers(asset)
+        self.send_header("Content-Type", asset.content_type)
+        self.send_header("Content-Length", str(len(asset.body)))
+        if asset.encoding:
+            self.send_header("Content-Encoding", asset.encoding)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(asset.body)
+
+    def _headers(self, asset: Asset) -> None:
+        self.send_header("Cache-Control", asset.cache_control)
+        self.send_header("ETag", asset.etag)
+        self.send_header("Last-Modified", asset.last_modified)
+        self.send_header("Vary", "Accept-Encoding")
+
+    def log_message(self, format, *args) -> None:
+        """Requests are not logged; --page-metrics measures the loads"""
+
+
+class StaticFrontend:
+    """A threaded static server for the built app
+
+    Examples::
+
+        frontend = StaticFrontend(browser_root(DEFAULT_DIST), port=4200).start()
+        ...
+        frontend.stop()
+    """
+
+    def __init__(self, root, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.assets = AssetCache(root)
+        handler = type("StaticFrontendHandler", (_Handler,), {"assets": self.assets})
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StaticFrontend":
+        self._thread = threading.Thread(target=self.server.serve_forever, name="static-frontend", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+class StaticFrontendPlugin:
+    """Serves the build on BASE_URL for the whole run
+
+    The server lives in the controller (or the serial process): xdist workers
+    only run tests, and all of them load the app from the same port.
+    """
+
+    def __init__(self, dist) -> None:
+        self.dist = dist
+        self.frontend: Optional[StaticFrontend] = None
+        self.ready_seconds = 0.0
+        self.precompressed = 0
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionstart(self, session):
+        started = time.perf_counter()
+        try:
+            root = browser_root(self.dist)
+        except FileNotFoundError as e:
+            raise pytest.UsageError(str(e)) from e
+        self.precompressed = precompress(root)
+        base = urlparse(BASE_URL)
+        self.frontend = StaticFrontend(root, base.hostname, base.port or 80).start()
+        self.ready_seconds = time.perf_counter() - started
+
+    def pytest_sessionfinish(self, session):
+        if self.frontend is not None:
+            self.frontend.stop()
+            self.frontend = None
+
+    def pytest_report_header(self, config):
+        root = self.frontend.assets.root if self.frontend else self.dist
+        return (
+            f"static frontend: {root} on {BASE_URL} (ready in {self.ready_seconds * 1000:.0f} ms, "
+            f"{self.precompressed} precompressed files written)"
+        )
+
+
+def register(config) -> None:
+    """Serve dist/ when --serve-dist is given; workers use the controller's server"""
+    dist = config.getoption("--serve-dist")
+    if dist and not is_worker(config):
+        config.pluginmanager.register(StaticFrontendPlugin(dist), "vallmere-static-frontend")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dist", nargs="?", default=str(DEFAULT_DIST))
+    parser.add_argument("--port", type=int, default=urlparse(BASE_URL).port or 4200)
+    parser.add_argument("--precompress-only", action="store_true", help="Write the .gz/.br files and exit")
+    args = parser.parse_args(argv)
+
+    root = browser_root(args.dist)
+    print(f"{precompress(root)} precompressed files written in {root}")
+    if args.precompress_only:
+        return
+    frontend = StaticFrontend(root, port=args.port)
+    print(f"Serving {root} on {frontend.url}", flush=True)
+    try:
+        frontend.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        frontend.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
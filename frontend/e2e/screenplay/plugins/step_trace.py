@@ -0,0 +1,189 @@
+"""
+Step Trace
+Timing of every Action, Task and assertion an actor performs, exported per
+test as Chrome trace events (open them in https://ui.perfetto.dev) plus a
+summary of the slowest steps of the run
+"""
+import heapq
+import itertools
+import json
+import re
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List
+
+from screenpy import See, SeeAllOf, SeeAnyOf
+from screenpy.speech_tools import get_additive_description
+
+from actors.command_recorder import CommandRecorder
+
+# Time between two top-level steps longer than this shows up in the trace as
+# "outside actor steps": sleeps and direct driver calls in the test body.
+GAP_THRESHOLD_SECONDS = 0.05
+
+
+def category_of(action) -> str:
+    if isinstance(action, (See, SeeAllOf, SeeAnyOf)):
+        return "assertion"
+    if "Wait" in type(action).__name__:
+        return "wait"
+    return "action"
+
+
+class StepTracer:
+    """Collects one record per performed step, with the WebDriver commands it sent"""
+
+    def __init__(self, recorder: CommandRecorder) -> None:
+        self.recorder = recorder
+        self.started = time.perf_counter()
+        self.steps: List[dict] = []
+        self._open: List[dict] = []
+
+    @contextmanager
+    def step(self, action):
+        record = {
+            "name": get_additive_description(action),
+            "category": category_of(action),
+            "depth": len(self._open),
+            "start": time.perf_counter(),
+            "first_command": len(self.recorder.commands),
+            "first_excluded": self.recorder.excluded_seconds,
+            "children": 0.0,
+        }
+        self._open.append(record)
+        try:
+            yield record
+        finally:
+            self._open.pop()
+            record["end"] = time.perf_counter()
+            commands = self.recorder.since(record.pop("first_command"))
+            record["commands"] = len(commands)
+            record["command_seconds"] = sum(command.duration for command in commands)
+            # Time in unrecorded probes (page metrics) is not the step's own
+            record["excluded_seconds"] = self.recorder.excluded_seconds - record.pop("first_excluded")
+            measured = record["end"] - record["start"] - record["excluded_seconds"]
+            record["self_seconds"] = measured - record.pop("children")
+            if self._open:
+                self._open[-1]["children"] += measured
+            self.steps.append(record)
+
+    def _gaps(self, ended: float) -> List[dict]:
+        gaps, cursor = [], self.started
+        for step in sorted((s for s in self.steps if s["depth"] == 0), key=lambda s: s["start"]):
+            if step["start"] - cursor > GAP_THRESHOLD_SECONDS:
+                gaps.append({"start": cursor, "end": step["start"]})
+            cursor = max(cursor, step["end"])
+        if ended - cursor > GAP_THRESHOLD_SECONDS:
+            gaps.append({"start": cursor, "end": ended})
+        for gap in gaps:
+            gap["commands"] = sum(1 for c in self.recorder.commands if gap["start"] <= c.started < gap["end"])
+        return gaps
+
+    def trace_events(self, test_name: str) -> dict:
+        """Chrome trace-event JSON for the test: steps, WebDriver commands and untracked gaps"""
+        ended = time.perf_counter()
+
+        def micros(seconds: float) -> float:
+            return round((seconds - self.started) * 1_000_000, 1)
+
+        events = [
+            {"ph": "M", "name": "process_name", "pid": 1, "tid": 1, "args": {"name": test_name}},
+            {
+                "name": test_name, "cat": "test", "ph": "X", "pid": 1, "tid": 1, "ts": 0, "dur": micros(ended),
+                "args": {
+                    "webdriver_commands": len(self.recorder.commands),
+                    "webdriver_ms": round(sum(c.duration for c in self.recorder.commands) * 1000, 1),
+                    "wait_ms": round(sum(s["self_seconds"] for s in self.steps if s["category"] == "wait") * 1000, 1),
+                },
+            },
+        ]
+        for step in self.steps:
+            events.append({
+                "name": step["name"], "cat": step["category"], "ph": "X", "pid": 1, "tid": 1,
+                "ts": micros(step["start"]), "dur": micros(step["end"]) - micros(step["start"]),
+                "args": {
+                    "webdriver_commands": step["commands"],
+                    "webdriver_ms": round(step["command_seconds"] * 1000, 1),
+                    "self_ms": round(step["self_seconds"] * 1000, 1),
+                    "excluded_ms": round(step["excluded_seconds"] * 1000, 1),
+                },
+            })
+        for command in self.recorder.commands:
+            events.append({
+                "name": command.name, "cat": "webdriver", "ph": "X", "pid": 1, "tid": 1,
+                "ts": micros(command.started), "dur": micros(command.ended) - micros(command.started),
+            })
+        for gap in self._gaps(ended):
+            events.append({
+                "name": "outside actor steps", "cat": "gap", "ph": "X", "pid": 1, "tid": 1,
+                "ts": micros(gap["start"]), "dur": micros(gap["end"]) - micros(gap["start"]),
+                "args": {"webdriver_commands": gap["commands"]},
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def slowest(self, count: int) -> List[dict]:
+        """The steps with the most time of their own (excluding nested steps)"""
+        return [
+            {
+                "step": step["name"],
+                "category": step["category"],
+                "self_ms": round(step["self_seconds"] * 1000, 1),
+                "total_ms": round((step["end"] - step["start"] - step["excluded_seconds"]) * 1000, 1),
+                "webdriver_commands": step["commands"],
+                "webdriver_ms": round(step["command_seconds"] * 1000, 1),
+            }
+            for step in heapq.nlargest(count, self.steps, key=lambda s: s["self_seconds"])
+        ]
+
+
+class StepTracePlugin:
+    """Gives the test's actor a StepTracer, writes its trace and reports the slowest steps
+
+    Workers write the traces; the slowest steps travel in the reports'
+    user_properties so the process printing the summary sees every worker's.
+    """
+
+    def __init__(self, directory, top: int = 15) -> None:
+        self.directory = Path(directory)
+        self.top = top
+        self._slowest: List[tuple] = []
+        self._order = itertools.count()
+        self.tracer = None
+
+    def start(self, actor, driver) -> None:
+        recorder = CommandRecorder.of(driver)
+        recorder.clear()
+        self.tracer = StepTracer(recorder)
+        actor.observe_with(self.tracer)
+
+    def finish(self, item, actor) -> None:
+        tracer, self.tracer = self.tracer, None
+        actor.stop_observing(tracer)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        file_name = re.sub(r"[^\w.-]+", "_", item.nodeid) + ".trace.json"
+        (self.directory / file_name).write_text(json.dumps(tracer.trace_events(item.nodeid)), encoding="utf-8")
+        item.user_properties.append(("slowest_steps", tracer.slowest(self.top)))
+
+    def pytest_runtest_logreport(self, report):
+        for name, steps in report.user_properties:
+            if name != "slowest_steps":
+                continue
+            for step in steps:
+                entry = (step["self_ms"], next(self._order), report.nodeid, step)
+                if len(self._slowest) < self.top:
+                    heapq.heappush(self._slowest, entry)
+                else:
+                    heapq.heappushpop(self._slowest, entry)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self._slowest:
+            return
+        terminalreporter.section(f"slowest {len(self._slowest)} actor steps (self time)")
+        for self_ms, _, nodeid, step in sorted(self._slowest, key=lambda entry: entry[0], reverse=True):
+            terminalreporter.write_line(
+                f"{self_ms:9.1f} ms  {step['webdriver_commands']:4d} cmd {step['webdriver_ms']:9.1f} ms  "
+                f"[{step['category']}] {step['step']}  ({nodeid})"
+            )
+        terminalreporter.write_line(f"Chrome traces per test: {self.directory}/")
+
@@ -0,0 +1,447 @@
+"""
+Change-Based Test Selection
+Maps every test to the page objects and helpers it imports and, through
+their selectors, URLs and storage keys, to the Angular components, services
+and routes it exercises; a git diff then selects only the affected tests
+
+    python -m plugins.test_selection origin/main            # affected test files
+    python -m plugins.test_selection origin/main --explain  # and why
+    pytest --changed-since=origin/main
+"""
+import argparse
+import ast
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+SCREENPLAY_DIR = Path(__file__).resolve().parents[1]
+APP_DIR = SCREENPLAY_DIR.parents[1] / "src" / "app"
+CACHE_FILE = SCREENPLAY_DIR / ".selection_cache.json"
+
+# Suite infrastructure every test goes through: a change here selects everything
+SHARED_PYTHON = ("abilities", "actors", "plugins", "tests/conftest.py", "settings.py", "requirements.txt", "pytest.ini")
+# Frontend files that reach every page: the app shell, its config and routes; anything else
+# under src/ outside src/app (bootstrap, global styles) and the build configuration
+SHELL_FILES = "src/app/app."
+BUILD_FILES = ("src/", "package.json", "angular.json", "tsconfig")
+# Local packages whose imports are followed from the tests
+LOCAL_PACKAGES = ("pages", "actions", "questions", "resolutions")
+# Calls that load a URL in the browser (driver.get, Open.browser_on)
+NAVIGATION_CALLS = ("get", "browser_on")
+
+# A class used by more components than this (buttons, icons, layout) says nothing about which one a test hits
+GENERIC_CLASS_COMPONENTS = 3
+# Same for string literals (form control names, labels) found in more TypeScript files than this
+GENERIC_LITERAL_FILES = 2
+
+CSS_CLASS = re.compile(r"(?<![\w-])\.(-?[A-Za-z_][\w-]*)")
+COMPONENT_TAG = re.compile(r"<?\b(app-[\w-]+)")
+URL_PATH = re.compile(r"(?:localhost:\d+|^)(/[\w\-/]*)")
+TS_IMPORT = re.compile(r"""from\s+['"](\.[^'"]+)['"]""")
+TS_STRING = re.compile(r"""['"]([\w.-]{8,})['"]""")
+# Selector lists and JavaScript snippets are split into single selectors at these characters
+SELECTOR_SEPARATORS = re.compile(r"[,;'\"()\n]")
+# Storage keys and seed data look like identifiers (vallmere_carts, currentUser, cliente123), not words
+DISTINCTIVE_LITERAL = re.compile(r"_|\d|[a-z][A-Z]")
+TEMPLATE_CLASS = re.compile(r"""\bclass="([^"]+)"|\[class\.([\w-]+)\]|['"]([\w-]+)['"]\s*:""")
+
+
+def _read(path: Path) -> str:
+    try:
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        return ""
+
+
+def _typescript(module: Path) -> Path:
+    """File of a relative TypeScript import ('../services/cart.service' has no extension)"""
+    return module.resolve().with_name(module.name + ".ts")
+
+
+class AngularApp:
+    """Components, their files and dependencies, and routes of the Angular app"""
+
+    def __init__(self, app_dir: Path = APP_DIR) -> None:
+        self.app_dir = app_dir
+        self.components: Dict[str, dict] = {}
+        self._imports: Dict[Path, Set[Path]] = {}
+        for source in sorted(app_dir.rglob("*.component.ts")):
+            self._add_component(source)
+        self.routes = self._parse_routes(app_dir / "app.routes.ts")
+        counts: Dict[str, int] = {}
+        for component in self.components.values():
+            for css_class in component["classes"]:
+                counts[css_class] = counts.get(css_class, 0) + 1
+        self.distinctive = {css_class for css_class, count in counts.items() if count <= GENERIC_CLASS_COMPONENTS}
+        # String literals (storage keys and the like) of every TypeScript file
+        self.literals: Dict[str, Set[Path]] = {}
+        for source in app_dir.rglob("*.ts"):
+            if source.name.endswith(".spec.ts"):
+                continue
+            for literal in TS_STRING.findall(_read(source)):
+                self.literals.setdefault(literal, set()).add(source)
+
+    def imports_of(self, source: Path) -> Set[Path]:
+        """TypeScript files `source` imports, directly or not (relative imports only)"""
+        if source in self._imports:
+            return self._imports[source]
+        self._imports[source] = found = set()
+        for module in TS_IMPORT.findall(_read(source)):
+            target = _typescript(source.parent / module)
+            if target.exists():
+                found.add(target)
+                found |= self.imports_of(target)
+        return found
+
+    def _add_component(self, source: Path) -> None:
+        code = _read(source)
+        selector = re.search(r"selector:\s*'([^']+)'", code)
+        if not selector:
+            return
+        own_files = {source}
+        for reference in re.findall(r"(?:templateUrl|styleUrls?)\s*:\s*\[?\s*'([^']+)'", code):
+            own_files.add((source.parent / reference).resolve())
+        template = "".join(_read(path) for path in own_files if path.suffix == ".html")
+        styles = "".join(_read(path) for path in own_files if path.suffix == ".css")
+        classes = set(CSS_CLASS.findall(styles))
+        for static, bound, keyed in TEMPLATE_CLASS.findall(template):
+            classes.update(static.split() if static else [bound or keyed])
+        self.components[selector.group(1)] = {
+            "source": source,
+            "files": own_files | self.imports_of(source),
+            "classes": classes,
+            "children": set(COMPONENT_TAG.findall(template)) - {selector.group(1)},
+        }
+
+    def _parse_routes(self, routes_file: Path) -> List[dict]:
+        code = _read(routes_file)
+        imported = {
+            name.strip(): _typescript(routes_file.parent / module)
+            for names, module in re.findall(r"import\s*{([^}]+)}\s*from\s*'(\.[^']+)'", code)
+            for name in names.split(",")
+        }
+        selectors = {str(component["source"]): name for name, component in self.components.items()}
+        routes = []
+        for path, body in re.findall(r"path:\s*'([^']*)'(.*?)}", code, re.S):
+            component = re.search(r"component:\s*(\w+)", body)
+            if component is None or component.group(1) not in imported:
+                continue
+            guards = re.search(r"canActivate:\s*\[([^\]]*)\]", body)
+            guard_files = set()
+            for guard in (guards.group(1).split(",") if guards else []):
+                if guard.strip() in imported:
+                    guard_files.add(imported[guard.strip()])
+                    guard_files |= self.imports_of(imported[guard.strip()])
+            pattern = "^/" + re.sub(r":\w+", r"[^/]+", path) + "/?$"
+            routes.append({
+                "path": "/" + path,
+                "pattern": re.compile(pattern),
+                "component": selectors.get(str(imported[component.group(1)])),
+                "guards": guard_files,
+            })
+        return routes
+
+    def rendered_by(self, selector: str) -> Set[str]:
+        """The component and the child components its template renders"""
+        found, pending = set(), [selector]
+        while pending:
+            current = pending.pop()
+            if current in found or current not in self.components:
+                continue
+            found.add(current)
+            pending.extend(self.components[current]["children"])
+        return found
+
+
+class SuiteSources:
+    """Local modules each test imports and the string constants (selectors, URLs, keys) they contain"""
+
+    def __init__(self, screenplay_dir: Path = SCREENPLAY_DIR) -> None:
+        self.screenplay_dir = screenplay_dir
+        self._modules: Dict[Path, Set[Path]] = {}
+
+    def module_path(self, name: str) -> Optional[Path]:
+        if name.split(".")[0] not in LOCAL_PACKAGES:
+            return None
+        path = self.screenplay_dir.joinpath(*name.split("."))
+        for candidate in (path.with_suffix(".py"), path / "__init__.py"):
+            if candidate.exists():
+                return candidate
+        return None
+
+    def imported_by(self, source: Path) -> Set[Path]:
+        """Local modules `source` imports directly"""
+        found = set()
+        for node in ast.walk(ast.parse(_read(source))):
+            names = []
+            if isinstance(node, ast.ImportFrom) and node.module:
+                names = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+            elif isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            found.update(path for path in map(self.module_path, names) if path is not None)
+        return found
+
+    def modules_of(self, source: Path) -> Set[Path]:
+        """The test file plus every local module it imports, directly or not"""
+        if source in self._modules:
+            return self._modules[source]
+        self._modules[source] = found = {source}
+        for module in self.imported_by(source):
+            found |= self.modules_of(module)
+        return found
+
+    @staticmethod
+    def routes_opened_by(source: Path) -> Dict[str, str]:
+        """Routes the action classes of a module open, by "Class.method" (AuthenticateDirectly.as_admin -> /admin)
+
+        Only classmethods that build the action with a literal `route=` keyword count.
+        """
+        opened = {}
+        for cls in ast.parse(_read(source)).body:
+            if not isinstance(cls, ast.ClassDef):
+                continue
+            for method in cls.body:
+                if not isinstance(method, ast.FunctionDef):
+                    continue
+                for node in ast.walk(method):
+                    if not (isinstance(node, ast.Return) and isinstance(node.value, ast.Call)):
+                        continue
+                    for keyword in node.value.keywords:
+                        if keyword.arg == "route" and isinstance(keyword.value, ast.Constant):
+                            opened[f"{cls.name}.{method.name}"] = keyword.value.value
+        return opened
+
+    @staticmethod
+    def navigations_in(source: Path) -> Set[str]:
+        """URL paths a module loads itself with a literal URL (browser.get(f"{BASE_URL}/login"))"""
+        paths = set()
+        for node in ast.walk(ast.parse(_read(source))):
+            if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.args):
+                continue
+            if node.func.attr not in NAVIGATION_CALLS:
+                continue
+            url = node.args[0]
+            parts = url.values if isinstance(url, ast.JoinedStr) else [url]
+            literal = "".join(part.value for part in parts if isinstance(part, ast.Constant) and isinstance(part.value, str))
+            paths.update(URL_PATH.findall(literal))
+        return paths
+
+    @staticmethod
+    def calls_in(source: Path) -> Set[str]:
+        """"Class.method" of every call like AuthenticateDirectly.as_admin() in a module"""
+        return {
+            f"{node.func.value.id}.{node.func.attr}"
+            for node in ast.walk(ast.parse(_read(source)))
+            if isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and isinstance(node.func.value, ast.Name)
+        }
+
+    @staticmethod
+    def strings_in(source: Path) -> Set[str]:
+        tree = ast.parse(_read(source))
+        docstrings = {
+            id(node.body[0].value)
+            for node in ast.walk(tree)
+            if isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef)) and ast.get_docstring(node) is not None
+        }
+        return {
+            node.value
+            for node in ast.walk(tree)
+            if isinstance(node, ast.Constant) and isinstance(node.value, str) and id(node) not in docstrings
+        }
+
+
+def _components_selected_by(fragment: str, app: AngularApp) -> List[str]:
+    """Components whose classes best match one selector ('.product-card .product-image' needs both)"""
+    classes = set(CSS_CLASS.findall(fragment)) & app.distinctive
+    if not classes:
+        return []
+    scores = {selector: len(classes & component["classes"]) for selector, component in app.components.items()}
+    best = max(scores.values())
+    return [selector for selector, score in scores.items() if score and score == best]
+
+
+def build_map(app: AngularApp, suite: SuiteSources, repo_root: Path) -> Dict[str, dict]:
+    """For each test file: the local Python modules and the app files it depends on (paths relative to the repo)
+
+    Selectors come from the test and the page objects it imports itself, and
+    storage keys or seed data from any module it imports. Visited routes come
+    from the URLs in the test, the routes of the actions it calls
+    (AuthenticateDirectly.as_admin() opens /admin), the URLs the imported
+    actions load themselves, and the routed components its selectors wait for;
+    each visited route brings its guards.
+    """
+
+    def relative(path: Path) -> str:
+        return Path(os.path.relpath(path, repo_root)).as_posix()
+
+    mapping = {}
+    for test_file in sorted((suite.screenplay_dir / "tests").glob("test_*.py")):
+        modules = suite.modules_of(test_file)
+        own_strings = suite.strings_in(test_file)
+        selector_strings = own_strings.union(
+            *(suite.strings_in(module) for module in suite.imported_by(test_file) if module.parent.name == "pages")
+        )
+        reasons: Dict[str, str] = {}
+
+        paths = {path for text in own_strings for path in URL_PATH.findall(text)}
+        actions = [module for module in modules if module.parent.name == "actions"]
+        opened = {call: path for module in actions for call, path in suite.routes_opened_by(module).items()}
+        paths.update(opened[call] for call in suite.calls_in(test_file) if call in opened)
+        paths.update(path for module in actions for path in suite.navigations_in(module))
+        for route in app.routes:
+            if route["component"] and any(route["pattern"].match(path) for path in paths):
+                for selector in app.rendered_by(route["component"]):
+                    reasons.setdefault(selector, f"route {route['path']}")
+                for guard in route["guards"]:
+                    reasons.setdefault(relative(guard), f"guard of route {route['path']}")
+
+        for text in selector_strings:
+            for fragment in SELECTOR_SEPARATORS.split(text):
+                for selector in _components_selected_by(fragment, app):
+                    reasons.setdefault(selector, f"selector {fragment.strip()}")
+                for tag in COMPONENT_TAG.findall(fragment):
+                    if tag in app.components:
+                        reasons.setdefault(tag, f"tag {tag}")
+
+        # Waiting for a routed component's elements means the test got past the route's guards
+        for route in app.routes:
+            if route["component"] in reasons:
+                for guard in route["guards"]:
+                    reasons.setdefault(relative(guard), f"guard of route {route['path']}")
+
+        strings = set().union(*(suite.strings_in(module) for module in modules))
+        for literal in strings & set(app.literals):
+            if len(app.literals[literal]) > GENERIC_LITERAL_FILES or not DISTINCTIVE_LITERAL.search(literal):
+                continue
+            for source in app.literals[literal]:
+                reasons.setdefault(relative(source), f"string '{literal}'")
+
+        app_files: Dict[str, str] = {}
+        for key, reason in reasons.items():
+            if key in app.components:
+                for path in app.components[key]["files"]:
+                    app_files.setdefault(relative(path), f"{key} ({reason})")
+            else:
+                app_files.setdefault(key, reason)
+        mapping[relative(test_file)] = {
+            "python": sorted(relative(module) for module in modules),
+            "app": app_files,
+        }
+    return mapping
+
+
+def _fingerprint(screenplay_dir: Path, app_dir: Path) -> str:
+    digest = hashlib.sha256()
+    sources = [screenplay_dir / "tests", *(screenplay_dir / package for package in LOCAL_PACKAGES), app_dir]
+    for directory in sources:
+        for path in sorted(directory.rglob("*")):
+            if path.suffix in (".py", ".ts", ".html", ".css"):
+                stat = path.stat()
+                digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+    return digest.hexdigest()
+
+
+def load_map(repo_root: Path, cache_file: Path = CACHE_FILE) -> Dict[str, dict]:
+    """The test map, rebuilt only when a test, helper or app source changed since it was cached"""
+    fingerprint = _fingerprint(SCREENPLAY_DIR, APP_DIR)
+    try:
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        if cached["fingerprint"] == fingerprint:
+            return cached["tests"]
+    except (OSError, ValueError, KeyError):
+        pass
+    mapping = build_map(AngularApp(), SuiteSources(), repo_root)
+    temporary = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    temporary.write_text(json.dumps({"fingerprint": fingerprint, "tests": mapping}, indent=1), encoding="utf-8")
+    os.replace(temporary, cache_file)
+    return mapping
+
+
+def repository_root() -> Path:
+    output = subprocess.run(
+        ["git", "rev-parse", "--show-toplevel"], cwd=SCREENPLAY_DIR, capture_output=True, text=True, check=True
+    )
+    return Path(output.stdout.strip())
+
+
+def changed_files(base: str, repo_root: Path) -> List[str]:
+    """Files that differ from `base` in the working tree, untracked files included"""
+    commands = (["git", "diff", "--name-only", base], ["git", "ls-files", "--others", "--exclude-standard"])
+    files = set()
+    for command in commands:
+        output = subprocess.run(command, cwd=repo_root, capture_output=True, text=True, check=True)
+        files.update(line for line in output.stdout.splitlines() if line)
+    return sorted(files)
+
+
+def select(changed: Iterable[str], mapping: Dict[str, dict], repo_root: Path) -> Dict[str, List[str]]:
+    """Affected test files, each with the changed files that affect it"""
+    screenplay = Path(os.path.relpath(SCREENPLAY_DIR, repo_root)).as_posix() + "/"
+    frontend = Path(os.path.relpath(APP_DIR.parents[1], repo_root)).as_posix() + "/"
+    selected: Dict[str, List[str]] = {}
+    for path in changed:
+        if path.startswith(screenplay):
+            shared = path[len(screenplay):].startswith(SHARED_PYTHON)
+            affected = [test for test, entry in mapping.items() if shared or path in entry["python"]]
+        elif path.startswith(frontend):
+            inside = path[len(frontend):]
+            if inside.endswith(".spec.ts") or not inside.startswith(BUILD_FILES):
+                affected = []
+            elif inside.startswith("src/app/") and not inside.startswith(SHELL_FILES):
+                affected = [test for test, entry in mapping.items() if path in entry["app"]]
+            else:
+                affected = list(mapping)
+        else:
+            affected = []
+        for test in affected:
+            selected.setdefault(test, []).append(path)
+    return selected
+
+
+def deselect_unaffected(config, items) -> None:
+    """pytest_collection_modifyitems body for --changed-since
+
+    Only the mapped browser tests are filtered; anything else collected
+    (the unit tests under tests/unit) always runs.
+    """
+    repo_root = repository_root()
+    mapping = load_map(repo_root)
+    selected = select(changed_files(config.getoption("--changed-since"), repo_root), mapping, repo_root)
+    mapped = {(repo_root / test).resolve() for test in mapping}
+    affected = {(repo_root / test).resolve() for test in selected}
+    keep, dropped = [], []
+    for item in items:
+        path = Path(item.fspath).resolve()
+        (dropped if path in mapped and path not in affected else keep).append(item)
+    if dropped:
+        config.hook.pytest_deselected(items=dropped)
+        items[:] = keep
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("base", help="git revision to diff the working tree against, e.g. origin/main")
+    parser.add_argument("--explain", action="store_true", help="show which change selects each test and why")
+    args = parser.parse_args(argv)
+
+    repo_root = repository_root()
+    mapping = load_map(repo_root)
+    changed = changed_files(args.base, repo_root)
+    selected = select(changed, mapping, repo_root)
+    for test in sorted(selected):
+        print(Path(os.path.relpath(repo_root / test, SCREENPLAY_DIR)).as_posix())
+        if args.explain:
+            for path in selected[test]:
+                print(f"    {path}: {mapping[test]['app'].get(path, 'imported or shared test code')}")
+    print(f"{len(selected)} of {len(mapping)} test files affected by {len(changed)} changed files", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""
+Parallel Workers
+Helpers to namespace per-worker artifacts when the suite runs under pytest-xdist
+"""
+from pathlib import Path
+
+
+def worker_id(config) -> str:
+    """Return the xdist worker id (gw0, gw1, ...) or "master" when running serially"""
+    return getattr(config, "workerinput", {}).get("workerid", "master")
+
+
+def is_worker(config) -> bool:
+    """True inside an xdist worker process"""
+    return hasattr(config, "workerinput")
+
+
+def worker_dir(base, config) -> Path:
+    """Return `base` for serial runs and `base/<worker id>` inside a worker, creating it"""
+    path = Path(base)
+    if is_worker(config):
+        path = path / worker_id(config)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
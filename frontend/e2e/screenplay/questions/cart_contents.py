@@ -0,0 +1,150 @@
+import json
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+from weakref import WeakKeyDictionary
+
+from screenpy import Actor
+from screenpy.pacing import beat
+from screenpy.protocols import Answerable
+from screenpy_selenium.abilities import BrowseTheWeb
+
+# Every key LocalCartService writes, plus the logged-in user, read in one call
+CART_STORAGE_KEYS = (
+    "vallmere_carts",
+    "vallmere_cart_items",
+    "vallmere_cart_id_counter",
+    "vallmere_cart_item_id_counter",
+    "currentUser",
+)
+
+READ_CART_STORAGE_SCRIPT = "return arguments[0].map(key => localStorage.getItem(key));"
+
+
+def _parse(raw: Optional[str], default):
+    if raw is None:
+        return default
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return default
+
+
+class CartState:
+    """Cart storage parsed once and indexed by cartId and productId"""
+
+    def __init__(self, storage: Dict[str, Optional[str]]) -> None:
+        self.carts: List[dict] = _parse(storage["vallmere_carts"], [])
+        self.stored_items: List[dict] = _parse(storage["vallmere_cart_items"], [])
+        self.user: Optional[dict] = _parse(storage["currentUser"], None)
+
+        self.items_by_cart: Dict[int, List[dict]] = defaultdict(list)
+        for item in self.stored_items:
+            self.items_by_cart[item["cartId"]].append(item)
+        carts_by_user = {cart["userId"]: cart for cart in self.carts}
+        self.cart: Optional[dict] = carts_by_user.get(self.user.get("userId")) if self.user else None
+        self.items: List[dict] = self.items_by_cart.get(self.cart["cartId"], []) if self.cart else []
+        self.items_by_product: Dict[int, dict] = {item["productId"]: item for item in self.items}
+
+    @property
+    def count(self) -> int:
+        """Number of different products in the current user's cart"""
+        return len(self.items)
+
+    @property
+    def stored_item_count(self) -> int:
+        """Number of cart items in storage, whatever cart they belong to"""
+        return len(self.stored_items)
+
+    @property
+    def quantities(self) -> Dict[int, int]:
+        return {product_id: item["quantity"] for product_id, item in self.items_by_product.items()}
+
+    @property
+    def total_quantity(self) -> int:
+        return sum(item["quantity"] for item in self.items)
+
+    @property
+    def total(self) -> float:
+        """Price of the current user's cart, as LocalCartService adds it up"""
+        return sum(item["quantity"] * item.get("product", {}).get("price", 0) for item in self.items)
+
+    def contains(self, product_id: int) -> bool:
+        return product_id in self.items_by_product
+
+    def item_for(self, product_id: int) -> Optional[dict]:
+        return self.items_by_product.get(product_id)
+
+    def quantity_of(self, product_id: int) -> int:
+        item = self.items_by_product.get(product_id)
+        return item["quantity"] if item else 0
+
+    def items_in_cart(self, cart_id: int) -> List[dict]:
+        return self.items_by_cart.get(cart_id, [])
+
+
+# Last answer per actor, tagged with how many actions the actor had performed then
+_answers: "WeakKeyDictionary[Actor, tuple]" = WeakKeyDictionary()
+
+
+class CartContents(Answerable):
+    """Pregunta que lee de una vez todas las claves del carrito en localStorage y responde sobre el carrito del usuario actual.
+
+    La lectura se guarda mientras el actor no realice otra acción (ver VallmereActor),
+    así que varias preguntas sobre el carrito en el mismo paso cuestan una sola llamada.
+    Las llamadas directas al driver (browser.get, execute_script) no invalidan la caché.
+
+    Examples::
+
+        initial_count = CartContents.count().answered_by(actor)
+        cart = CartContents.of_the_current_user().answered_by(actor)
+        assert cart.contains(5) and cart.quantity_of(5) == 1
+    """
+
+    @classmethod
+    def of_the_current_user(cls) -> "CartContents":
+        return cls(lambda cart: cart, "the cart of the current user")
+
+    @classmethod
+    def count(cls) -> "CartContents":
+        return cls(lambda cart: cart.count, "the number of items in the cart")
+
+    @classmethod
+    def total_quantity(cls) -> "CartContents":
+        return cls(lambda cart: cart.total_quantity, "the total quantity in the cart")
+
+    @classmethod
+    def total(cls) -> "CartContents":
+        return cls(lambda cart: cart.total, "the cart total")
+
+    @classmethod
+    def quantity_of(cls, product_id: int) -> "CartContents":
+        return cls(lambda cart: cart.quantity_of(product_id), f"the quantity of product {product_id} in the cart")
+
+    @classmethod
+    def stored_item_count(cls) -> "CartContents":
+        return cls(lambda cart: cart.stored_item_count, "the number of cart items in storage")
+
+    def describe(self) -> str:
+        return f"{self.description[0].upper()}{self.description[1:]}."
+
+    @beat("{} revisa {description}.")
+    def answered_by(self, actor: Actor):
+        return self.select(self.read_state(actor))
+
+    @staticmethod
+    def read_state(actor: Actor) -> CartState:
+        step = getattr(actor, "actions_performed", None)
+        cached = _answers.get(actor)
+        if step is not None and cached is not None and cached[0] == step:
+            return cached[1]
+
+        browser = actor.ability_to(BrowseTheWeb).browser
+        values = browser.execute_script(READ_CART_STORAGE_SCRIPT, list(CART_STORAGE_KEYS))
+        state = CartState(dict(zip(CART_STORAGE_KEYS, values)))
+        if step is not None:
+            _answers[actor] = (step, state)
+        return state
+
+    def __init__(self, select: Callable[[CartState], object], description: str) -> None:
+        self.select = select
+        self.description = description
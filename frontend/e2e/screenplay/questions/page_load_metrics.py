@@ -0,0 +1,121 @@
+from typing import Callable
+
+from screenpy import Actor
+from screenpy.pacing import beat
+from screenpy.protocols import Answerable
+from screenpy_selenium.abilities import BrowseTheWeb
+
+# Runs inside the page in one round trip. LCP and layout shifts are only
+# exposed to PerformanceObserver (buffered entries arrive asynchronously), so
+# the script waits up to `settleMs` for the first contentful paint, lets a few
+# more frames pass for LCP, then reads everything at once.
+PAGE_LOAD_METRICS_SCRIPT = """
+const settleMs = arguments[0];
+const done = arguments[arguments.length - 1];
+const started = performance.now();
+let lcp = null;
+let cls = 0;
+const observers = [];
+const handlers = {
+    'largest-contentful-paint': entry => { lcp = entry.startTime; },
+    'layout-shift': entry => { if (!entry.hadRecentInput) cls += entry.value; },
+};
+for (const [type, handle] of Object.entries(handlers)) {
+    try {
+        const observer = new PerformanceObserver(list => list.getEntries().forEach(handle));
+        observer.observe({ type, buffered: true });
+        observers.push([observer, handle]);
+    } catch (e) {
+        // Entry type not supported by this browser
+    }
+}
+
+const round = value => value == null ? null : Math.round(value * 10) / 10;
+const firstContentfulPaint = () => performance.getEntriesByName('first-contentful-paint')[0];
+
+function finish() {
+    for (const [observer, handle] of observers) {
+        observer.takeRecords().forEach(handle);
+        observer.disconnect();
+    }
+    const navigation = performance.getEntriesByType('navigation')[0] || {};
+    const resources = performance.getEntriesByType('resource');
+    const fcp = firstContentfulPaint();
+    done({
+        url: location.href,
+        path: location.pathname,
+        ttfb_ms: round(navigation.responseStart),
+        dom_interactive_ms: round(navigation.domInteractive),
+        dom_content_loaded_ms: round(navigation.domContentLoadedEventEnd),
+        load_ms: round(navigation.loadEventEnd),
+        fcp_ms: round(fcp && fcp.startTime),
+        lcp_ms: round(lcp),
+        cls: Math.round(cls * 10000) / 10000,
+        transfer_bytes: (navigation.transferSize || 0) + resources.reduce((sum, r) => sum + (r.transferSize || 0), 0),
+        resource_count: resources.length,
+    });
+}
+
+function waitForPaint() {
+    if (firstContentfulPaint() || performance.now() - started > settleMs) {
+        setTimeout(finish, 100);
+    } else {
+        setTimeout(waitForPaint, 25);
+    }
+}
+waitForPaint();
+"""
+
+
+class PageLoadMetrics(Answerable):
+    """Pregunta que mide cómo cargó el documento actual: Navigation Timing, FCP, LCP, CLS y bytes transferidos.
+
+    Los tiempos son milisegundos desde el inicio de la navegación del documento,
+    así que después de una navegación interna de Angular siguen describiendo la
+    última carga completa (Open.browser_on o browser.get).
+
+    Examples::
+
+        metrics = PageLoadMetrics.of_the_current_page().answered_by(actor)
+        assert PageLoadMetrics.largest_contentful_paint().answered_by(actor) < 2500
+    """
+
+    @classmethod
+    def of_the_current_page(cls) -> "PageLoadMetrics":
+        return cls(lambda metrics: metrics, "the load metrics of the current page")
+
+    @classmethod
+    def time_to_first_byte(cls) -> "PageLoadMetrics":
+        return cls(lambda metrics: metrics["ttfb_ms"], "the time to first byte")
+
+    @classmethod
+    def first_contentful_paint(cls) -> "PageLoadMetrics":
+        return cls(lambda metrics: metrics["fcp_ms"], "the first contentful paint")
+
+    @classmethod
+    def largest_contentful_paint(cls) -> "PageLoadMetrics":
+        return cls(lambda metrics: metrics["lcp_ms"], "the largest contentful paint")
+
+    @classmethod
+    def cumulative_layout_shift(cls) -> "PageLoadMetrics":
+        return cls(lambda metrics: metrics["cls"], "the cumulative layout shift")
+
+    @classmethod
+    def transferred_bytes(cls) -> "PageLoadMetrics":
+        return cls(lambda metrics: metrics["transfer_bytes"], "the bytes transferred to load the page")
+
+    def describe(self) -> str:
+        return f"{self.description[0].upper()}{self.description[1:]}."
+
+    @beat("{} mide {description}.")
+    def answered_by(self, actor: Actor):
+        return self.select(self.read(actor.ability_to(BrowseTheWeb).browser))
+
+    @staticmethod
+    def read(browser, settle_ms: int = 2000) -> dict:
+        """Run the metrics script on a driver (also used by plugins/page_metrics.py)"""
+        return browser.execute_async_script(PAGE_LOAD_METRICS_SCRIPT, settle_ms)
+
+    def __init__(self, select: Callable[[dict], object], description: str) -> None:
+        self.select = select
+        self.description = description
@@ -0,0 +1,95 @@
+from typing import Dict, Optional, Sequence, Union
+
+from screenpy import Actor, settings
+from screenpy.exceptions import UnableToAnswer
+from screenpy.pacing import beat
+from screenpy.protocols import Answerable
+from screenpy_selenium.abilities import BrowseTheWeb
+from screenpy_selenium.target import Target
+
+from actions.in_page import ELEMENT_WAIT_JS, LOCATOR_HELPERS_JS, allow_script_to_run, locator_of, name_of
+
+# Optionally waits until the given targets are visible (or the timeout runs
+# out), then reads every target in the same call. Text and attributes come
+# from the first visible match, or the first match when none is visible.
+PAGE_SNAPSHOT_SCRIPT = LOCATOR_HELPERS_JS + ELEMENT_WAIT_JS + """
+const [locators, waitFor, attributes, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+
+function snapshot() {
+    return locators.map(locator => {
+        const elements = findAll(locator);
+        const element = elements.find(isVisible) || elements[0] || null;
+        return {
+            count: elements.length,
+            visible: elements.some(isVisible),
+            text: element ? element.textContent.trim() : null,
+            attributes: element ? Object.fromEntries(attributes.map(name => [name, element.getAttribute(name)])) : {},
+        };
+    });
+}
+
+waitUntil(() => waitFor.every(locator => findAll(locator).some(isVisible)), timeoutMs)
+    .then(() => done(snapshot()), error => done({ error: String(error && error.message || error) }));
+"""
+
+Locatable = Union[Target, str, tuple]
+
+
+class PageSnapshot(Answerable):
+    """Pregunta que lee en una sola llamada la visibilidad, el texto, la cantidad y los atributos de varios Targets.
+
+    La respuesta es un diccionario por nombre de Target:
+
+        {"user name": {"count": 1, "visible": True, "text": "Cliente", "attributes": {}}, ...}
+
+    Se usa junto con la resolución SeeAllOf:
+
+        See.the(
+            PageSnapshot.of(USER_NAME, EMAIL).once_visible(),
+            SeeAllOf.visible(USER_NAME, EMAIL),
+        )
+    """
+
+    @classmethod
+    def of(cls, *targets: Locatable) -> "PageSnapshot":
+        return cls(targets)
+
+    def with_attributes(self, *names: str) -> "PageSnapshot":
+        self.attributes = list(names)
+        return self
+
+    def once_visible(self, *targets: Locatable, seconds: Optional[float] = None) -> "PageSnapshot":
+        """Wait in the page until these targets (all of them by default) are visible before reading"""
+        self.wait_for = list(targets or self.targets)
+        if seconds is not None:
+            self.timeout = seconds
+        return self
+
+    @property
+    def target_names(self) -> str:
+        return ", ".join(name_of(target) for target in self.targets)
+
+    def describe(self) -> str:
+        return f"A snapshot of {self.target_names}."
+
+    @beat("{} toma una instantánea de {target_names}.")
+    def answered_by(self, actor: Actor) -> Dict[str, dict]:
+        browser = actor.ability_to(BrowseTheWeb).browser
+        allow_script_to_run(browser, self.timeout)
+        states = browser.execute_async_script(
+            PAGE_SNAPSHOT_SCRIPT,
+            [locator_of(target) for target in self.targets],
+            [locator_of(target) for target in self.wait_for],
+            self.attributes,
+            int(self.timeout * 1000),
+        )
+        if isinstance(states, dict):
+            raise UnableToAnswer(f"Could not take a snapshot of {self.target_names}: {states['error']}")
+        return {name_of(target): state for target, state in zip(self.targets, states)}
+
+    def __init__(self, targets: Sequence[Locatable]) -> None:
+        self.targets = list(targets)
+        self.wait_for = []
+        self.attributes = []
+        self.timeout = settings.TIMEOUT
@@ -0,0 +1,4 @@
+"""
+Vallmere Resolutions
+Resolutions for the answers of the questions in questions/
+"""
@@ -0,0 +1,106 @@
+from typing import Any, Callable, List, Tuple, Union
+
+from hamcrest.core.base_matcher import BaseMatcher
+from hamcrest.core.description import Description
+from screenpy.pacing import beat
+from screenpy_selenium.target import Target
+
+from actions.in_page import name_of
+
+Locatable = Union[Target, str, tuple]
+# (target name, expectation, check on the target's state, actual value for the report)
+Expectation = Tuple[str, str, Callable[[dict], bool], Callable[[dict], Any]]
+
+
+class _SnapshotMatcher(BaseMatcher):
+    """Checks every expectation against a PageSnapshot answer and reports all failures together"""
+
+    def __init__(self, expectations: List[Expectation]) -> None:
+        self.expectations = expectations
+
+    def failures(self, snapshot: dict) -> List[str]:
+        failed = []
+        for name, expected, check, actual in self.expectations:
+            state = snapshot.get(name)
+            if state is None:
+                failed.append(f"{name} was not part of the snapshot")
+            elif not check(state):
+                failed.append(f"{name} should be {expected}, but was {actual(state)!r}")
+        return failed
+
+    def _matches(self, item: Any) -> bool:
+        return isinstance(item, dict) and not self.failures(item)
+
+    def describe_to(self, description: Description) -> None:
+        description.append_text("; ".join(f"{name} {expected}" for name, expected, _, _ in self.expectations))
+
+    def describe_mismatch(self, item: Any, mismatch_description: Description) -> None:
+        if not isinstance(item, dict):
+            mismatch_description.append_text(f"was {item!r}, not a page snapshot")
+            return
+        mismatch_description.append_text("\n".join(self.failures(item)))
+
+
+class SeeAllOf:
+    """Resolución que comprueba todas las expectativas sobre una PageSnapshot en una sola aserción.
+
+    Examples::
+
+        the_actor.should(
+            See.the(
+                PageSnapshot.of(USER_NAME, EMAIL, ROLE_BADGE).once_visible(USER_NAME, EMAIL),
+                SeeAllOf.visible(USER_NAME, EMAIL).with_count(ROLE_BADGE, 1),
+            )
+        )
+
+    Si varias fallan, el mensaje las lista todas.
+    """
+
+    @classmethod
+    def visible(cls, *targets: Locatable) -> "SeeAllOf":
+        return cls().and_visible(*targets)
+
+    def and_visible(self, *targets: Locatable) -> "SeeAllOf":
+        for target in targets:
+            self._expect(target, "visible", lambda state: state["visible"], lambda state: "hidden" if state["count"] else "missing")
+        return self
+
+    def hidden(self, target: Locatable) -> "SeeAllOf":
+        return self._expect(target, "hidden", lambda state: not state["visible"], lambda state: "visible")
+
+    def with_text(self, target: Locatable, text: str) -> "SeeAllOf":
+        return self._expect(target, f"reading {text!r}", lambda state: state["text"] == text, lambda state: state["text"])
+
+    def containing_text(self, target: Locatable, text: str) -> "SeeAllOf":
+        return self._expect(
+            target, f"containing {text!r}", lambda state: text in (state["text"] or ""), lambda state: state["text"]
+        )
+
+    def with_count(self, target: Locatable, count: int) -> "SeeAllOf":
+        return self._expect(target, f"found {count} time(s)", lambda state: state["count"] == count, lambda state: state["count"])
+
+    def with_attribute(self, target: Locatable, name: str, value: str) -> "SeeAllOf":
+        return self._expect(
+            target,
+            f"with {name}={value!r}",
+            lambda state: state["attributes"].get(name) == value,
+            lambda state: state["attributes"].get(name),
+        )
+
+    @property
+    def expected_to_log(self) -> str:
+        return "; ".join(f"{name} {expected}" for name, expected, _, _ in self.expectations)
+
+    def describe(self) -> str:
+        return f"All of: {self.expected_to_log}."
+
+    @beat("... esperando que se cumpla todo: {expected_to_log}.")
+    def resolve(self) -> _SnapshotMatcher:
+        return _SnapshotMatcher(self.expectations)
+
+    def _expect(self, target: Locatable, expected: str, check: Callable[[dict], bool], actual: Callable[[dict], Any]) -> "SeeAllOf":
+        self.expectations.append((name_of(target), expected, check, actual))
+        return self
+
+    def __init__(self) -> None:
+        self.expectations: List[Expectation] = []
@@ -28,25 +28,14 @@ if exist "venv\Scripts\activate.bat" (
     exit /b 1
 )
 
-REM Verificar que la aplicación Angular esté corriendo
-echo [2/4] Verificando que la aplicacion Angular este corriendo...
-curl -s http://localhost:4200 > nul 2>&1
-if errorlevel 1 (
-    echo.
-    echo ERROR: La aplicacion Angular no esta corriendo en http://localhost:4200
-    echo.
-    echo Por favor, en otra terminal ejecuta:
-    echo    cd frontend
-    echo    npm start
-    echo.
-    echo Presiona cualquier tecla cuando la aplicacion este lista...
-    pause > nul
-)
-
-REM Ejecutar tests
+REM Levantar frontend y backend, ejecutar los tests y apagarlos al terminar
+if "%VALLMERE_FRONTEND%"=="" set VALLMERE_FRONTEND=auto
+if "%VALLMERE_BACKEND%"=="" set VALLMERE_BACKEND=stub
+if "%PYTEST_WORKERS%"=="" set PYTEST_WORKERS=auto
+echo [2/4] Levantando frontend (%VALLMERE_FRONTEND%) y backend (%VALLMERE_BACKEND%)...
 echo [3/4] Ejecutando tests de Vallmere...
 echo.
-pytest -v --html=report.html --self-contained-html tests/
+python orchestrate.py --frontend %VALLMERE_FRONTEND% --backend %VALLMERE_BACKEND% --startup-log .history\startup.jsonl -- -v -n %PYTEST_WORKERS% --html=report.html --self-contained-html --report-jsonl=results.jsonl tests/
 
 REM Verificar resultado
 if errorlevel 1 (
@@ -69,6 +58,7 @@ if errorlevel 1 (
     start report.html
     echo.
     echo Screenshots guardados en: screenshots\
+    echo Vista ligera de resultados: results.html
     echo.
     pause
 )
@@ -26,23 +26,13 @@ else
     exit 1
 fi
 
-# Verificar que la aplicación Angular esté corriendo
-echo "[2/4] Verificando que la aplicación Angular esté corriendo..."
-if ! curl -s http://localhost:4200 > /dev/null 2>&1; then
-    echo ""
-    echo "❌ ERROR: La aplicación Angular no está corriendo en http://localhost:4200"
-    echo ""
-    echo "Por favor, en otra terminal ejecuta:"
-    echo "   cd frontend"
-    echo "   npm start"
-    echo ""
-    read -p "Presiona Enter cuando la aplicación esté lista..."
-fi
-
-# Ejecutar tests
-echo "[3/4] Ejecutando tests de Vallmere..."
+# Levantar frontend y backend, ejecutar los tests y apagarlos al terminar
+echo "[2/4] Levantando frontend (${VALLMERE_FRONTEND:-auto}) y backend (${VALLMERE_BACKEND:-stub})..."
+echo "[3/4] Ejecutando tests de Vallmere (workers: ${PYTEST_WORKERS:-auto})..."
 echo ""
-pytest -v --html=report.html --self-contained-html tests/test_0*.py tests/test_15*.py
+python orchestrate.py --frontend "${VALLMERE_FRONTEND:-auto}" --backend "${VALLMERE_BACKEND:-stub}" \
+    --startup-log .history/startup.jsonl \
+    -- -v -n "${PYTEST_WORKERS:-auto}" --html=report.html --self-contained-html --report-jsonl=results.jsonl tests/test_0*.py tests/test_15*.py
 
 # Verificar resultado
 if [ $? -eq 0 ]; then
@@ -64,6 +54,7 @@ if [ $? -eq 0 ]; then
     
     echo ""
     echo "📸 Screenshots guardados en: screenshots/"
+    echo "📄 Vista ligera de resultados: results.html"
     echo ""
 else
     echo ""
@@ -0,0 +1,15 @@
+"""
+Suite Settings
+Shared configuration values for the Vallmere screenplay suite
+"""
+import os
+
+# Base URL of the Angular application under test
+BASE_URL = os.getenv("VALLMERE_BASE_URL", "http://localhost:4200").rstrip("/")
+
+# Console logging in every Chrome the suite launches; set VALLMERE_BROWSER_LOGS=0
+# to launch Chrome without it (network logging is opt-in: --browser-network-log)
+BROWSER_LOGS = os.getenv("VALLMERE_BROWSER_LOGS", "1") != "0"
+
+# Where the Nest API is expected (orchestrate.py starts its backend here)
+API_URL = os.getenv("VALLMERE_API_URL", "http://localhost:3000").rstrip("/")
@@ -0,0 +1,5 @@
+"""
+Stub Backend
+In-process stand-in for the Nest API, seeded from seed.json and rolled back
+after every test by the `backend` fixture in tests/conftest.py
+"""
@@ -0,0 +1,29 @@
+"""
+Stub Backend
+Serve the stand-in backend outside pytest: python -m stub_backend [--port 3000]
+"""
+import argparse
+
+from stub_backend.server import StubBackend
+from stub_backend.store import SEED_PATH, Store
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3000)
+    parser.add_argument("--seed", default=str(SEED_PATH), help="JSON file with the rows of every table")
+    args = parser.parse_args(argv)
+
+    backend = StubBackend(args.host, args.port, Store.seeded_from(args.seed))
+    print(f"[stub] listening on {backend.url}", flush=True)
+    try:
+        backend.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        backend.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,555 @@
+"""
+Stub Backend Server
+The endpoints of the Nest API (products, categories, auth, users, cart, orders
+and admin) answered from the in-memory Store by a threaded HTTP server that
+runs inside the pytest process
+"""
+import base64
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List, NamedTuple, Optional, Pattern
+from urllib.parse import unquote, urlparse
+
+from stub_backend.store import Store
+
+ORDER_STATUSES = ("pending", "shipped", "delivered", "cancelled")
+ADDRESS_TYPES = ("shipping", "billing", "both")
+TOKEN_TTL_SECONDS = 24 * 3600
+
+
+class HttpError(Exception):
+    """An error answered with Nest's error body: {"statusCode", "message", "error"}"""
+
+    REASONS = {400: "Bad Request", 401: "Unauthorized", 403: "Forbidden", 404: "Not Found", 409: "Conflict"}
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.body = {"statusCode": status, "message": message, "error": self.REASONS.get(status, "Error")}
+
+
+class Request(NamedTuple):
+    params: dict
+    body: dict
+    user: Optional[dict]
+
+
+class Route(NamedTuple):
+    method: str
+    pattern: Pattern
+    handler: Callable
+    auth: Optional[str]  # None, "user" or "admin"
+
+
+ROUTES: List[Route] = []
+
+
+def route(method: str, path: str, auth: Optional[str] = None):
+    """Register a handler for METHOD /path; `{name}` segments become params. Routes match in order."""
+    pattern = re.compile("^" + re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", path) + "$")
+
+    def register(handler):
+        ROUTES.append(Route(method, pattern, handler, auth))
+        return handler
+
+    return register
+
+
+def _b64(data: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+
+def issue_token(user: dict) -> str:
+    """An unsigned JWT with the claims the Nest API puts in its tokens (sub, email, role, exp)"""
+    claims = {"sub": user["userId"], "email": user["email"], "role": user["role"], "exp": int(time.time()) + TOKEN_TTL_SECONDS}
+    return f"{_b64({'alg': 'none', 'typ': 'JWT'})}.{_b64(claims)}.stub"
+
+
+def _claims_of(authorization: str) -> Optional[dict]:
+    if not authorization.startswith("Bearer ") or authorization.count(".") != 2:
+        return None
+    payload = authorization.split(".")[1]
+    try:
+        return json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except ValueError:
+        return None
+
+
+def _id(value: str) -> int:
+    if not value.isdigit():
+        raise HttpError(400, "Validation failed (numeric string is expected)")
+    return int(value)
+
+
+def _public(user: dict) -> dict:
+    return {key: value for key, value in user.items() if key != "password"}
+
+
+def _required(body: dict, *fields: str) -> None:
+    missing = [field for field in fields if body.get(field) in (None, "")]
+    if missing:
+        raise HttpError(400, [f"{field} should not be empty" for field in missing])
+
+
+class StubApi:
+    """Handlers of the stand-in backend, registered with @route in the Nest controllers' order"""
+
+    def __init__(self, store: Store) -> None:
+        self.store = store
+
+    def dispatch(self, method: str, path: str, body: dict, authorization: str):
+        """Return (status, body) for a request"""
+        path = "/" + path.strip("/") if path != "/" else path
+        for candidate in ROUTES:
+            match = candidate.pattern.match(path)
+            if candidate.method != method or match is None:
+                continue
+            user = self._authenticate(authorization, candidate.auth)
+            params = {name: unquote(value) for name, value in match.groupdict().items()}
+            status = 201 if method == "POST" else 200
+            return status, candidate.handler(self, Request(params, body, user))
+        raise HttpError(404, f"Cannot {method} {path}")
+
+    def _authenticate(self, authorization: str, required: Optional[str]) -> Optional[dict]:
+        if required is None:
+            return None
+        claims = _claims_of(authorization)
+        user = self.store.get("users", claims.get("sub")) if claims else None
+        if user is None or claims.get("exp", 0) <= time.time():
+            raise HttpError(401, "Unauthorized")
+        if required == "admin" and user["role"] != "admin":
+            raise HttpError(403, "Forbidden resource")
+        return user
+
+    # Lookups
+
+    def _row(self, table: str, key, label: str) -> dict:
+        row = self.store.get(table, _id(str(key)))
+        if row is None:
+            raise HttpError(404, f"{label} with ID {key} not found")
+        return row
+
+    def _product(self, product: dict) -> dict:
+        return {**product, "category": self.store.get("categories", product["categoryId"])}
+
+    def _cart(self, cart: dict) -> dict:
+        items = self.store.all("cart_items", lambda item: item["cartId"] == cart["cartId"])
+        items = [{**item, "product": self._product(self.store.get("products", item["productId"]))} for item in items]
+        return {**cart, "items": items}
+
+    def _cart_of(self, user_id: int) -> dict:
+        carts = self.store.all("carts", lambda cart: cart["userId"] == user_id)
+        return carts[0] if carts else self.store.insert("carts", {"userId": user_id})
+
+    def _order(self, order: dict) -> dict:
+        user = self.store.get("users", order["userId"])
+        return {**order, "user": _public(user) if user else None}
+
+    def _address(self, user: dict, key: str) -> dict:
+        address = self._row("addresses", key, "Address")
+        if address["userId"] != user["userId"]:
+            raise HttpError(404, f"Address with ID {key} not found")
+        return address
+
+    # Root
+
+    @route("GET", "/")
+    def hello(self, request):
+        return "Hello World!"
+
+    # Categories
+
+    @route("POST", "/categories")
+    def create_category(self, request):
+        _required(request.body, "name")
+        return self.store.insert("categories", {"name": request.body["name"]})
+
+    @route("GET", "/categories")
+    def categories(self, request):
+        return self.store.all("categories")
+
+    @route("GET", "/categories/{id}")
+    def category(self, request):
+        return self._row("categories", request.params["id"], "Category")
+
+    @route("PATCH", "/categories/{id}")
+    def update_category(self, request):
+        category = self._row("categories", request.params["id"], "Category")
+        return self.store.update("categories", category["categoryId"], {"name": request.body.get("name", category["name"])})
+
+    @route("DELETE", "/categories/{id}")
+    def delete_category(self, request):
+        category = self._row("categories", request.params["id"], "Category")
+        if self.store.all("products", lambda product: product["categoryId"] == category["categoryId"]):
+            raise HttpError(409, "Category still has products")
+        self.store.delete("categories", category["categoryId"])
+        return ""
+
+    # Products
+
+    @route("POST", "/products")
+    def create_product(self, request):
+        _required(request.body, "name", "price", "categoryId")
+        self._row("categories", request.body["categoryId"], "Category")
+        product = {"description": None, "stock": 0, "image": None, "carouselImages": [], **request.body}
+        return self._product(self.store.insert("products", product))
+
+    @route("GET", "/products")
+    def products(self, request):
+        return [self._product(product) for product in self.store.all("products")]
+
+    @route("GET", "/products/{id}")
+    def product(self, request):
+        return self._product(self._row("products", request.params["id"], "Product"))
+
+    @route("PATCH", "/products/{id}")
+    def update_product(self, request):
+        product = self._row("products", request.params["id"], "Product")
+        if "categoryId" in request.body:
+            self._row("categories", request.body["categoryId"], "Category")
+        return self._product(self.store.update("products", product["productId"], request.body))
+
+    @route("DELETE", "/products/{id}")
+    def delete_product(self, request):
+        product = self._row("products", request.params["id"], "Product")
+        for item in self.store.all("cart_items", lambda item: item["productId"] == product["productId"]):
+            self.store.delete("cart_items", item["cartItemId"])
+        self.store.delete("products", product["productId"])
+        return ""
+
+    # Auth
+
+    @route("POST", "/auth/login")
+    def login(self, request):
+        email = str(request.body.get("email", "")).strip().lower()
+        users = self.store.all("users", lambda user: user["email"] == email)
+        if not users or users[0]["password"] != request.body.get("password"):
+            raise HttpError(401, "Invalid credentials")
+        return {"access_token": issue_token(users[0]), "user": _public(users[0])}
+
+    @route("POST", "/auth/register")
+    def register(self, request):
+        user = self.create_user(request)
+        return {"access_token": issue_token(user), "user": user}
+
+    @route("GET", "/auth/profile", auth="user")
+    def profile(self, request):
+        return _public(request.user)
+
+    @route("GET", "/auth/me", auth="user")
+    def me(self, request):
+        return _public(request.user)
+
+    # Users
+
+    @route("POST", "/users")
+    def create_user(self, request):
+        _required(request.body, "name", "email", "password")
+        email = request.body["email"].strip().lower()
+        if self.store.all("users", lambda user: user["email"] == email):
+            raise HttpError(409, "Email already exists")
+        user = {"name": request.body["name"], "email": email, "password": request.body["password"], "role": "client"}
+        return _public(self.store.insert("users", user))
+
+    @route("GET", "/users", auth="admin")
+    def users(self, request):
+        return [_public(user) for user in self.store.all("users")]
+
+    @route("GET", "/users/email/{email}")
+    def user_by_email(self, request):
+        email = request.params["email"].lower()
+        users = self.store.all("users", lambda user: user["email"] == email)
+        if not users:
+            raise HttpError(404, f"User with email {email} not found")
+        return _public(users[0])
+
+    @route("GET", "/users/{id}", auth="admin")
+    def user(self, request):
+        return _public(self._row("users", request.params["id"], "User"))
+
+    @route("PATCH", "/users/profile", auth="user")
+    def update_profile(self, request):
+        changes = {key: request.body[key] for key in ("name", "email", "password") if key in request.body}
+        return _public(self.store.update("users", request.user["userId"], changes))
+
+    @route("PATCH", "/users/{id}", auth="admin")
+    def update_user(self, request):
+        user = self._row("users", request.params["id"], "User")
+        return _public(self.store.update("users", user["userId"], request.body))
+
+    @route("DELETE", "/users/{id}", auth="admin")
+    def delete_user(self, request):
+        user = self._row("users", request.params["id"], "User")
+        self.store.delete("users", user["userId"])
+        return ""
+
+    @route("GET", "/users/profile/addresses", auth="user")
+    def addresses(self, request):
+        return self.store.all("addresses", lambda address: address["userId"] == request.user["userId"])
+
+    @route("POST", "/users/profile/addresses", auth="user")
+    def create_address(self, request):
+        _required(request.body, "title", "street", "city", "state", "zipCode", "country")
+        if request.body.get("type", "both") not in ADDRESS_TYPES:
+            raise HttpError(400, "Type must be shipping, billing, or both")
+        address = {"type": "both", "isDefault": False, **request.body, "userId": request.user["userId"]}
+        address = self.store.insert("addresses", address)
+        if address["isDefault"]:
+            return self._make_default(request.user, address)
+        return address
+
+    @route("GET", "/users/profile/addresses/{id}", auth="user")
+    def address(self, request):
+        return self._address(request.user, request.params["id"])
+
+    @route("PATCH", "/users/profile/addresses/{id}", auth="user")
+    def update_address(self, request):
+        address = self._address(request.user, request.params["id"])
+        return self.store.update("addresses", address["addressId"], {**request.body, "userId": address["userId"]})
+
+    @route("PATCH", "/users/profile/addresses/{id}/default", auth="user")
+    def set_default_address(self, request):
+        return self._make_default(request.user, self._address(request.user, request.params["id"]))
+
+    def _make_default(self, user: dict, address: dict) -> dict:
+        for other in self.store.all("addresses", lambda row: row["userId"] == user["userId"] and row["isDefault"]):
+            self.store.update("addresses", other["addressId"], {"isDefault": False})
+        return self.store.update("addresses", address["addressId"], {"isDefault": True})
+
+    @route("DELETE", "/users/profile/addresses/{id}", auth="user")
+    def delete_address(self, request):
+        self.store.delete("addresses", self._address(request.user, request.params["id"])["addressId"])
+        return ""
+
+    # Cart
+
+    @route("POST", "/cart", auth="user")
+    def create_cart(self, request):
+        return self._cart(self._cart_of(request.user["userId"]))
+
+    @route("GET", "/cart/my-cart", auth="user")
+    def my_cart(self, request):
+        return self._cart(self._cart_of(request.user["userId"]))
+
+    @route("GET", "/cart/user/{userId}", auth="user")
+    def cart_of_user(self, request):
+        carts = self.store.all("carts", lambda cart: cart["userId"] == _id(request.params["userId"]))
+        return self._cart(carts[0]) if carts else None
+
+    @route("GET", "/cart/{id}", auth="user")
+    def cart(self, request):
+        return self._cart(self._row("carts", request.params["id"], "Cart"))
+
+    @route("POST", "/cart/add-item", auth="user")
+    def add_item(self, request):
+        return self._add_item(self._cart_of(request.user["userId"]), request.body)
+
+    @route("POST", "/cart/{id}/items", auth="user")
+    def add_item_to_cart(self, request):
+        return self._add_item(self._row("carts", request.params["id"], "Cart"), request.body)
+
+    def _add_item(self, cart: dict, body: dict) -> dict:
+        _required(body, "productId", "quantity")
+        product = self._row("products", body["productId"], "Product")
+        quantity = int(body["quantity"])
+        existing = self.store.all(
+            "cart_items", lambda item: item["cartId"] == cart["cartId"] and item["productId"] == product["productId"]
+        )
+        total = quantity + (existing[0]["quantity"] if existing else 0)
+        if total > product["stock"]:
+            raise HttpError(400, f"Not enough stock. Available: {product['stock']}, requested: {total}")
+        if existing:
+            return self.store.update("cart_items", existing[0]["cartItemId"], {"quantity": total})
+        return self.store.insert(
+            "cart_items", {"cartId": cart["cartId"], "productId": product["productId"], "quantity": quantity}
+        )
+
+    def _item(self, cart_id: str, item_id: str) -> dict:
+        item = self.store.get("cart_items", _id(item_id))
+        if item is None or item["cartId"] != _id(cart_id):
+            raise HttpError(404, f"Cart item with ID {item_id} not found in cart {cart_id}")
+        return item
+
+    @route("PUT", "/cart/{id}/items/{itemId}/quantity", auth="user")
+    def update_item_quantity(self, request):
+        item = self._item(request.params["id"], request.params["itemId"])
+        quantity = int(request.body.get("quantity", 0))
+        if quantity < 1:
+            raise HttpError(400, "Quantity must be at least 1")
+        stock = self.store.get("products", item["productId"])["stock"]
+        if quantity > stock:
+            raise HttpError(400, f"Not enough stock. Available: {stock}")
+        return self.store.update("cart_items", item["cartItemId"], {"quantity": quantity})
+
+    @route("DELETE", "/cart/{id}/items/{itemId}", auth="user")
+    def remove_item(self, request):
+        self.store.delete("cart_items", self._item(request.params["id"], request.params["itemId"])["cartItemId"])
+        return ""
+
+    @route("DELETE", "/cart/{id}/clear", auth="user")
+    def clear_cart(self, request):
+        cart = self._row("carts", request.params["id"], "Cart")
+        for item in self.store.all("cart_items", lambda item: item["cartId"] == cart["cartId"]):
+            self.store.delete("cart_items", item["cartItemId"])
+        return ""
+
+    @route("GET", "/cart/{id}/total", auth="user")
+    def cart_total(self, request):
+        items = self._cart(self._row("carts", request.params["id"], "Cart"))["items"]
+        return {
+            "itemCount": sum(item["quantity"] for item in items),
+            "total": round(sum(item["quantity"] * item["product"]["price"] for item in items), 2),
+        }
+
+    @route("DELETE", "/cart/{id}", auth="user")
+    def delete_cart(self, request):
+        self.clear_cart(request)
+        self.store.delete("carts", _id(request.params["id"]))
+        return ""
+
+    # Orders
+
+    def _check_status(self, status: str) -> None:
+        if status not in ORDER_STATUSES:
+            raise HttpError(400, "Status must be pending, shipped, delivered, or cancelled")
+
+    @route("POST", "/orders")
+    def create_order(self, request):
+        _required(request.body, "userId", "totalAmount")
+        self._check_status(request.body.get("status", "pending"))
+        self._row("users", request.body["userId"], "User")
+        order = {"status": "pending", **request.body, "date": time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime())}
+        return self.store.insert("orders", order)
+
+    @route("GET", "/orders")
+    def orders(self, request):
+        return [self._order(order) for order in self.store.all("orders")]
+
+    @route("GET", "/orders/user/{userId}")
+    def orders_of_user(self, request):
+        user_id = _id(request.params["userId"])
+        return [self._order(order) for order in self.store.all("orders", lambda order: order["userId"] == user_id)]
+
+    @route("GET", "/orders/{id}")
+    def order(self, request):
+        return self._order(self._row("orders", request.params["id"], "Order"))
+
+    @route("PATCH", "/orders/{id}")
+    def update_order(self, request):
+        order = self._row("orders", request.params["id"], "Order")
+        if "status" in request.body:
+            self._check_status(request.body["status"])
+        return self._order(self.store.update("orders", order["orderId"], request.body))
+
+    @route("PATCH", "/orders/{id}/status/{status}")
+    def update_order_status(self, request):
+        order = self._row("orders", request.params["id"], "Order")
+        self._check_status(request.params["status"])
+        return self._order(self.store.update("orders", order["orderId"], {"status": request.params["status"]}))
+
+    @route("DELETE", "/orders/{id}")
+    def delete_order(self, request):
+        self.store.delete("orders", self._row("orders", request.params["id"], "Order")["orderId"])
+        return ""
+
+    # Admin
+
+    @route("GET", "/admin/dashboard", auth="admin")
+    def dashboard(self, request):
+        users, orders = self.store.all("users"), self.orders(request)
+        return {
+            "totalUsers": len(users),
+            "totalOrders": len(orders),
+            "totalProducts": len(self.store.all("products")),
+            "recentOrders": orders[-5:],
+            "usersByRole": {role: sum(user["role"] == role for user in users) for role in ("admin", "client")},
+        }
+
+    @route("GET", "/admin/users", auth="admin")
+    def admin_users(self, request):
+        return self.users(request)
+
+    @route("GET", "/admin/orders", auth="admin")
+    def admin_orders(self, request):
+        return self.orders(request)
+
+    @route("GET", "/admin/products", auth="admin")
+    def admin_products(self, request):
+        return self.products(request)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    api: StubApi  # set on the subclass made by StubBackend
+
+    def _answer(self, status: int, body) -> None:
+        data = b"" if body == "" else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _handle(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}") if length else {}
+            status, answer = self.api.dispatch(
+                self.command, urlparse(self.path).path, body, self.headers.get("Authorization", "")
+            )
+        except HttpError as e:
+            status, answer = e.status, e.body
+        except ValueError:
+            status, answer = 400, HttpError(400, "Invalid JSON body").body
+        self._answer(status, answer)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+    def do_OPTIONS(self) -> None:
+        self.send_response(204)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Methods", "GET,POST,PUT,PATCH,DELETE,OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type, Authorization")
+        self.end_headers()
+
+    def log_message(self, format, *args) -> None:
+        """Requests are not logged; the suite's own reports say what a test did"""
+
+
+class StubBackend:
+    """The stand-in backend: a Store and a threaded HTTP server answering from it
+
+    Examples::
+
+        backend = StubBackend(port=3000).start()
+        saved = backend.store.snapshot()
+        ...  # a test creates, edits and deletes products
+        backend.store.rollback(saved)
+        backend.stop()
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, store: Optional[Store] = None) -> None:
+        self.store = store or Store.seeded_from()
+        handler = type("StubBackendHandler", (_Handler,), {"api": StubApi(self.store)})
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubBackend":
+        self._thread = threading.Thread(target=self.server.serve_forever, name="stub-backend", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        if self._thread is not None:
+            self._thread.join()
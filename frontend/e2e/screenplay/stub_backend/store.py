@@ -0,0 +1,93 @@
+"""
+Stub Backend Store
+In-memory tables of the stand-in backend, seeded once and rolled back to a
+snapshot after every test
+"""
+import json
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+SEED_PATH = Path(__file__).with_name("seed.json")
+
+# Primary key of each table, named like the Nest entities
+PRIMARY_KEYS = {
+    "categories": "categoryId",
+    "users": "userId",
+    "addresses": "addressId",
+    "products": "productId",
+    "carts": "cartId",
+    "cart_items": "cartItemId",
+    "orders": "orderId",
+}
+
+
+class Snapshot:
+    """The state of every table at one moment; cheap to take and to restore"""
+
+    def __init__(self, tables: Dict[str, Dict[int, dict]], next_ids: Dict[str, int]) -> None:
+        self.tables = tables
+        self.next_ids = next_ids
+
+
+class Store:
+    """Tables of rows keyed by primary key, with copy-on-write snapshots
+
+    Rows are never changed in place: an update stores a new dict under the same
+    key. A snapshot therefore only copies the key -> row mapping of each table
+    (a few dozen references) instead of the rows, and rolling back swaps those
+    mappings back in, whatever the test created, changed or deleted.
+    """
+
+    def __init__(self, seed: Dict[str, List[dict]]) -> None:
+        self.lock = threading.RLock()
+        self.tables: Dict[str, Dict[int, dict]] = {}
+        self.next_ids: Dict[str, int] = {}
+        for table, key in PRIMARY_KEYS.items():
+            rows = seed.get(table, [])
+            self.tables[table] = {row[key]: dict(row) for row in rows}
+            self.next_ids[table] = max(self.tables[table], default=0) + 1
+
+    @classmethod
+    def seeded_from(cls, path=SEED_PATH) -> "Store":
+        return cls(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    def snapshot(self) -> Snapshot:
+        with self.lock:
+            return Snapshot({table: dict(rows) for table, rows in self.tables.items()}, dict(self.next_ids))
+
+    def rollback(self, snapshot: Snapshot) -> None:
+        """Restore the tables taken by snapshot(); the snapshot can be restored again later"""
+        with self.lock:
+            self.tables = {table: dict(rows) for table, rows in snapshot.tables.items()}
+            self.next_ids = dict(snapshot.next_ids)
+
+    def all(self, table: str, where: Optional[Callable[[dict], bool]] = None) -> List[dict]:
+        with self.lock:
+            rows = list(self.tables[table].values())
+        return [row for row in rows if where is None or where(row)]
+
+    def get(self, table: str, key: int) -> Optional[dict]:
+        with self.lock:
+            return self.tables[table].get(key)
+
+    def insert(self, table: str, row: dict) -> dict:
+        with self.lock:
+            key = self.next_ids[table]
+            self.next_ids[table] += 1
+            row = {PRIMARY_KEYS[table]: key, **row}
+            self.tables[table][key] = row
+            return row
+
+    def update(self, table: str, key: int, changes: dict) -> Optional[dict]:
+        with self.lock:
+            row = self.tables[table].get(key)
+            if row is None:
+                return None
+            row = {**row, **changes, PRIMARY_KEYS[table]: key}
+            self.tables[table][key] = row
+            return row
+
+    def delete(self, table: str, key: int) -> Optional[dict]:
+        with self.lock:
+            return self.tables[table].pop(key, None)
@@ -2,64 +2,294 @@
 Pytest Configuration for Screenplay Tests
 Provides shared fixtures and configuration for all tests
 """
+from contextlib import ExitStack
+from functools import partial
+from urllib.parse import urlparse
+
 import pytest
-from screenpy import Actor
 from screenpy_selenium.abilities import BrowseTheWeb
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 
-from pathlib import Path
-from datetime import datetime
+from abilities.reuse_storage_state import ReuseStorageState, StorageStateCache
+from actions.check_for_leaks import MIN_ITERATIONS
+from actors.actor import VallmereActor, create_driver
+from actors.driver_pool import BrowserPool
+from plugins import report_stream, static_frontend, test_selection
+from plugins.browser_logs import BrowserLogPlugin
+from plugins.command_profile import CommandProfilePlugin
+from plugins.duration_history import GATE_MODES, DurationHistoryPlugin
+from plugins.page_metrics import PageMetricsPlugin
+from plugins.scheduler import DurationSchedulerPlugin
+from plugins.screenshots import CAPTURE_MODES, IMAGE_FORMATS, ScreenshotPlugin
+from plugins.step_trace import StepTracePlugin
+from plugins.workers import worker_dir
+from settings import BASE_URL
+from stub_backend.server import StubBackend
+
+# Plugins that watch the actor and its driver during each test (start/finish)
+OBSERVER_PLUGINS = (
+    "vallmere-browser-logs",
+    "vallmere-step-trace",
+    "vallmere-command-profile",
+    "vallmere-page-metrics",
+    "vallmere-duration-history",
+)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--serve-dist",
+        nargs="?",
+        const=str(static_frontend.DEFAULT_DIST),
+        default=None,
+        metavar="DIST",
+        help="Serve the production build (default: frontend/dist/frontend) on the BASE_URL port "
+        "instead of expecting `npm start`",
+    )
+    parser.addoption(
+        "--recycle-browser-after",
+        type=int,
+        default=20,
+        help="Quit and relaunch a pooled browser after it has served this many tests (default: 20)",
+    )
+    parser.addoption(
+        "--no-animations",
+        action="store_true",
+        default=False,
+        help="Make CSS transitions/animations and Angular animations finish on the first frame "
+        "and emulate prefers-reduced-motion in every browser",
+    )
+    parser.addoption(
+        "--toastr-timeout",
+        type=int,
+        default=None,
+        metavar="MS",
+        help="How long ngx-toastr notifications stay open (default: the app's 3000)",
+    )
+    parser.addoption(
+        "--storage-state-ttl",
+        type=float,
+        default=30,
+        help="Minutes a captured login is reused when its token has no expiry; 0 disables the cache (default: 30)",
+    )
+    parser.addoption(
+        "--screenshots",
+        choices=CAPTURE_MODES,
+        default="failed",
+        help="Which tests get a screenshot: failed (default), all or none",
+    )
+    parser.addoption(
+        "--screenshot-format",
+        choices=sorted(IMAGE_FORMATS),
+        default="jpeg",
+        help="Format screenshots are stored in; png is used when Pillow is not installed (default: jpeg)",
+    )
+    parser.addoption(
+        "--screenshot-quality",
+        type=int,
+        default=80,
+        help="JPEG/WebP quality of stored screenshots (default: 80)",
+    )
+    parser.addoption(
+        "--browser-log-size",
+        type=int,
+        default=200,
+        help="Console lines and failed requests kept for a failing test; 0 disables log capture (default: 200)",
+    )
+    parser.addoption(
+        "--browser-network-log",
+        action="store_true",
+        help="Also record Chrome's network events to list the failed XHR/fetch requests of a failing test "
+        "(every test then drains the whole network log of the previous one)",
+    )
+    parser.addoption(
+        "--report-jsonl",
+        default=None,
+        help="Stream one JSON line per finished test to this file and render a lightweight HTML viewer next to it",
+    )
+    parser.addoption(
+        "--trace-steps",
+        default=None,
+        metavar="DIR",
+        help="Write a Chrome trace-event JSON per test into DIR and list the slowest actor steps",
+    )
+    parser.addoption(
+        "--profile-commands",
+        default=None,
+        metavar="PATH",
+        help="Count and time the WebDriver commands of every test per command and page object method, "
+        "write them to PATH as JSON and flag tests with unusually many commands",
+    )
+    parser.addoption(
+        "--max-commands-per-test",
+        type=int,
+        default=None,
+        help="With --profile-commands, also flag every test that sends more WebDriver commands than this",
+    )
+    parser.addoption(
+        "--command-baseline",
+        default=None,
+        metavar="PATH",
+        help="With --profile-commands, flag tests whose command count grew against this earlier profile",
+    )
+    parser.addoption(
+        "--page-metrics",
+        default=None,
+        metavar="PATH",
+        help="Measure Navigation Timing, FCP, LCP, CLS and transferred bytes after every page load "
+        "and write one JSON line per load to PATH",
+    )
+    parser.addoption(
+        "--page-metrics-settle",
+        type=int,
+        default=2000,
+        metavar="MS",
+        help="With --page-metrics, longest wait for the first contentful paint after a load (default: 2000)",
+    )
+    parser.addoption(
+        "--duration-history",
+        default=None,
+        metavar="PATH",
+        help="Record test durations and step timings in this SQLite file and compare them with earlier runs",
+    )
+    parser.addoption(
+        "--duration-window",
+        type=int,
+        default=20,
+        help="With --duration-history, number of earlier passing runs in the baseline (default: 20)",
+    )
+    parser.addoption(
+        "--duration-tolerance",
+        type=float,
+        default=0.25,
+        help="With --duration-history, how far above the baseline p90 a test may get, as a fraction (default: 0.25)",
+    )
+    parser.addoption(
+        "--duration-gate",
+        choices=GATE_MODES,
+        default="warn",
+        help="With --duration-history, warn about slower tests (default) or fail the run",
+    )
+    parser.addoption(
+        "--schedule-by-duration",
+        action="store_true",
+        default=False,
+        help="Under xdist, assign tests to workers longest-first using --duration-history (or source estimates)",
+    )
+    parser.addoption(
+        "--changed-since",
+        default=None,
+        metavar="REF",
+        help="Only run the tests affected by the changes since this git revision (working tree included)",
+    )
+    parser.addoption(
+        "--leak-iterations",
+        type=int,
+        default=0,
+        help="Run the memory-leak tests, repeating each journey this many times (at least 2); 0 skips them (default: 0)",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "without_storage_state: authenticate by writing the session into localStorage, as with --storage-state-ttl=0"
+    )
+    leak_iterations = config.getoption("--leak-iterations")
+    if leak_iterations != 0 and leak_iterations < MIN_ITERATIONS:
+        raise pytest.UsageError(f"--leak-iterations must be 0 (skip the leak tests) or at least {MIN_ITERATIONS}")
+    static_frontend.register(config)
+    config.pluginmanager.register(ScreenshotPlugin(config), "vallmere-screenshots")
+    if config.getoption("--browser-log-size") > 0:
+        plugin = BrowserLogPlugin(config.getoption("--browser-log-size"), config.getoption("--browser-network-log"))
+        config.pluginmanager.register(plugin, "vallmere-browser-logs")
+    report_stream.register(config)
+    if config.getoption("--trace-steps"):
+        config.pluginmanager.register(StepTracePlugin(config.getoption("--trace-steps")), "vallmere-step-trace")
+    if config.getoption("--profile-commands"):
+        config.pluginmanager.register(CommandProfilePlugin(config), "vallmere-command-profile")
+    if config.getoption("--page-metrics"):
+        config.pluginmanager.register(PageMetricsPlugin(config), "vallmere-page-metrics")
+    if config.getoption("--duration-history"):
+        config.pluginmanager.register(DurationHistoryPlugin(config), "vallmere-duration-history")
+    if config.getoption("--schedule-by-duration"):
+        config.pluginmanager.register(DurationSchedulerPlugin(), "vallmere-duration-scheduler")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--changed-since"):
+        test_selection.deselect_unaffected(config, items)
+
+
+@pytest.fixture(scope="session")
+def browser_pool(request):
+    """Pool de navegadores reutilizados durante toda la sesión (uno por worker de xdist)."""
+    factory = partial(
+        create_driver,
+        animations=not request.config.getoption("--no-animations"),
+        toastr_timeout=request.config.getoption("--toastr-timeout"),
+        network_log=request.config.getoption("--browser-network-log"),
+    )
+    pool = BrowserPool(factory, max_uses=request.config.getoption("--recycle-browser-after"))
+
+    yield pool
+
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def storage_states(request):
+    """Sesiones por rol guardadas en disco y reutilizadas mientras sigan vigentes (None si la caché está desactivada)."""
+    ttl_minutes = request.config.getoption("--storage-state-ttl")
+    if ttl_minutes <= 0:
+        return None
+    base = urlparse(BASE_URL)
+    return StorageStateCache(
+        worker_dir(".storage_state", request.config), ttl_seconds=ttl_minutes * 60, origin=f"{base.scheme}://{base.netloc}"
+    )
+
+
+@pytest.fixture(scope="session")
+def stub_backend():
+    """Backend de reemplazo en memoria en un puerto libre (`url`), arrancado una vez por sesión y por worker de xdist."""
+    backend = StubBackend().start()
+
+    yield backend
+
+    backend.stop()
 
 
 @pytest.fixture
-def actor(request):
+def backend(stub_backend):
+    """El backend de reemplazo; lo que el test cree, edite o borre se deshace al terminar."""
+    before = stub_backend.store.snapshot()
+
+    yield stub_backend
+
+    stub_backend.store.rollback(before)
+
+
+@pytest.fixture
+def leak_iterations(request):
+    """Vueltas que repiten los tests de fugas de memoria; se saltan si no se pidió --leak-iterations."""
+    iterations = request.config.getoption("--leak-iterations")
+    if iterations <= 0:
+        pytest.skip("memory-leak tests only run with --leak-iterations=N")
+    return iterations
+
+
+@pytest.fixture
+def actor(request, browser_pool, storage_states):
     """Provee un actor con capacidad de navegar con Selenium."""
-    options = Options()
-    options.add_argument("--window-size=1920,1080")
-    options.add_argument("--headless=new")  # Comenta esta línea si deseas ver el navegador
-    options.add_argument("--disable-gpu")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")  # Prevent shared memory issues
-
-    driver = webdriver.Chrome(service=Service(), options=options)
-    test_actor = Actor.named("User").who_can(BrowseTheWeb.using(driver))
-
-    yield test_actor
-
-    driver.quit()
-
-
-@pytest.hookimpl(hookwrapper=True)
-def pytest_runtest_makereport(item, call):
-    """
-    Hook to capture screenshots after each test execution.
-    Screenshots are saved with test name, status (PASSED/FAILED) and timestamp.
-    """
-    from screenpy_selenium.abilities import BrowseTheWeb
-
-    outcome = yield
-    rep = outcome.get_result()
-
-    if rep.when == "call" and "actor" in item.funcargs:
-        actor = item.funcargs["actor"]
-        try:
-            screenshot_dir = Path("screenshots")
-            screenshot_dir.mkdir(exist_ok=True)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            status = "PASSED" if rep.passed else "FAILED"
-            screenshot_path = screenshot_dir / f"{item.name}_{status}_{timestamp}.png"
-
-            browser = actor.ability_to(BrowseTheWeb).browser
-            browser.save_screenshot(str(screenshot_path))
-
-            # Agregar imagen al reporte HTML si pytest-html está presente
-            pytest_html = item.config.pluginmanager.get_plugin("html")
-            if pytest_html:
-                extra = getattr(rep, "extras", [])
-                extra.append(pytest_html.extras.image(str(screenshot_path)))
-                rep.extras = extra
-
-        except Exception as e:
-            print(f"Error al capturar la pantalla: {e}")
+    driver = browser_pool.acquire()
+    test_actor = VallmereActor.named("User").who_can(BrowseTheWeb.using(driver))
+    # without_storage_state: the test takes the path --storage-state-ttl=0 gives every test
+    if storage_states is not None and request.node.get_closest_marker("without_storage_state") is None:
+        test_actor.who_can(ReuseStorageState.from_cache(storage_states))
+    observers = [plugin for plugin in map(request.config.pluginmanager.get_plugin, OBSERVER_PLUGINS) if plugin]
+    # The browser goes back to the pool even if an observer fails to start or finish
+    with ExitStack() as cleanup:
+        cleanup.callback(browser_pool.release, driver)
+        for observer in observers:
+            observer.start(test_actor, driver)
+            cleanup.callback(observer.finish, request.node, test_actor)
+
+        yield test_actor
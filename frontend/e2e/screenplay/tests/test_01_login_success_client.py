@@ -2,8 +2,8 @@
 Test 01 - Auth - Login Success (Client)
 Verifies that a valid client can successfully log in to the Vallmere application
 """
-import time
 from screenpy_selenium.actions import Open, Wait
+from actions.wait_for_angular import WaitForAngular
 from pages.vallmere_login_page import VallmereLoginPage
 
 
@@ -29,8 +29,8 @@ def test_01_login_success_client(actor):
         VallmereLoginPage.click_login_button()
     )
     
-    # Brief pause to allow processing
-    time.sleep(1.5)
+    # Wait for the login to be processed
+    actor.attempts_to(WaitForAngular.to_settle())
     
     # Then - Verify success toast appears and user is redirected to profile
     actor.attempts_to(
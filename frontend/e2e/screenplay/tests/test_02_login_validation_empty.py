@@ -2,8 +2,8 @@
 Test 02 - Auth - Login Validation (Empty Fields)
 Verifies that the login form shows validation errors when submitted with empty fields
 """
-import time
 from screenpy_selenium.actions import Open
+from actions.wait_for_angular import WaitForAngular
 from pages.vallmere_login_page import VallmereLoginPage
 
 
@@ -25,8 +25,8 @@ def test_02_login_validation_empty(actor):
         VallmereLoginPage.click_login_button()
     )
     
-    # Brief pause to allow validation to display
-    time.sleep(0.5)
+    # Wait for the validation message to render
+    actor.attempts_to(WaitForAngular.to_settle())
     
     # Then - Verify error message appears
     actor.attempts_to(
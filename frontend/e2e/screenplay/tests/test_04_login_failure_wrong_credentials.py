@@ -2,8 +2,8 @@
 Test 04 - Auth - Login Failure (Wrong Credentials)
 Verifies that login fails with incorrect credentials and shows error toast
 """
-import time
 from screenpy_selenium.actions import Open
+from actions.wait_for_angular import WaitForAngular
 from pages.vallmere_login_page import VallmereLoginPage
 
 
@@ -28,8 +28,8 @@ def test_04_login_failure_wrong_credentials(actor):
         VallmereLoginPage.click_login_button()
     )
     
-    # Brief pause to allow server response
-    time.sleep(1.0)
+    # Wait for the rejected login to answer with the error toast
+    actor.attempts_to(WaitForAngular.to_settle())
     
     # Then - Verify error toast appears
     actor.attempts_to(
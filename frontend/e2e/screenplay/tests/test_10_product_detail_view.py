@@ -2,7 +2,6 @@
 Test 10 - Product - Detail View & Carousel
 Verifies that clicking a product shows the detailed product view with all information
 """
-import time
 from screenpy_selenium.actions import Open
 from pages.vallmere_landing_page import VallmereLandingPage
 from pages.vallmere_product_page import VallmereProductPage
@@ -27,19 +26,7 @@ def test_10_product_detail_view(actor):
         VallmereLandingPage.click_first_product()
     )
     
-    # Wait for product detail page to load
-    actor.attempts_to(
-        VallmereProductPage.wait_for_product_detail()
-    )
-    
     # Then - Verify product detail page displays all information
     actor.attempts_to(
-        VallmereProductPage.product_detail_is_visible(),
-        VallmereProductPage.product_title_is_visible(),
-        VallmereProductPage.product_price_is_visible(),
-        VallmereProductPage.product_description_is_visible()
+        VallmereProductPage.product_information_is_visible()
     )
-    
-    # Brief pause to allow complete rendering
-    time.sleep(0.5)
-
@@ -33,11 +33,9 @@ def test_14_cart_empty_state(actor):
     
     # When - Click cart icon
     actor.attempts_to(
-        VallmereCartPage.click_cart_icon()
+        VallmereCartPage.open_cart()
     )
     
-    time.sleep(1.5)  # Wait for cart animation
-    
     # Then - Verify empty cart message with JavaScript check
     browser = actor.ability_to(BrowseTheWeb).browser
     empty_cart_visible = browser.execute_script("""
@@ -4,10 +4,9 @@ Verifies that a user can successfully add a product to the shopping cart
 NOTE: Requires user authentication to add items to cart
 """
 import time
-from screenpy_selenium.actions import Open
-from screenpy_selenium.abilities import BrowseTheWeb
+from actions.authenticate_directly import AuthenticateDirectly
 from pages.vallmere_product_page import VallmereProductPage
-from pages.vallmere_login_page import VallmereLoginPage
+from questions.cart_contents import CartContents
 
 
 def test_15_product_add_to_cart_success(actor):
@@ -19,38 +18,18 @@ def test_15_product_add_to_cart_success(actor):
     Then the product should be added to the cart
     And the cart badge should show the item count
     """
-    # Given - User logs in first (required for cart operations)
+    # Given - User is logged in (required for cart operations) and on the product page
     actor.attempts_to(
-        Open.browser_on("http://localhost:4200/login"),
-        VallmereLoginPage.wait_for_email_field(),
-        VallmereLoginPage.enter_email("cliente@vallmere.com"),
-        VallmereLoginPage.enter_password("cliente123"),
-        VallmereLoginPage.click_login_button()
+        AuthenticateDirectly.as_client().then_open("/product/5")
     )
     
-    # Wait for login to complete
-    time.sleep(2.0)
-    
-    # Given - Navigate to product page using browser.get() to maintain session
-    browser = actor.ability_to(BrowseTheWeb).browser
-    browser.get("http://localhost:4200/product/5")
-    
     # Wait for the add to cart button to be ready
     actor.attempts_to(
         VallmereProductPage.wait_for_add_to_cart_button()
     )
     
     # Get initial cart count from cart_items storage (not from cart.items)
-    initial_cart_count = browser.execute_script("""
-        const cartItems = JSON.parse(localStorage.getItem('vallmere_cart_items') || '[]');
-        const carts = JSON.parse(localStorage.getItem('vallmere_carts') || '[]');
-        const user = JSON.parse(localStorage.getItem('currentUser'));
-        if (!user) return 0;
-        const userCart = carts.find(c => c.userId === user.userId);
-        if (!userCart) return 0;
-        // Count items that belong to this user's cart
-        return cartItems.filter(item => item.cartId === userCart.cartId).length;
-    """)
+    initial_cart_count = CartContents.count().answered_by(actor)
     
     # When - Click the "Add to Cart" button
     actor.attempts_to(
@@ -61,31 +40,15 @@ def test_15_product_add_to_cart_success(actor):
     time.sleep(2.0)
     
     # Then - Verify product was added to cart by checking cart_items storage
-    final_cart_count = browser.execute_script("""
-        const cartItems = JSON.parse(localStorage.getItem('vallmere_cart_items') || '[]');
-        const carts = JSON.parse(localStorage.getItem('vallmere_carts') || '[]');
-        const user = JSON.parse(localStorage.getItem('currentUser'));
-        if (!user) return 0;
-        const userCart = carts.find(c => c.userId === user.userId);
-        if (!userCart) return 0;
-        // Count items that belong to this user's cart
-        return cartItems.filter(item => item.cartId === userCart.cartId).length;
-    """)
+    cart = CartContents.of_the_current_user().answered_by(actor)
+    final_cart_count = cart.count
     
     # Assert that cart count increased
     assert final_cart_count > initial_cart_count, \
         f"Cart should have more items. Initial: {initial_cart_count}, Final: {final_cart_count}"
     
     # Verify the specific product (ID 5) is in the cart
-    product_in_cart = browser.execute_script("""
-        const cartItems = JSON.parse(localStorage.getItem('vallmere_cart_items') || '[]');
-        const carts = JSON.parse(localStorage.getItem('vallmere_carts') || '[]');
-        const user = JSON.parse(localStorage.getItem('currentUser'));
-        if (!user) return false;
-        const userCart = carts.find(c => c.userId === user.userId);
-        if (!userCart) return false;
-        return cartItems.some(item => item.cartId === userCart.cartId && item.productId === 5);
-    """)
+    product_in_cart = cart.contains(5)
     
     assert product_in_cart, "Product ID 5 should be in the cart"
     
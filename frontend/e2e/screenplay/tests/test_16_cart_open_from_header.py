@@ -3,12 +3,11 @@ Test 16 - Cart - Open Cart from Header
 Verifies that cart can be opened from header after adding items
 """
 import time
-from screenpy_selenium.actions import Open
 from screenpy_selenium.abilities import BrowseTheWeb
+from actions.authenticate_directly import AuthenticateDirectly
 from pages.vallmere_product_page import VallmereProductPage
 from pages.vallmere_cart_page import VallmereCartPage
 from pages.vallmere_header_page import VallmereHeaderPage
-from pages.vallmere_login_page import VallmereLoginPage
 
 
 def test_16_cart_open_from_header(actor):
@@ -20,17 +19,10 @@ def test_16_cart_open_from_header(actor):
     """
     # Given - Login and add product to cart
     actor.attempts_to(
-        Open.browser_on("http://localhost:4200/login"),
-        VallmereLoginPage.wait_for_email_field(),
-        VallmereLoginPage.enter_email("cliente@vallmere.com"),
-        VallmereLoginPage.enter_password("cliente123"),
-        VallmereLoginPage.click_login_button()
+        AuthenticateDirectly.as_client().then_open("/product/5")
     )
     
-    time.sleep(2.0)
-    
     browser = actor.ability_to(BrowseTheWeb).browser
-    browser.get("http://localhost:4200/product/5")
     
     actor.attempts_to(
         VallmereProductPage.wait_for_add_to_cart_button(),
@@ -47,11 +39,9 @@ def test_16_cart_open_from_header(actor):
     )
     
     actor.attempts_to(
-        VallmereCartPage.click_cart_icon()
+        VallmereCartPage.open_cart()
     )
     
-    time.sleep(1.5)  # Wait for cart animation
-    
     # Then - Verify cart is visible with JavaScript
     browser = actor.ability_to(BrowseTheWeb).browser
     cart_open = browser.execute_script("""
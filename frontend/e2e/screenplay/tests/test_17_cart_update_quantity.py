@@ -2,12 +2,9 @@
 Test 17 - Cart - Update Item Quantity
 Verifies that item quantity can be updated in cart
 """
-import time
-from screenpy_selenium.actions import Open
-from screenpy_selenium.abilities import BrowseTheWeb
+from actions.authenticate_directly import AuthenticateDirectly
 from pages.vallmere_product_page import VallmereProductPage
 from pages.vallmere_cart_page import VallmereCartPage
-from pages.vallmere_login_page import VallmereLoginPage
 
 
 def test_17_cart_update_quantity(actor):
@@ -19,51 +16,19 @@ def test_17_cart_update_quantity(actor):
     """
     # Given - Login and add product
     actor.attempts_to(
-        Open.browser_on("http://localhost:4200/login"),
-        VallmereLoginPage.wait_for_email_field(),
-        VallmereLoginPage.enter_email("cliente@vallmere.com"),
-        VallmereLoginPage.enter_password("cliente123"),
-        VallmereLoginPage.click_login_button()
-    )
-    
-    time.sleep(2.0)
-    
-    browser = actor.ability_to(BrowseTheWeb).browser
-    browser.get("http://localhost:4200/product/5")
-    
-    actor.attempts_to(
+        AuthenticateDirectly.as_client().then_open("/product/5"),
         VallmereProductPage.wait_for_add_to_cart_button(),
         VallmereProductPage.click_add_to_cart()
     )
     
-    time.sleep(1.5)
-    
-    # When - Open cart and increase quantity
+    # When - Open cart, wait for the item, read its quantity and increase it (one script call)
+    increase = VallmereCartPage.open_cart_and_increase_first_item()
     actor.attempts_to(
-        VallmereCartPage.click_cart_icon()
+        increase
     )
+    initial_quantity = int(increase.results[2])
     
-    time.sleep(1.5)  # Wait for cart animation
-    
-    # Verify cart item exists
-    browser = actor.ability_to(BrowseTheWeb).browser
-    initial_quantity = browser.execute_script("""
-        const quantityEl = document.querySelector('.cart-item .quantity');
-        return quantityEl ? parseInt(quantityEl.textContent) : 0;
-    """)
-    
-    # When - Click increase quantity
+    # Then - Verify quantity increased
     actor.attempts_to(
-        VallmereCartPage.click_increase_quantity()
+        VallmereCartPage.first_item_quantity_becomes(initial_quantity + 1)
     )
-    
-    time.sleep(1.5)
-    
-    # Then - Verify quantity increased
-    final_quantity = browser.execute_script("""
-        const quantityEl = document.querySelector('.cart-item .quantity');
-        return quantityEl ? parseInt(quantityEl.textContent) : 0;
-    """)
-    
-    assert final_quantity > initial_quantity, f"Quantity should increase. Initial: {initial_quantity}, Final: {final_quantity}"
-
@@ -3,11 +3,10 @@ Test 18 - Cart - Remove Item
 Verifies that items can be removed from cart
 """
 import time
-from screenpy_selenium.actions import Open
 from screenpy_selenium.abilities import BrowseTheWeb
+from actions.authenticate_directly import AuthenticateDirectly
 from pages.vallmere_product_page import VallmereProductPage
 from pages.vallmere_cart_page import VallmereCartPage
-from pages.vallmere_login_page import VallmereLoginPage
 
 
 def test_18_cart_remove_item(actor):
@@ -19,17 +18,10 @@ def test_18_cart_remove_item(actor):
     """
     # Given - Login and add product
     actor.attempts_to(
-        Open.browser_on("http://localhost:4200/login"),
-        VallmereLoginPage.wait_for_email_field(),
-        VallmereLoginPage.enter_email("cliente@vallmere.com"),
-        VallmereLoginPage.enter_password("cliente123"),
-        VallmereLoginPage.click_login_button()
+        AuthenticateDirectly.as_client().then_open("/product/5")
     )
     
-    time.sleep(2.0)
-    
     browser = actor.ability_to(BrowseTheWeb).browser
-    browser.get("http://localhost:4200/product/5")
     
     actor.attempts_to(
         VallmereProductPage.wait_for_add_to_cart_button(),
@@ -40,11 +32,9 @@ def test_18_cart_remove_item(actor):
     
     # When - Open cart and remove item
     actor.attempts_to(
-        VallmereCartPage.click_cart_icon()
+        VallmereCartPage.open_cart()
     )
     
-    time.sleep(1.5)  # Wait for cart animation
-    
     # Verify cart has items
     browser = actor.ability_to(BrowseTheWeb).browser
     initial_items = browser.execute_script("""
@@ -3,8 +3,7 @@ Test 21 - Profile - Edit Mode Toggle
 Verifies that edit profile mode can be toggled
 """
 import time
-from screenpy_selenium.actions import Open
-from pages.vallmere_login_page import VallmereLoginPage
+from actions.authenticate_directly import AuthenticateDirectly
 from pages.vallmere_profile_page import VallmereProfilePage
 
 
@@ -17,15 +16,9 @@ def test_21_profile_edit_mode_toggle(actor):
     """
     # Given - Login
     actor.attempts_to(
-        Open.browser_on("http://localhost:4200/login"),
-        VallmereLoginPage.wait_for_email_field(),
-        VallmereLoginPage.enter_email("cliente@vallmere.com"),
-        VallmereLoginPage.enter_password("cliente123"),
-        VallmereLoginPage.click_login_button()
+        AuthenticateDirectly.as_client()
     )
     
-    time.sleep(2.0)
-    
     # When - Click edit profile
     actor.attempts_to(
         VallmereProfilePage.wait_for_profile_container(),
@@ -3,9 +3,8 @@ Test 22 - Profile - Update Name
 Verifies that user can update their name
 """
 import time
-from screenpy_selenium.actions import Open
 from screenpy_selenium.abilities import BrowseTheWeb
-from pages.vallmere_login_page import VallmereLoginPage
+from actions.authenticate_directly import AuthenticateDirectly
 from pages.vallmere_profile_page import VallmereProfilePage
 
 
@@ -18,15 +17,9 @@ def test_22_profile_update_name(actor):
     """
     # Given - Login
     actor.attempts_to(
-        Open.browser_on("http://localhost:4200/login"),
-        VallmereLoginPage.wait_for_email_field(),
-        VallmereLoginPage.enter_email("cliente@vallmere.com"),
-        VallmereLoginPage.enter_password("cliente123"),
-        VallmereLoginPage.click_login_button()
+        AuthenticateDirectly.as_client()
     )
     
-    time.sleep(2.0)
-    
     # When - Edit profile and update name
     actor.attempts_to(
         VallmereProfilePage.wait_for_profile_container(),
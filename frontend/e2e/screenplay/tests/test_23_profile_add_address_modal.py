@@ -3,8 +3,7 @@ Test 23 - Profile - Add Address Modal
 Verifies that add address modal can be opened
 """
 import time
-from screenpy_selenium.actions import Open
-from pages.vallmere_login_page import VallmereLoginPage
+from actions.authenticate_directly import AuthenticateDirectly
 from pages.vallmere_profile_page import VallmereProfilePage
 
 
@@ -17,15 +16,9 @@ def test_23_profile_add_address_modal(actor):
     """
     # Given - Login
     actor.attempts_to(
-        Open.browser_on("http://localhost:4200/login"),
-        VallmereLoginPage.wait_for_email_field(),
-        VallmereLoginPage.enter_email("cliente@vallmere.com"),
-        VallmereLoginPage.enter_password("cliente123"),
-        VallmereLoginPage.click_login_button()
+        AuthenticateDirectly.as_client()
     )
     
-    time.sleep(2.0)
-    
     # When - Click add address
     actor.attempts_to(
         VallmereProfilePage.wait_for_profile_container(),
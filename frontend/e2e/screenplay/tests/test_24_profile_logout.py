@@ -3,9 +3,8 @@ Test 24 - Profile - Logout
 Verifies that user can logout successfully
 """
 import time
-from screenpy_selenium.actions import Open
 from screenpy_selenium.abilities import BrowseTheWeb
-from pages.vallmere_login_page import VallmereLoginPage
+from actions.authenticate_directly import AuthenticateDirectly
 from pages.vallmere_profile_page import VallmereProfilePage
 
 
@@ -18,15 +17,9 @@ def test_24_profile_logout(actor):
     """
     # Given - Login
     actor.attempts_to(
-        Open.browser_on("http://localhost:4200/login"),
-        VallmereLoginPage.wait_for_email_field(),
-        VallmereLoginPage.enter_email("cliente@vallmere.com"),
-        VallmereLoginPage.enter_password("cliente123"),
-        VallmereLoginPage.click_login_button()
+        AuthenticateDirectly.as_client()
     )
     
-    time.sleep(2.0)
-    
     # When - Logout
     actor.attempts_to(
         VallmereProfilePage.wait_for_profile_container(),
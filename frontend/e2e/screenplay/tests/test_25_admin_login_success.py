@@ -2,8 +2,8 @@
 Test 25 - Admin - Login Success
 Verifies that admin can login successfully
 """
-import time
 from screenpy_selenium.actions import Open
+from actions.wait_for_angular import WaitForAngular
 from pages.vallmere_admin_login_page import VallmereAdminLoginPage
 from pages.vallmere_admin_page import VallmereAdminPage
 
@@ -28,7 +28,7 @@ def test_25_admin_login_success(actor):
         VallmereAdminLoginPage.click_login_button()
     )
     
-    time.sleep(2.0)
+    actor.attempts_to(WaitForAngular.to_settle())
     
     # Then - Verify admin panel is visible
     actor.attempts_to(
@@ -2,9 +2,9 @@
 Test 26 - Admin - Login Validation (Wrong Credentials)
 Verifies that invalid admin credentials show error
 """
-import time
 from screenpy_selenium.actions import Open
 from screenpy_selenium.abilities import BrowseTheWeb
+from actions.wait_for_angular import WaitForAngular
 from pages.vallmere_admin_login_page import VallmereAdminLoginPage
 
 
@@ -28,7 +28,7 @@ def test_26_admin_login_validation(actor):
         VallmereAdminLoginPage.click_login_button()
     )
     
-    time.sleep(2.0)
+    actor.attempts_to(WaitForAngular.to_settle())
     
     # Then - Verify still on login page (didn't navigate away)
     browser = actor.ability_to(BrowseTheWeb).browser
@@ -3,9 +3,8 @@ Test 27 - Admin - View Products List
 Verifies that admin can view products list
 """
 import time
-from screenpy_selenium.actions import Open
 from screenpy_selenium.abilities import BrowseTheWeb
-from pages.vallmere_admin_login_page import VallmereAdminLoginPage
+from actions.authenticate_directly import AuthenticateDirectly
 from pages.vallmere_admin_page import VallmereAdminPage
 
 
@@ -18,15 +17,9 @@ def test_27_admin_view_products(actor):
     """
     # Given - Login as admin
     actor.attempts_to(
-        Open.browser_on("http://localhost:4200/admin-login"),
-        VallmereAdminLoginPage.wait_for_email_field(),
-        VallmereAdminLoginPage.enter_email("admin@vallmere.com"),
-        VallmereAdminLoginPage.enter_password("admin123"),
-        VallmereAdminLoginPage.click_login_button()
+        AuthenticateDirectly.as_admin()
     )
     
-    time.sleep(3.0)  # Wait longer for admin panel to load
-    
     # When - Click view products (should be selected by default)
     browser = actor.ability_to(BrowseTheWeb).browser
     admin_panel_visible = browser.execute_script("""
@@ -3,9 +3,8 @@ Test 28 - Admin - Search Products
 Verifies that admin can search products
 """
 import time
-from screenpy_selenium.actions import Open
 from screenpy_selenium.abilities import BrowseTheWeb
-from pages.vallmere_admin_login_page import VallmereAdminLoginPage
+from actions.authenticate_directly import AuthenticateDirectly
 from pages.vallmere_admin_page import VallmereAdminPage
 
 
@@ -18,15 +17,9 @@ def test_28_admin_search_products(actor):
     """
     # Given - Login and view products
     actor.attempts_to(
-        Open.browser_on("http://localhost:4200/admin-login"),
-        VallmereAdminLoginPage.wait_for_email_field(),
-        VallmereAdminLoginPage.enter_email("admin@vallmere.com"),
-        VallmereAdminLoginPage.enter_password("admin123"),
-        VallmereAdminLoginPage.click_login_button()
+        AuthenticateDirectly.as_admin()
     )
     
-    time.sleep(3.0)
-    
     browser = actor.ability_to(BrowseTheWeb).browser
     
     actor.attempts_to(
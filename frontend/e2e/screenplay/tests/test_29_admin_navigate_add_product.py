@@ -3,8 +3,7 @@ Test 29 - Admin - Navigate to Add Product
 Verifies that admin can navigate to add product form
 """
 import time
-from screenpy_selenium.actions import Open
-from pages.vallmere_admin_login_page import VallmereAdminLoginPage
+from actions.authenticate_directly import AuthenticateDirectly
 from pages.vallmere_admin_page import VallmereAdminPage
 
 
@@ -17,15 +16,9 @@ def test_29_admin_navigate_add_product(actor):
     """
     # Given - Login as admin
     actor.attempts_to(
-        Open.browser_on("http://localhost:4200/admin-login"),
-        VallmereAdminLoginPage.wait_for_email_field(),
-        VallmereAdminLoginPage.enter_email("admin@vallmere.com"),
-        VallmereAdminLoginPage.enter_password("admin123"),
-        VallmereAdminLoginPage.click_login_button()
+        AuthenticateDirectly.as_admin()
     )
     
-    time.sleep(2.0)
-    
     # When - Click add product
     actor.attempts_to(
         VallmereAdminPage.wait_for_admin_panel(),
@@ -3,9 +3,8 @@ Test 30 - Admin - Add Product Validation (Empty Form)
 Verifies that empty product form shows validation errors
 """
 import time
-from screenpy_selenium.actions import Open
 from screenpy_selenium.abilities import BrowseTheWeb
-from pages.vallmere_admin_login_page import VallmereAdminLoginPage
+from actions.authenticate_directly import AuthenticateDirectly
 from pages.vallmere_admin_page import VallmereAdminPage
 
 
@@ -18,15 +17,9 @@ def test_30_admin_add_product_validation(actor):
     """
     # Given - Login and navigate to add product
     actor.attempts_to(
-        Open.browser_on("http://localhost:4200/admin-login"),
-        VallmereAdminLoginPage.wait_for_email_field(),
-        VallmereAdminLoginPage.enter_email("admin@vallmere.com"),
-        VallmereAdminLoginPage.enter_password("admin123"),
-        VallmereAdminLoginPage.click_login_button()
+        AuthenticateDirectly.as_admin()
     )
     
-    time.sleep(2.0)
-    
     actor.attempts_to(
         VallmereAdminPage.wait_for_admin_panel(),
         VallmereAdminPage.click_add_product()
@@ -3,9 +3,8 @@ Test 31 - Admin - Edit Product Complete
 Verifies that admin can edit a product
 """
 import time
-from screenpy_selenium.actions import Open
 from screenpy_selenium.abilities import BrowseTheWeb
-from pages.vallmere_admin_login_page import VallmereAdminLoginPage
+from actions.authenticate_directly import AuthenticateDirectly
 from pages.vallmere_admin_page import VallmereAdminPage
 
 
@@ -18,23 +17,15 @@ def test_31_admin_edit_product(actor):
     """
     # Given - Login and view products
     actor.attempts_to(
-        Open.browser_on("http://localhost:4200/admin-login"),
-        VallmereAdminLoginPage.wait_for_email_field(),
-        VallmereAdminLoginPage.enter_email("admin@vallmere.com"),
-        VallmereAdminLoginPage.enter_password("admin123"),
-        VallmereAdminLoginPage.click_login_button()
+        AuthenticateDirectly.as_admin()
     )
     
-    time.sleep(3.0)
-    
     browser = actor.ability_to(BrowseTheWeb).browser
     
     actor.attempts_to(
         VallmereAdminPage.click_view_products()
     )
     
-    time.sleep(1.5)
-    
     # When - Click edit on first product
     actor.attempts_to(
         VallmereAdminPage.click_edit_first()
@@ -3,11 +3,11 @@ Test 41 - Cart - Add Multiple Different Products
 Verifies that multiple different products can be added to cart
 """
 import time
-from screenpy_selenium.actions import Open
 from screenpy_selenium.abilities import BrowseTheWeb
+from actions.authenticate_directly import AuthenticateDirectly
 from pages.vallmere_product_page import VallmereProductPage
 from pages.vallmere_cart_page import VallmereCartPage
-from pages.vallmere_login_page import VallmereLoginPage
+from questions.cart_contents import CartContents
 
 
 def test_41_multiple_products_to_cart(actor):
@@ -17,21 +17,14 @@ def test_41_multiple_products_to_cart(actor):
     When the user adds product 5 and product 6 to cart
     Then both products should be in the cart
     """
-    # Given - Login
+    # Given - Login, landing on the first product
     actor.attempts_to(
-        Open.browser_on("http://localhost:4200/login"),
-        VallmereLoginPage.wait_for_email_field(),
-        VallmereLoginPage.enter_email("cliente@vallmere.com"),
-        VallmereLoginPage.enter_password("cliente123"),
-        VallmereLoginPage.click_login_button()
+        AuthenticateDirectly.as_client().then_open("/product/5")
     )
     
-    time.sleep(2.0)
-    
     browser = actor.ability_to(BrowseTheWeb).browser
     
     # When - Add first product
-    browser.get("http://localhost:4200/product/5")
     actor.attempts_to(
         VallmereProductPage.wait_for_add_to_cart_button(),
         VallmereProductPage.click_add_to_cart()
@@ -59,20 +52,15 @@ def test_41_multiple_products_to_cart(actor):
     
     # Then - Verify cart has items
     actor.attempts_to(
-        VallmereCartPage.click_cart_icon()
+        VallmereCartPage.open_cart()
     )
     
-    time.sleep(0.8)
-    
     actor.attempts_to(
         VallmereCartPage.cart_item_is_visible()
     )
     
     # Verify at least one item via localStorage
-    cart_item_count = browser.execute_script("""
-        const cartItems = JSON.parse(localStorage.getItem('vallmere_cart_items') || '[]');
-        return cartItems.length;
-    """)
+    cart_item_count = CartContents.stored_item_count().answered_by(actor)
     
     assert cart_item_count >= 1, f"Expected at least 1 item in cart, got {cart_item_count}"
 
@@ -5,6 +5,7 @@ Verifies that user can login successfully after a failed attempt
 import time
 from screenpy_selenium.actions import Open
 from screenpy_selenium.abilities import BrowseTheWeb
+from actions.wait_for_angular import WaitForAngular
 from pages.vallmere_login_page import VallmereLoginPage
 from pages.vallmere_profile_page import VallmereProfilePage
 
@@ -29,7 +30,7 @@ def test_43_login_after_failed_attempt(actor):
         VallmereLoginPage.click_login_button()
     )
     
-    time.sleep(1.5)
+    actor.attempts_to(WaitForAngular.to_settle())
     
     # Error toast should appear
     actor.attempts_to(
@@ -53,7 +54,7 @@ def test_43_login_after_failed_attempt(actor):
         VallmereLoginPage.click_login_button()
     )
     
-    time.sleep(2.0)
+    actor.attempts_to(WaitForAngular.to_settle())
     
     # Then - Verify successful login
     assert "/profile" in browser.current_url, "Should be redirected to profile"
@@ -3,12 +3,14 @@ Test 44 - Cart - Cart Persistence After Logout and Re-login
 Verifies that cart items persist after logout and re-login
 """
 import time
-from screenpy_selenium.actions import Open
 from screenpy_selenium.abilities import BrowseTheWeb
+from actions.authenticate_directly import AuthenticateDirectly
+from actions.wait_for_angular import WaitForAngular
 from pages.vallmere_product_page import VallmereProductPage
 from pages.vallmere_cart_page import VallmereCartPage
 from pages.vallmere_login_page import VallmereLoginPage
 from pages.vallmere_profile_page import VallmereProfilePage
+from questions.cart_contents import CartContents
 
 
 def test_44_cart_persistence_after_logout(actor):
@@ -20,17 +22,10 @@ def test_44_cart_persistence_after_logout(actor):
     """
     # Given - Login and add product to cart
     actor.attempts_to(
-        Open.browser_on("http://localhost:4200/login"),
-        VallmereLoginPage.wait_for_email_field(),
-        VallmereLoginPage.enter_email("cliente@vallmere.com"),
-        VallmereLoginPage.enter_password("cliente123"),
-        VallmereLoginPage.click_login_button()
+        AuthenticateDirectly.as_client().then_open("/product/5")
     )
     
-    time.sleep(2.0)
-    
     browser = actor.ability_to(BrowseTheWeb).browser
-    browser.get("http://localhost:4200/product/5")
     
     actor.attempts_to(
         VallmereProductPage.wait_for_add_to_cart_button(),
@@ -40,10 +35,7 @@ def test_44_cart_persistence_after_logout(actor):
     time.sleep(1.5)
     
     # Get initial cart count
-    initial_cart_count = browser.execute_script("""
-        const cartItems = JSON.parse(localStorage.getItem('vallmere_cart_items') || '[]');
-        return cartItems.length;
-    """)
+    initial_cart_count = CartContents.stored_item_count().answered_by(actor)
     
     assert initial_cart_count > 0, "Cart should have at least one item"
     
@@ -66,13 +58,10 @@ def test_44_cart_persistence_after_logout(actor):
         VallmereLoginPage.click_login_button()
     )
     
-    time.sleep(2.0)
+    actor.attempts_to(WaitForAngular.to_settle())
     
     # Then - Verify cart still has items
-    final_cart_count = browser.execute_script("""
-        const cartItems = JSON.parse(localStorage.getItem('vallmere_cart_items') || '[]');
-        return cartItems.length;
-    """)
+    final_cart_count = CartContents.stored_item_count().answered_by(actor)
     
     assert final_cart_count >= initial_cart_count, f"Cart should persist. Initial: {initial_cart_count}, Final: {final_cart_count}"
     
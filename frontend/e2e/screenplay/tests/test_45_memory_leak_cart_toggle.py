@@ -0,0 +1,34 @@
+"""
+Test 45 - Memory - Opening and Closing the Cart Does Not Leak
+Verifies that the JS heap, DOM nodes and listeners stay flat while the cart is toggled
+"""
+from screenpy_selenium.actions import Open
+
+from actions.check_for_leaks import CheckForLeaks
+from pages.vallmere_cart_page import VallmereCartPage
+from pages.vallmere_header_page import VallmereHeaderPage
+
+
+def test_45_memory_leak_cart_toggle(leak_iterations, actor, record_property):
+    """
+    Scenario: User opens and closes the cart many times
+    Given the user is on the landing page
+    When the user opens and closes the cart N times
+    Then the app's memory should not grow with each round
+    """
+    # Given - Open landing page
+    actor.attempts_to(
+        Open.browser_on("http://localhost:4200/"),
+        VallmereHeaderPage.wait_for_header()
+    )
+
+    # When / Then - Toggle the cart and measure after every round
+    leak_check = CheckForLeaks.while_repeating(
+        VallmereCartPage.open_cart(),
+        VallmereCartPage.close_cart(),
+    ).named("open and close the cart").times(leak_iterations)
+
+    try:
+        actor.attempts_to(leak_check)
+    finally:
+        record_property("memory_growth_per_iteration", leak_check.slopes)
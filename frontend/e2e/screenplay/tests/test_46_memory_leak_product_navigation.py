@@ -0,0 +1,36 @@
+"""
+Test 46 - Memory - Landing to Product and Back Does Not Leak
+Verifies that routing between the landing and a product page releases the views it leaves
+"""
+from screenpy_selenium.actions import GoBack, Open
+
+from actions.check_for_leaks import CheckForLeaks
+from pages.vallmere_landing_page import VallmereLandingPage
+from pages.vallmere_product_page import VallmereProductPage
+
+
+def test_46_memory_leak_product_navigation(leak_iterations, actor, record_property):
+    """
+    Scenario: User goes from the landing page to a product and back many times
+    Given the user is on the landing page
+    When the user opens the first product and goes back N times
+    Then the app's memory should not grow with each round
+    """
+    # Given - Open landing page
+    actor.attempts_to(
+        Open.browser_on("http://localhost:4200/"),
+        VallmereLandingPage.wait_for_product_cards()
+    )
+
+    # When / Then - Navigate inside the app (no reload) and measure after every round
+    leak_check = CheckForLeaks.while_repeating(
+        VallmereLandingPage.click_first_product(),
+        VallmereProductPage.wait_for_product_detail(),
+        GoBack(),
+        VallmereLandingPage.wait_for_product_cards(),
+    ).named("landing, product and back").times(leak_iterations)
+
+    try:
+        actor.attempts_to(leak_check)
+    finally:
+        record_property("memory_growth_per_iteration", leak_check.slopes)
@@ -0,0 +1,35 @@
+"""
+Test 47 - Login - Injected Session Without the Storage-State Cache
+Verifies that AuthenticateDirectly logs in by writing the session into localStorage,
+the path every test takes with --storage-state-ttl=0
+"""
+import pytest
+
+from abilities.reuse_storage_state import ReuseStorageState
+from actions.authenticate_directly import AuthenticateDirectly
+from pages.vallmere_admin_page import VallmereAdminPage
+from pages.vallmere_profile_page import VallmereProfilePage
+
+
+@pytest.mark.without_storage_state
+def test_47_login_injected_session(actor):
+    """
+    Scenario: Client and admin sessions are injected instead of restored
+    Given the storage-state cache is off for this test
+    When the user authenticates directly as client and then as admin
+    Then the profile page and the admin panel should be shown
+    """
+    # Given - No storage-state snapshots to restore
+    assert not actor.has_ability_to(ReuseStorageState), "The test must not restore captured sessions"
+
+    # When/Then - Client session written into localStorage
+    actor.attempts_to(
+        AuthenticateDirectly.as_client(),
+        VallmereProfilePage.user_info_is_shown()
+    )
+
+    # When/Then - Admin session written into localStorage
+    actor.attempts_to(
+        AuthenticateDirectly.as_admin(),
+        VallmereAdminPage.wait_for_admin_panel()
+    )
@@ -0,0 +1,68 @@
+"""
+Test 48 - API - Stand-In Backend Rolled Back Between Tests
+Verifies that the `backend` fixture starts every test from the seed data:
+the cart and product a client and an admin create through the API are gone
+for the next test that uses it
+"""
+import json
+import urllib.request
+from urllib.error import HTTPError
+
+SEED_PRODUCTS = 8
+
+
+def call(backend, method, path, body=None, token=None):
+    """Status and JSON answer of one request to the stand-in backend"""
+    headers = {"Content-Type": "application/json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    data = json.dumps(body).encode() if body is not None else None
+    request = urllib.request.Request(f"{backend.url}{path}", data=data, method=method, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            raw = response.read()
+            return response.status, json.loads(raw) if raw else None
+    except HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def login(backend, email, password):
+    status, answer = call(backend, "POST", "/auth/login", {"email": email, "password": password})
+    assert status == 201, f"Login de {email} rechazado: {answer}"
+    return answer["access_token"]
+
+
+def test_48_api_backend_rollback(backend):
+    """
+    Scenario: A test changes the catalogue and a cart through the API
+    Given the stand-in backend holds only the seed data
+    When the admin creates a product and the client adds it to the cart
+    Then the API answers with the new cart and total
+    And a client without admin role cannot see the dashboard
+    """
+    # Given - Seed data only, whatever earlier tests created
+    _, products = call(backend, "GET", "/products")
+    assert len(products) == SEED_PRODUCTS, "El backend no se restauró al terminar el test anterior"
+    admin = login(backend, "admin@vallmere.com", "admin123")
+    client = login(backend, "cliente@vallmere.com", "cliente123")
+    _, dashboard = call(backend, "GET", "/admin/dashboard", token=admin)
+    assert dashboard["totalOrders"] == 0
+
+    # When - The admin creates a product and the client adds it to the cart
+    status, product = call(
+        backend, "POST", "/products", {"name": "Allstarz Tote Bag", "price": 24.5, "stock": 5, "categoryId": 1},
+        token=admin,
+    )
+    assert status == 201, product
+    status, item = call(backend, "POST", "/cart/add-item", {"productId": product["productId"], "quantity": 2}, client)
+    assert status == 201, item
+
+    # Then - The cart holds the new product
+    _, cart = call(backend, "GET", "/cart/my-cart", token=client)
+    _, total = call(backend, "GET", f"/cart/{cart['cartId']}/total", token=client)
+    assert [entry["product"]["name"] for entry in cart["items"]] == ["Allstarz Tote Bag"]
+    assert total == {"itemCount": 2, "total": 49.0}
+
+    # And - The dashboard stays admin-only
+    status, answer = call(backend, "GET", "/admin/dashboard", token=client)
+    assert status == 403, answer
@@ -0,0 +1,48 @@
+"""
+Unit Test Fixtures
+Fakes for the browser-free tests of the suite's helpers
+"""
+import time
+from types import SimpleNamespace
+
+import pytest
+
+
+class FakeClock:
+    """time.perf_counter that only moves when a test advances it"""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class FakeConnection:
+    """A RemoteConnection whose commands take `clock` time and return canned values"""
+
+    def __init__(self, clock: FakeClock) -> None:
+        self.clock = clock
+        self.durations = {}
+        self.sent = []
+
+    def execute(self, command, params):
+        self.sent.append(command)
+        self.clock.advance(self.durations.get(command, 0.01))
+        return {"value": None}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(time, "perf_counter", fake)
+    return fake
+
+
+@pytest.fixture
+def driver(clock):
+    """Just enough of a WebDriver for CommandRecorder.of(driver)"""
+    return SimpleNamespace(command_executor=FakeConnection(clock))
@@ -0,0 +1,87 @@
+"""
+Unit - Browser Logs
+Console and network log entries turned into report lines, and what each test drains
+"""
+import json
+from types import SimpleNamespace
+
+from plugins.browser_logs import BrowserLogPlugin, console_lines, failed_request_lines
+
+TIMESTAMP = 1_700_000_000_000
+
+
+def network(method: str, **params) -> dict:
+    return {"timestamp": TIMESTAMP, "message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+class LogDriver:
+    """A WebDriver whose get_log returns the queued entries once, like chromedriver's buffer"""
+
+    def __init__(self, **logs) -> None:
+        self.logs = logs
+        self.reads = []
+
+    def get_log(self, log_type):
+        self.reads.append(log_type)
+        entries, self.logs[log_type] = self.logs.get(log_type, []), []
+        return entries
+
+
+def test_console_lines_show_level_and_message():
+    (line,) = console_lines([{"timestamp": TIMESTAMP, "level": "SEVERE", "message": "TypeError: x is undefined"}])
+
+    assert line.endswith(" SEVERE  TypeError: x is undefined")
+
+
+def test_failed_request_lines_keep_app_requests_that_failed():
+    entries = [
+        network("Network.requestWillBeSent", requestId="1", request={"method": "POST", "url": "http://api/orders"}),
+        network("Network.responseReceived", requestId="1", type="XHR", response={"status": 500, "url": "http://api/orders"}),
+        network("Network.requestWillBeSent", requestId="2", request={"method": "GET", "url": "http://api/products"}),
+        network("Network.responseReceived", requestId="2", type="Fetch", response={"status": 200, "url": "http://api/products"}),
+        network("Network.requestWillBeSent", requestId="3", request={"method": "GET", "url": "http://api/cart"}),
+        network("Network.loadingFailed", requestId="3", type="XHR", errorText="net::ERR_CONNECTION_REFUSED"),
+        network("Network.loadingFailed", requestId="4", type="Fetch", canceled=True),
+        network("Network.responseReceived", requestId="5", type="Image", response={"status": 404, "url": "http://app/a.png"}),
+    ]
+
+    lines = [line.split(" ", 1)[1] for line in failed_request_lines(entries)]
+
+    assert lines == [
+        "500 POST http://api/orders",
+        "net::ERR_CONNECTION_REFUSED GET http://api/cart",
+        "canceled  request 4",
+    ]
+
+
+def test_passing_tests_only_drain_the_console_by_default():
+    driver = LogDriver(browser=[{"timestamp": TIMESTAMP, "level": "INFO", "message": "earlier test"}])
+    plugin = BrowserLogPlugin(size=10)
+
+    plugin.start(None, driver)
+    plugin.finish(SimpleNamespace(), None)
+
+    assert driver.reads == ["browser"]
+
+
+def test_failing_test_collects_a_bounded_ring():
+    driver = LogDriver()
+    plugin = BrowserLogPlugin(size=2, network=True)
+    plugin.start(None, driver)
+    driver.logs["browser"] = [{"timestamp": TIMESTAMP, "level": "WARNING", "message": str(n)} for n in range(3)]
+    driver.logs["performance"] = [
+        network("Network.loadingFailed", requestId="9", type="XHR", errorText="net::ERR_FAILED"),
+    ]
+
+    logs = plugin.collect()
+
+    assert driver.reads == ["browser", "performance", "browser", "performance"]
+    assert [line.rsplit(" ", 1)[1] for line in logs["console"]] == ["1", "2"]
+    assert len(logs["failed requests"]) == 1
+
+
+def test_nothing_logged_means_no_section():
+    plugin = BrowserLogPlugin(size=10)
+    plugin.start(None, LogDriver())
+
+    assert plugin.collect() is None
@@ -0,0 +1,90 @@
+"""
+Unit - Cart Contents
+Cart storage parsed into the current user's cart, read from the browser once per step
+"""
+import json
+
+from screenpy import Actor
+from screenpy_selenium.abilities import BrowseTheWeb
+
+from questions.cart_contents import CART_STORAGE_KEYS, CartContents, CartState
+
+CARTS = [{"cartId": 1, "userId": 10}, {"cartId": 2, "userId": 20}]
+ITEMS = [
+    {"cartId": 1, "productId": 5, "quantity": 2, "product": {"price": 12.5}},
+    {"cartId": 1, "productId": 7, "quantity": 1, "product": {"price": 3.0}},
+    {"cartId": 2, "productId": 5, "quantity": 4, "product": {"price": 12.5}},
+]
+
+
+def storage(user=None, carts=CARTS, items=ITEMS) -> dict:
+    values = {
+        "vallmere_carts": json.dumps(carts),
+        "vallmere_cart_items": json.dumps(items),
+        "currentUser": json.dumps(user) if user is not None else None,
+    }
+    return {key: values.get(key) for key in CART_STORAGE_KEYS}
+
+
+class StorageBrowser:
+    """A WebDriver whose execute_script answers the cart storage read"""
+
+    def __init__(self, storage: dict) -> None:
+        self.storage = storage
+        self.reads = 0
+
+    def execute_script(self, script, keys):
+        self.reads += 1
+        return [self.storage[key] for key in keys]
+
+
+def test_cart_of_the_current_user():
+    cart = CartState(storage(user={"userId": 10}))
+
+    assert cart.cart == CARTS[0]
+    assert cart.count == 2
+    assert cart.stored_item_count == 3
+    assert cart.quantities == {5: 2, 7: 1}
+    assert cart.total_quantity == 3
+    assert cart.total == 28.0
+    assert cart.contains(7) and not cart.contains(9)
+    assert cart.quantity_of(5) == 2 and cart.quantity_of(9) == 0
+    assert cart.item_for(9) is None
+    assert [item["productId"] for item in cart.items_in_cart(2)] == [5]
+
+
+def test_no_user_or_unreadable_storage_means_an_empty_cart():
+    anonymous = CartState(storage())
+    broken = CartState(dict(storage(user={"userId": 10}), vallmere_carts="{", vallmere_cart_items=None))
+
+    for cart in (anonymous, broken):
+        assert cart.cart is None
+        assert cart.count == 0 and cart.total == 0
+    assert anonymous.stored_item_count == 3
+    assert broken.stored_item_count == 0
+
+
+def test_storage_is_read_once_per_step():
+    browser = StorageBrowser(storage(user={"userId": 10}))
+    actor = Actor.named("Cliente").who_can(BrowseTheWeb.using(browser))
+    actor.actions_performed = 1
+
+    assert CartContents.count().answered_by(actor) == 2
+    assert CartContents.quantity_of(5).answered_by(actor) == 2
+    assert browser.reads == 1
+
+    browser.storage = storage(user={"userId": 20})
+    actor.actions_performed = 2
+
+    assert CartContents.quantity_of(5).answered_by(actor) == 4
+    assert browser.reads == 2
+
+
+def test_actors_without_a_step_counter_always_read():
+    browser = StorageBrowser(storage(user={"userId": 10}))
+    actor = Actor.named("Cliente").who_can(BrowseTheWeb.using(browser))
+
+    CartContents.count().answered_by(actor)
+    CartContents.count().answered_by(actor)
+
+    assert browser.reads == 2
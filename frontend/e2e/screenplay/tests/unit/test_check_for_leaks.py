@@ -0,0 +1,79 @@
+"""
+Unit - Leak Checks
+Growth per iteration fitted over the sampled metrics and compared with each allowance
+"""
+import pytest
+from screenpy import Actor
+from screenpy.exceptions import DeliveryError
+from screenpy_selenium.abilities import BrowseTheWeb
+
+from actions.check_for_leaks import CheckForLeaks
+
+
+class Journey:
+    """An action that makes the metrics grow by `growth` every time it is performed"""
+
+    def __init__(self, browser, growth: dict) -> None:
+        self.browser = browser
+        self.growth = growth
+
+    def perform_as(self, the_actor) -> None:
+        for name, step in self.growth.items():
+            self.browser.metrics[name] += step
+
+
+class MetricsBrowser:
+    """Answers Performance.getMetrics with the current metrics; other CDP commands do nothing"""
+
+    def __init__(self) -> None:
+        self.metrics = {"JSHeapUsedSize": 10_000_000.0, "Nodes": 800.0, "JSEventListeners": 120.0, "Documents": 3.0}
+        self.commands = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append(command)
+        if command == "Performance.getMetrics":
+            return {"metrics": [{"name": name, "value": value} for name, value in self.metrics.items()]}
+        return {}
+
+
+def check(growth: dict, browser=None, **allowed) -> CheckForLeaks:
+    browser = browser or MetricsBrowser()
+    actor = Actor.named("Tester").who_can(BrowseTheWeb.using(browser))
+    leak_check = CheckForLeaks.while_repeating(Journey(browser, growth)).named("the journey").times(5).allowing(**allowed)
+    actor.attempts_to(leak_check)
+    return leak_check
+
+
+def test_growth_within_the_allowance_passes():
+    leak_check = check({"Nodes": 5, "JSHeapUsedSize": 1024})
+
+    assert len(leak_check.samples) == 6
+    assert leak_check.slopes["Nodes"] == pytest.approx(5)
+    assert leak_check.slopes["JSHeapUsedSize"] == pytest.approx(1024)
+    assert leak_check.slopes["Documents"] == pytest.approx(0)
+
+
+def test_warm_up_rounds_are_not_sampled():
+    browser = MetricsBrowser()
+
+    leak_check = check({"Nodes": 1}, browser)
+
+    assert leak_check.samples[0]["Nodes"] == 800 + 2
+    assert browser.commands.count("HeapProfiler.collectGarbage") == 6
+
+
+def test_growth_above_the_allowance_fails_naming_the_metric():
+    with pytest.raises(DeliveryError, match=r"^Nodes, JSEventListeners kept growing") as failure:
+        check({"Nodes": 6, "JSEventListeners": 3})
+
+    assert "per iteration" in str(failure.value)
+
+
+def test_allowances_can_be_tightened():
+    with pytest.raises(DeliveryError, match="Nodes"):
+        check({"Nodes": 1}, Nodes=0)
+
+
+def test_a_slope_needs_two_iterations():
+    with pytest.raises(ValueError):
+        CheckForLeaks.while_repeating().times(1)
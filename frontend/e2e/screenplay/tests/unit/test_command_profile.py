@@ -0,0 +1,59 @@
+"""
+Unit - WebDriver Command Profile
+Latency histograms and the rules that flag tests with unusually many commands
+"""
+from plugins.command_profile import FLAG_MIN_COMMANDS, CommandProfilePlugin, percentile_bound
+
+
+class FakeConfig:
+    def __init__(self, **options):
+        self.options = dict({"--profile-commands": "profile.json", "--max-commands-per-test": None, "--command-baseline": None}, **options)
+
+    def getoption(self, name):
+        return self.options[name]
+
+
+def profile(commands, repeat=1):
+    return {"commands": commands, "longest_repeat": {"command": "findElement", "count": repeat}}
+
+
+def plugin_with(tests, **options):
+    plugin = CommandProfilePlugin(FakeConfig(**options))
+    plugin.tests = tests
+    return plugin
+
+
+def test_percentile_bound_reads_the_histogram():
+    assert percentile_bound([0, 0, 0], 0.5) == "-"
+    assert percentile_bound([5, 5, 0], 0.5) == "<=1ms"
+    assert percentile_bound([5, 5, 0], 0.95) == "<=2ms"
+
+
+def test_tests_far_above_the_median_are_flagged():
+    plugin = plugin_with({"a": profile(10), "b": profile(12), "c": profile(FLAG_MIN_COMMANDS * 2)})
+
+    flagged = plugin.flagged()
+
+    assert list(flagged) == ["c"]
+    assert "the median of 12" in flagged["c"][0]
+
+
+def test_a_median_of_zero_does_not_flag_or_divide():
+    plugin = plugin_with({"a": profile(0), "b": profile(0), "c": profile(FLAG_MIN_COMMANDS * 2)})
+
+    assert plugin.flagged() == {}
+
+
+def test_limit_polling_and_baseline_rules(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text('{"tests": {"b": {"commands": 10}}}', encoding="utf-8")
+    plugin = plugin_with(
+        {"a": profile(50), "b": profile(20), "c": profile(5, repeat=25)},
+        **{"--max-commands-per-test": 40, "--command-baseline": str(baseline)},
+    )
+
+    flagged = plugin.flagged()
+
+    assert flagged["a"] == ["more than 40 commands"]
+    assert flagged["b"] == ["10 -> 20 commands since the baseline"]
+    assert flagged["c"] == ["findElement sent 25 times in a row (polling?)"]
@@ -0,0 +1,57 @@
+"""
+Unit - WebDriver Command Recorder
+Recorded commands, listeners and the probes kept out of the test's numbers
+"""
+from actors.command_recorder import CommandRecorder
+
+
+def test_commands_are_recorded_with_their_timing(driver):
+    recorder = CommandRecorder.of(driver)
+    driver.command_executor.durations["get"] = 0.5
+
+    driver.command_executor.execute("get", {"url": "/"})
+
+    assert [command.name for command in recorder.commands] == ["get"]
+    assert recorder.commands[0].duration == 0.5
+    assert CommandRecorder.of(driver) is recorder
+
+
+def test_listeners_hear_recorded_commands_only(driver):
+    recorder = CommandRecorder.of(driver)
+    heard = []
+    recorder.add_listener(lambda command, params: heard.append(command))
+
+    driver.command_executor.execute("findElement", {})
+    with recorder.unrecorded():
+        driver.command_executor.execute("executeAsyncScript", {})
+
+    assert heard == ["findElement"]
+    assert [command.name for command in recorder.commands] == ["findElement"]
+
+
+def test_unrecorded_time_is_accumulated_until_cleared(driver, clock):
+    recorder = CommandRecorder.of(driver)
+    driver.command_executor.durations["executeAsyncScript"] = 2.0
+
+    with recorder.unrecorded():
+        driver.command_executor.execute("executeAsyncScript", {})
+    assert recorder.excluded_seconds == 2.0
+
+    recorder.clear()
+    assert recorder.excluded_seconds == 0.0
+    assert recorder.commands == []
+
+
+def test_a_probe_sent_from_a_listener_is_not_recorded(driver):
+    recorder = CommandRecorder.of(driver)
+
+    def probe(command, params):
+        if command == "get":
+            with recorder.unrecorded():
+                driver.command_executor.execute("executeAsyncScript", {})
+
+    recorder.add_listener(probe)
+    driver.command_executor.execute("get", {"url": "/"})
+
+    assert driver.command_executor.sent == ["get", "executeAsyncScript"]
+    assert [command.name for command in recorder.commands] == ["get"]
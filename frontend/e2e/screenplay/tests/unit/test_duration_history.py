@@ -0,0 +1,87 @@
+"""
+Unit - Duration History
+Rolling baselines in SQLite and the gate that warns about or fails on slower tests
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from plugins.duration_history import MIN_SAMPLES, Baseline, DurationHistory, DurationHistoryPlugin
+
+
+class FakeConfig:
+    def __init__(self, path, gate="warn"):
+        self.options = {
+            "--duration-history": str(path),
+            "--duration-window": 20,
+            "--duration-tolerance": 0.25,
+            "--duration-gate": gate,
+        }
+
+    def getoption(self, name):
+        return self.options[name]
+
+
+def result(duration, outcome="passed", steps=()):
+    return {"outcome": outcome, "duration": duration, "steps": list(steps)}
+
+
+def record_runs(path, durations, nodeid="tests/test_a.py::test_a", steps=()):
+    history = DurationHistory(path)
+    try:
+        for duration in durations:
+            history.record({nodeid: result(duration, steps=steps)})
+    finally:
+        history.close()
+
+
+def test_baseline_needs_a_real_slowdown():
+    baseline = Baseline([10.0, 10.0, 10.5, 11.0, 12.0])
+
+    assert baseline.p50 == 10.5
+    assert not baseline.regressed(baseline.p90 * 1.2, tolerance=0.25)  # inside the tolerance
+    assert not Baseline([1.0] * 5).regressed(1.9, tolerance=0.25)  # less than a second slower
+    assert baseline.regressed(20.0, tolerance=0.25)
+
+
+def test_baselines_use_the_last_passing_runs_only(tmp_path):
+    path = tmp_path / "durations.sqlite"
+    record_runs(path, [5.0] * (MIN_SAMPLES - 1))
+    history = DurationHistory(path)
+    try:
+        assert history.baseline_of("tests/test_a.py::test_a", window=20) is None
+        history.record({"tests/test_a.py::test_a": result(99.0, outcome="failed")})
+        history.record({"tests/test_a.py::test_a": result(7.0)})
+
+        baseline = history.baseline_of("tests/test_a.py::test_a", window=20)
+        assert baseline.samples == MIN_SAMPLES
+        assert history.typical_durations(window=20) == {"tests/test_a.py::test_a": 5.0}
+        assert history.typical_durations(window=1) == {"tests/test_a.py::test_a": 7.0}
+    finally:
+        history.close()
+
+
+@pytest.mark.parametrize("gate, exitstatus", [("warn", pytest.ExitCode.OK), ("fail", pytest.ExitCode.TESTS_FAILED)])
+def test_gate_reports_slower_tests_and_steps(tmp_path, gate, exitstatus):
+    path = tmp_path / "durations.sqlite"
+    record_runs(path, [5.0] * MIN_SAMPLES, steps=[("open the cart", 1.0)])
+    plugin = DurationHistoryPlugin(FakeConfig(path, gate))
+    plugin.results = {"tests/test_a.py::test_a": result(12.0, steps=[("open the cart", 4.0)])}
+    session = SimpleNamespace(exitstatus=pytest.ExitCode.OK)
+
+    plugin.pytest_sessionfinish(session)
+
+    assert len(plugin.regressions) == 1 and "12.00 s vs p50 5.00 s" in plugin.regressions[0]
+    assert plugin.slower_steps == ["tests/test_a.py::test_a: open the cart 4.00 s vs p90 1.00 s"]
+    assert session.exitstatus == exitstatus
+
+
+def test_probe_time_reported_at_teardown_is_taken_off_the_call(tmp_path):
+    plugin = DurationHistoryPlugin(FakeConfig(tmp_path / "durations.sqlite"))
+
+    for when, duration, properties in [("call", 6.0, []), ("teardown", 0.1, [("excluded_seconds", 2.5)])]:
+        plugin.pytest_runtest_logreport(
+            SimpleNamespace(nodeid="t", when=when, duration=duration, failed=False, skipped=False, user_properties=properties)
+        )
+
+    assert plugin.results["t"]["duration"] == 3.5
@@ -0,0 +1,74 @@
+"""
+Unit - In-Page Actions
+Script timeouts and failure reporting of the actions that run inside the page
+"""
+import pytest
+from screenpy import Actor
+from screenpy.exceptions import DeliveryError
+from screenpy_selenium.abilities import BrowseTheWeb
+
+from actions.in_page import DEFAULT_SCRIPT_TIMEOUT, SCRIPT_TIMEOUT_MARGIN, allow_script_to_run
+from actions.run_in_page import RunInPage, Step
+
+
+class FakeBrowser:
+    """Records the script timeouts it is given and answers async scripts with a canned outcome"""
+
+    def __init__(self, outcome=None):
+        self.outcome = outcome
+        self.script_timeouts = []
+        self.calls = []
+
+    def set_script_timeout(self, seconds):
+        self.script_timeouts.append(seconds)
+
+    def execute_async_script(self, script, *args):
+        self.calls.append(args)
+        return self.outcome
+
+
+def test_short_scripts_keep_the_default_script_timeout():
+    browser = FakeBrowser()
+
+    allow_script_to_run(browser, DEFAULT_SCRIPT_TIMEOUT - SCRIPT_TIMEOUT_MARGIN)
+
+    assert browser.script_timeouts == []
+
+
+def test_long_scripts_raise_the_script_timeout_once():
+    browser = FakeBrowser()
+
+    allow_script_to_run(browser, 60)
+    allow_script_to_run(browser, 40)
+    allow_script_to_run(browser, 60)
+
+    assert browser.script_timeouts == [60 + SCRIPT_TIMEOUT_MARGIN]
+
+
+def test_run_in_page_sends_one_deadline_for_the_batch():
+    browser = FakeBrowser({"ok": True, "results": [None, None], "timings": [1.0, 2.0]})
+    actor = Actor.named("Tester").who_can(BrowseTheWeb.using(browser))
+
+    actor.attempts_to(RunInPage.steps(Step.click(".a"), Step.wait_for(".b")).for_up_to(45))
+
+    (steps, timeout_ms), = browser.calls
+    assert [step["kind"] for step in steps] == ["click", "wait_visible"]
+    assert timeout_ms == 45000
+    assert browser.script_timeouts == [45 + SCRIPT_TIMEOUT_MARGIN]
+
+
+def test_run_in_page_names_the_failing_step():
+    browser = FakeBrowser({"ok": False, "failed": 1, "error": ".b was not found after 0 ms", "results": [None], "timings": [1.0]})
+    actor = Actor.named("Tester").who_can(BrowseTheWeb.using(browser))
+
+    with pytest.raises(DeliveryError, match=r"Step 2 of 2 \(wait for the \.b to appear\)"):
+        actor.attempts_to(RunInPage.steps(Step.click(".a"), Step.wait_for(".b")))
+
+
+def test_wait_for_equal_text_asks_for_an_exact_match():
+    exact = Step.wait_for(".quantity", equal_text="2").to_script_argument()
+    partial = Step.wait_for(".quantity", containing_text="2").to_script_argument()
+
+    assert (exact["text"], exact["exact"]) == ("2", True)
+    assert (partial["text"], partial["exact"]) == ("2", False)
+    assert repr(Step.wait_for(".quantity", equal_text="2")) == 'wait for the .quantity to read "2"'
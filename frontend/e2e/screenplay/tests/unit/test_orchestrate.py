@@ -0,0 +1,74 @@
+"""
+Unit - Orchestrator
+Starting, polling and stopping a real service, and running the suite next to the stand-in backend it starts
+"""
+import os
+import socket
+import subprocess
+import sys
+
+import pytest
+
+import orchestrate
+from orchestrate import SUITE_DIR, answers, backend_service
+
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+@pytest.fixture
+def stub_service(monkeypatch, tmp_path):
+    monkeypatch.setattr(orchestrate, "API_URL", f"http://127.0.0.1:{free_port()}")
+    monkeypatch.setattr(orchestrate, "LOG_DIR", tmp_path)
+    service = backend_service("stub")
+    service.log_path = tmp_path / "stub.log"
+    yield service
+    service.stop()
+
+
+def test_answers_is_false_while_nothing_listens():
+    assert not answers(f"http://127.0.0.1:{free_port()}/")
+
+
+def test_a_started_service_is_ready_and_stopped(stub_service):
+    stub_service.start()
+    stub_service.wait_until_ready()
+
+    assert not stub_service.reused
+    assert stub_service.ready_seconds is not None
+    assert answers(stub_service.url)
+
+    stub_service.stop()
+
+    assert stub_service.process.poll() is not None
+    assert not answers(stub_service.url)
+
+
+def test_a_running_service_is_reused(stub_service):
+    stub_service.start()
+    stub_service.wait_until_ready()
+    again = backend_service("stub")
+
+    again.start()
+
+    assert again.reused and again.process is None
+
+
+def test_the_suite_runs_next_to_the_orchestrated_backend(stub_service):
+    # The backend fixture must not try to bind the port the orchestrator's stub already holds
+    stub_service.start()
+    stub_service.wait_until_ready()
+
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "tests/test_48_api_backend_rollback.py"],
+        cwd=SUITE_DIR,
+        env={**os.environ, "VALLMERE_API_URL": orchestrate.API_URL},
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert result.returncode == 0, result.stdout[-2000:]
@@ -0,0 +1,59 @@
+"""
+Unit - Streaming Report
+Merging JSONL shards and rendering the HTML viewer with screenshot thumbnails
+"""
+import json
+
+from plugins.report_stream import merge, read_results, render
+
+
+def write_results(path, *results):
+    path.write_text("".join(json.dumps(result) + "\n" for result in results), encoding="utf-8")
+    return path
+
+
+def result(nodeid, outcome="passed", **extra):
+    return dict({"nodeid": nodeid, "outcome": outcome, "duration": 1.5, "screenshots": []}, **extra)
+
+
+def test_merge_concatenates_shards_in_order(tmp_path):
+    first = write_results(tmp_path / "shard-1.jsonl", result("a"), result("b", "failed"))
+    second = write_results(tmp_path / "shard-2.jsonl", result("c", "skipped"))
+
+    written = merge(tmp_path / "all.jsonl", [first, second])
+
+    assert written == 3
+    assert [r["nodeid"] for r in read_results([tmp_path / "all.jsonl"])] == ["a", "b", "c"]
+
+
+def test_read_results_skips_blank_lines(tmp_path):
+    path = tmp_path / "results.jsonl"
+    path.write_text(json.dumps(result("a")) + "\n\n" + json.dumps(result("b")) + "\n", encoding="utf-8")
+
+    assert [r["nodeid"] for r in read_results([path])] == ["a", "b"]
+
+
+def test_render_counts_outcomes_and_escapes_text(tmp_path):
+    results = write_results(
+        tmp_path / "results.jsonl",
+        result("tests/test_a.py::test_<a>"),
+        result("tests/test_b.py::test_b", "failed", longrepr="assert 1 < 2"),
+    )
+
+    counts = render([results], tmp_path / "results.html")
+
+    page = (tmp_path / "results.html").read_text(encoding="utf-8")
+    assert counts == {"passed": 1, "failed": 1}
+    assert "test_&lt;a&gt;" in page
+    assert "assert 1 &lt; 2" in page
+
+
+def test_render_shows_thumbnails_linking_to_the_screenshot(tmp_path):
+    screenshot = tmp_path / "screenshots" / "abc.jpg"
+    results = write_results(tmp_path / "results.jsonl", result("a", "failed", screenshots=[str(screenshot)]))
+
+    render([results], tmp_path / "results.html")
+
+    page = (tmp_path / "results.html").read_text(encoding="utf-8")
+    assert '<a href="screenshots/abc.jpg"' in page
+    assert 'src="screenshots/abc.thumb.jpg"' in page
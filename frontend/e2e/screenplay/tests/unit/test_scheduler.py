@@ -0,0 +1,139 @@
+"""
+Unit - Duration Scheduler
+Longest-first assignment of tests to workers and the duration estimates it uses
+"""
+import ast
+from types import SimpleNamespace
+
+from plugins.duration_history import DurationHistory
+from plugins.scheduler import (
+    ESTIMATE_BASE_SECONDS,
+    ESTIMATE_NAVIGATION_SECONDS,
+    ESTIMATE_STEP_SECONDS,
+    DurationEstimator,
+    DurationScheduling,
+    estimate_from_source,
+    lpt_assign,
+)
+
+TEST_SOURCE = '''
+import time
+
+def test_slow(actor, browser):
+    browser.get("http://localhost:4200/")
+    actor.attempts_to(VallmereCartPage.open_cart(), VallmereCartPage.close_cart())
+    time.sleep(1.5)
+
+def test_fast(actor):
+    pass
+'''
+
+
+def test_lpt_balances_the_workers():
+    durations = [7, 5, 4, 3, 3, 2]
+
+    bins = lpt_assign(durations, workers=2)
+
+    loads = sorted(sum(durations[i] for i in indices) for indices in bins)
+    assert loads == [12, 12]
+    assert sorted(i for indices in bins for i in indices) == list(range(len(durations)))
+
+
+def test_lpt_hands_out_the_longest_tests_first():
+    bins = lpt_assign([1, 9, 5], workers=3)
+
+    assert bins == [[1], [2], [0]]
+
+
+def test_lpt_with_more_workers_than_tests_leaves_some_idle():
+    assert lpt_assign([3.0], workers=2) == [[0], []]
+
+
+def test_estimate_from_source_counts_sleeps_navigations_and_page_steps():
+    function = ast.parse(TEST_SOURCE).body[1]
+
+    expected = ESTIMATE_BASE_SECONDS + 1.5 + ESTIMATE_NAVIGATION_SECONDS + 2 * ESTIMATE_STEP_SECONDS
+    assert estimate_from_source(function) == expected
+
+
+def test_estimator_prefers_history_and_estimates_the_rest(tmp_path):
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_x.py").write_text(TEST_SOURCE, encoding="utf-8")
+    history = DurationHistory(tmp_path / "durations.sqlite")
+    history.record({"tests/test_x.py::test_fast": {"outcome": "passed", "duration": 42.0, "steps": []}})
+    history.close()
+
+    estimator = DurationEstimator(tmp_path, tmp_path / "durations.sqlite")
+
+    assert estimator.duration_of("tests/test_x.py::test_fast") == 42.0
+    assert estimator.duration_of("tests/test_x.py::test_slow[param]") > ESTIMATE_BASE_SECONDS
+    assert estimator.duration_of("tests/test_missing.py::test_y") == ESTIMATE_BASE_SECONDS
+    assert estimator.estimated == 2
+
+
+class FakeNode:
+    """A WorkerController that records what the scheduler sends it"""
+
+    def __init__(self, name: str) -> None:
+        self.gateway = SimpleNamespace(id=name)
+        self.sent = []
+        self.shutting_down = False
+
+    def send_runtest_some(self, indices):
+        self.sent.extend(indices)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+def scheduling(tmp_path, collection, workers=2):
+    options = {"--duration-history": None, "--duration-window": 20, "maxschedchunk": None}
+    config = SimpleNamespace(
+        rootpath=tmp_path,
+        getoption=options.get,
+        getvalue=lambda name: [f"{workers}*popen"],
+        pluginmanager=SimpleNamespace(get_plugin=lambda name: None),
+    )
+    scheduler = DurationScheduling(config)
+    scheduler.estimator.recorded = dict(collection)
+    nodes = [FakeNode(f"gw{n}") for n in range(workers)]
+    for node in nodes:
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, list(collection))
+    scheduler.schedule()
+    return scheduler, nodes
+
+
+def test_short_tests_stay_queued_and_workers_stay_up(tmp_path):
+    collection = {f"tests/test_{n}.py::test": float(n) for n in range(1, 11)}
+
+    scheduler, nodes = scheduling(tmp_path, collection)
+
+    assert [scheduler.collection[i] for i in scheduler.pending] == ["tests/test_2.py::test", "tests/test_1.py::test"]
+    assert sorted(i for node in nodes for i in node.sent) == sorted(range(2, 10))
+    assert not any(node.shutting_down for node in nodes)
+
+
+def test_a_crashed_workers_tests_go_to_the_others(tmp_path):
+    collection = {f"tests/test_{n}.py::test": float(n) for n in range(1, 11)}
+    scheduler, (alive, crashed) = scheduling(tmp_path, collection)
+    scheduler.mark_test_complete(alive, alive.sent[0])
+    unfinished = list(scheduler.node2pending[crashed])
+
+    crash_item = scheduler.remove_node(crashed)
+    while scheduler.node2pending[alive]:
+        scheduler.mark_test_complete(alive, scheduler.node2pending[alive][0])
+
+    assert crash_item == scheduler.collection[unfinished[0]]
+    assert set(unfinished[1:]) <= set(alive.sent)
+    assert sorted(alive.sent + [unfinished[0]]) == list(range(10))  # everything but the crash item reran
+    assert scheduler.tests_finished
+    assert alive.shutting_down
+
+
+def test_few_tests_are_all_sent_up_front(tmp_path):
+    scheduler, nodes = scheduling(tmp_path, {"tests/test_a.py::test": 3.0, "tests/test_b.py::test": 1.0, "tests/test_c.py::test": 2.0})
+
+    assert scheduler.pending == []
+    assert [node.sent for node in nodes] == [[0], [2, 1]]
+    assert all(node.shutting_down for node in nodes)
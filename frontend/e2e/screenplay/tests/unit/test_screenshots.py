@@ -0,0 +1,42 @@
+"""
+Unit - Screenshot Store
+Content-addressed screenshots, re-encoded in the background with a thumbnail each
+"""
+import io
+
+import pytest
+
+from plugins.screenshots import THUMBNAIL_WIDTH, ScreenshotStore, thumbnail_path
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def png(width=1280, height=720, color=(200, 30, 30)) -> bytes:
+    output = io.BytesIO()
+    Image.new("RGB", (width, height), color).save(output, "PNG")
+    return output.getvalue()
+
+
+def test_identical_screenshots_are_stored_once(tmp_path):
+    store = ScreenshotStore(tmp_path, image_format="jpeg")
+
+    first = store.save(png())
+    second = store.save(png())
+    store.close()
+
+    assert first == second
+    assert first.suffix == ".jpg"
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted([first.name, thumbnail_path(first).name])
+
+
+def test_thumbnail_is_a_small_jpeg_with_the_same_aspect_ratio(tmp_path):
+    store = ScreenshotStore(tmp_path, image_format="png")
+
+    path = store.save(png(1280, 720))
+    store.close()
+
+    with Image.open(thumbnail_path(path)) as thumb:
+        assert thumb.format == "JPEG"
+        assert thumb.size == (THUMBNAIL_WIDTH, 180)
+    with Image.open(path) as full:
+        assert full.size == (1280, 720)
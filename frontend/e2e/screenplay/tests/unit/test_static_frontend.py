@@ -0,0 +1,104 @@
+"""
+Unit - Static Frontend
+Precompressed assets, SPA fallback and caching headers of the server behind --serve-dist
+"""
+import gzip
+import os
+import urllib.request
+from urllib.error import HTTPError
+
+import pytest
+
+from plugins.static_frontend import (
+    IMMUTABLE,
+    MIN_COMPRESS_BYTES,
+    REVALIDATE,
+    AssetCache,
+    StaticFrontend,
+    accepted_encodings,
+    browser_root,
+    precompress,
+)
+
+BUNDLE = b"console.log('vallmere');\n" * (MIN_COMPRESS_BYTES // 10)
+
+
+@pytest.fixture
+def dist(tmp_path):
+    root = tmp_path / "browser"
+    root.mkdir()
+    (root / "index.html").write_text("<app-root></app-root>", encoding="utf-8")
+    (root / "main-ABCD1234.js").write_bytes(BUNDLE)
+    (root / "favicon.ico").write_bytes(b"\0" * 16)
+    return root
+
+
+def test_browser_root_prefers_the_browser_folder(dist):
+    assert browser_root(dist.parent) == dist
+    with pytest.raises(FileNotFoundError):
+        browser_root(dist / "missing")
+
+
+def test_precompress_writes_fresh_files_only(dist):
+    written = precompress(dist)
+
+    assert written >= 1
+    assert gzip.decompress((dist / "main-ABCD1234.js.gz").read_bytes()) == BUNDLE
+    assert not (dist / "favicon.ico.gz").exists()  # too small to be worth it
+    assert precompress(dist) == 0
+
+    bundle = dist / "main-ABCD1234.js"
+    later = (dist / "main-ABCD1234.js.gz").stat().st_mtime + 10
+    os.utime(bundle, (later, later))
+    assert precompress(dist) == written
+
+
+def test_accepted_encodings_drop_refused_ones():
+    assert accepted_encodings("gzip, deflate, br") == ["gzip", "deflate", "br"]
+    assert accepted_encodings("br;q=0, GZIP;q=0.8") == ["gzip"]
+    assert accepted_encodings("") == []
+
+
+def test_resolve_falls_back_to_index_for_routes_only(dist):
+    assets = AssetCache(dist)
+
+    assert assets.resolve("/main-ABCD1234.js") == dist / "main-ABCD1234.js"
+    assert assets.resolve("/product/5") == assets.index
+    assert assets.resolve("/") == assets.index
+    assert assets.resolve("/main-MISSING1.js") is None
+    assert assets.resolve("/../secret.txt") is None
+    assert assets.resolve("/%2e%2e/secret.txt") is None
+
+
+def test_get_serves_the_best_accepted_encoding(dist):
+    precompress(dist)
+    assets = AssetCache(dist)
+    bundle = dist / "main-ABCD1234.js"
+
+    gzipped = assets.get(bundle, "gzip, deflate")
+    plain = assets.get(bundle, "identity")
+    index = assets.get(assets.index, "gzip")
+
+    assert gzipped.encoding == "gzip" and gzip.decompress(gzipped.body) == BUNDLE
+    assert plain.encoding is None and plain.body == BUNDLE
+    assert gzipped.etag != plain.etag
+    assert plain.content_type == "text/javascript; charset=utf-8"
+    assert plain.cache_control == IMMUTABLE
+    assert index.encoding is None and index.cache_control == REVALIDATE
+
+
+def test_server_answers_conditional_requests(dist):
+    frontend = StaticFrontend(dist).start()
+    try:
+        with urllib.request.urlopen(f"{frontend.url}/cart") as response:
+            assert response.read() == b"<app-root></app-root>"
+            etag = response.headers["ETag"]
+        revalidate = urllib.request.Request(f"{frontend.url}/", headers={"If-None-Match": etag})
+        with pytest.raises(HTTPError) as not_modified:
+            urllib.request.urlopen(revalidate)
+        assert not_modified.value.code == 304
+        with pytest.raises(HTTPError) as missing:
+            urllib.request.urlopen(f"{frontend.url}/chunk-MISSING1.js")
+        assert missing.value.code == 404
+    finally:
+        frontend.stop()
@@ -0,0 +1,75 @@
+"""
+Unit - Step Trace and Step Timer
+Self time of nested steps, commands per step and probe time left out
+"""
+from actors.command_recorder import CommandRecorder
+from plugins.duration_history import StepTimer
+from plugins.step_trace import StepTracer, category_of
+
+
+class Step:
+    """An action as the actor observers see it"""
+
+    def __init__(self, description: str) -> None:
+        self.description = description
+
+    def describe(self) -> str:
+        return self.description
+
+
+def test_nested_steps_split_their_time(driver, clock):
+    tracer = StepTracer(CommandRecorder.of(driver))
+
+    with tracer.step(Step("Log in.")):
+        clock.advance(1.0)
+        with tracer.step(Step("Wait for the profile.")):
+            clock.advance(3.0)
+            driver.command_executor.execute("executeAsyncScript", {})
+
+    inner, outer = tracer.steps
+    assert (inner["name"], inner["category"], inner["commands"]) == ("wait for the profile", "action", 1)
+    assert round(inner["self_seconds"], 3) == 3.01
+    assert round(outer["self_seconds"], 3) == 1.0
+    assert outer["commands"] == 1
+
+
+def test_probe_time_is_not_step_time(driver, clock):
+    recorder = CommandRecorder.of(driver)
+    tracer = StepTracer(recorder)
+    timer = StepTimer(recorder)
+
+    with timer.step(Step("Open the home page.")), tracer.step(Step("Open the home page.")):
+        driver.command_executor.execute("get", {})
+        with recorder.unrecorded():
+            clock.advance(2.0)
+
+    (step,) = tracer.steps
+    assert step["commands"] == 1
+    assert round(step["excluded_seconds"], 3) == 2.0
+    assert round(step["self_seconds"], 3) == 0.01
+    assert [(name, round(seconds, 3)) for name, seconds in timer.steps] == [("open the home page", 0.01)]
+
+
+def test_trace_events_include_steps_commands_and_gaps(driver, clock):
+    tracer = StepTracer(CommandRecorder.of(driver))
+    clock.advance(1.0)  # test body before the first step
+    with tracer.step(Step("Click on the cart.")):
+        driver.command_executor.execute("elementClick", {})
+
+    events = tracer.trace_events("tests/test_x.py::test_x")["traceEvents"]
+
+    by_category = {}
+    for event in events:
+        by_category.setdefault(event.get("cat"), []).append(event["name"])
+    assert by_category["action"] == ["click on the cart"]
+    assert by_category["webdriver"] == ["elementClick"]
+    assert by_category["gap"] == ["outside actor steps"]
+    assert tracer.slowest(1)[0]["webdriver_commands"] == 1
+
+
+def test_waits_are_categorised_by_class_name():
+    class WaitInPage(Step):
+        pass
+
+    assert category_of(WaitInPage("Wait for the cart.")) == "wait"
+    assert category_of(Step("Click.")) == "action"
@@ -0,0 +1,68 @@
+"""
+Unit - Storage-State Cache
+Snapshots survive the session while valid and are dropped when expired or foreign
+"""
+import base64
+import json
+import time
+
+from abilities.reuse_storage_state import StorageStateCache, token_expiry
+
+ORIGIN = "http://localhost:4200"
+
+
+def jwt_with_exp(exp: float) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+def state(token: str = "local_token_1", origin: str = ORIGIN) -> dict:
+    return {"origin": origin, "local_storage": {"access_token": token, "currentUser": "{}"}, "session_storage": {}, "cookies": []}
+
+
+def test_token_expiry_reads_jwt_exp_only():
+    assert token_expiry(jwt_with_exp(1234)) == 1234
+    assert token_expiry("local_token_1") is None
+    assert token_expiry("a.not-base64-json.c") is None
+    assert token_expiry(None) is None
+
+
+def test_valid_snapshot_is_restored_by_a_later_session(tmp_path):
+    StorageStateCache(tmp_path, ttl_seconds=60, origin=ORIGIN).put("client", state())
+
+    later = StorageStateCache(tmp_path, ttl_seconds=60, origin=ORIGIN)
+
+    assert later.get("client")["local_storage"]["access_token"] == "local_token_1"
+
+
+def test_jwt_expiry_wins_over_the_ttl(tmp_path):
+    cache = StorageStateCache(tmp_path, ttl_seconds=3600, origin=ORIGIN)
+
+    stored = cache.put("admin", state(jwt_with_exp(time.time() - 1)))
+
+    assert stored["expires_at"] < time.time()
+    assert cache.get("admin") is None
+    assert not cache.path_for("admin").exists()
+
+
+def test_expired_unreadable_and_foreign_files_are_dropped_on_start(tmp_path):
+    StorageStateCache(tmp_path, ttl_seconds=60, origin=ORIGIN).put("client", state())
+    foreign = dict(state(origin="http://127.0.0.1:8080"), expires_at=time.time() + 60)
+    (tmp_path / "other.json").write_text(json.dumps(foreign), encoding="utf-8")
+    expired = dict(state(), expires_at=time.time() - 1)
+    (tmp_path / "admin.json").write_text(json.dumps(expired), encoding="utf-8")
+    (tmp_path / "broken.json").write_text("{", encoding="utf-8")
+
+    StorageStateCache(tmp_path, ttl_seconds=60, origin=ORIGIN)
+
+    assert sorted(path.name for path in tmp_path.glob("*.json")) == ["client.json"]
+
+
+def test_invalidate_forgets_memory_and_file(tmp_path):
+    cache = StorageStateCache(tmp_path, ttl_seconds=60, origin=ORIGIN)
+    cache.put("client", state())
+
+    cache.invalidate("client")
+
+    assert cache.get("client") is None
+    assert not cache.path_for("client").exists()
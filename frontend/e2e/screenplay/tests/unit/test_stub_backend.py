@@ -0,0 +1,143 @@
+"""
+Unit - Stub Backend
+Store snapshots and rollback, and the routes of the stand-in API
+"""
+import json
+import time
+import urllib.request
+
+import pytest
+
+from stub_backend.server import HttpError, StubApi, StubBackend, issue_token
+from stub_backend.store import Store
+
+SEED = {
+    "categories": [{"categoryId": 1, "name": "Caps"}],
+    "users": [
+        {"userId": 1, "name": "Admin", "email": "admin@vallmere.com", "password": "admin123", "role": "admin"},
+        {"userId": 2, "name": "Cliente", "email": "cliente@vallmere.com", "password": "cliente123", "role": "client"},
+    ],
+    "products": [{"productId": 1, "name": "Trucker Cap", "price": 19.99, "stock": 3, "categoryId": 1}],
+}
+
+
+@pytest.fixture
+def store():
+    return Store(SEED)
+
+
+@pytest.fixture
+def api(store):
+    return StubApi(store)
+
+
+def bearer(store, user_id: int) -> str:
+    return f"Bearer {issue_token(store.get('users', user_id))}"
+
+
+def test_rollback_undoes_inserts_updates_and_deletes(store):
+    saved = store.snapshot()
+
+    store.insert("categories", {"name": "Socks"})
+    store.update("products", 1, {"stock": 0})
+    store.delete("users", 2)
+    store.rollback(saved)
+
+    assert [row["name"] for row in store.all("categories")] == ["Caps"]
+    assert store.get("products", 1)["stock"] == 3
+    assert store.get("users", 2)["email"] == "cliente@vallmere.com"
+    assert store.insert("categories", {"name": "Socks"})["categoryId"] == 2
+
+
+def test_a_snapshot_can_be_restored_more_than_once(store):
+    saved = store.snapshot()
+
+    for _ in range(2):
+        store.insert("products", {"name": "Hoodie", "price": 69.99, "stock": 1, "categoryId": 1})
+        store.rollback(saved)
+        assert len(store.all("products")) == 1
+
+
+def test_updates_replace_rows_instead_of_changing_them(store):
+    before = store.get("products", 1)
+
+    after = store.update("products", 1, {"stock": 1, "productId": 99})
+
+    assert before["stock"] == 3
+    assert after == {**before, "stock": 1}
+    assert store.update("products", 42, {"stock": 1}) is None
+    assert SEED["products"][0]["stock"] == 3
+
+
+def test_login_returns_a_token_for_the_protected_routes(api, store):
+    status, answer = api.dispatch("POST", "/auth/login", {"email": " Cliente@Vallmere.com", "password": "cliente123"}, "")
+
+    assert status == 201
+    assert "password" not in answer["user"]
+    _, profile = api.dispatch("GET", "/auth/profile", {}, f"Bearer {answer['access_token']}")
+    assert profile["userId"] == 2
+    with pytest.raises(HttpError) as wrong_password:
+        api.dispatch("POST", "/auth/login", {"email": "cliente@vallmere.com", "password": "nope"}, "")
+    assert wrong_password.value.status == 401
+
+
+def test_auth_and_roles_are_enforced(api, store, monkeypatch):
+    with pytest.raises(HttpError) as anonymous:
+        api.dispatch("GET", "/cart/my-cart", {}, "")
+    with pytest.raises(HttpError) as client:
+        api.dispatch("GET", "/admin/dashboard", {}, bearer(store, 2))
+    token = bearer(store, 2)
+    monkeypatch.setattr(time, "time", lambda: 10**10)
+    with pytest.raises(HttpError) as expired:
+        api.dispatch("GET", "/cart/my-cart", {}, token)
+
+    assert (anonymous.value.status, client.value.status, expired.value.status) == (401, 403, 401)
+
+
+def test_cart_items_add_up_within_the_stock(api, store):
+    client = bearer(store, 2)
+
+    api.dispatch("POST", "/cart/add-item", {"productId": 1, "quantity": 2}, client)
+    _, item = api.dispatch("POST", "/cart/add-item", {"productId": 1, "quantity": 1}, client)
+    _, cart = api.dispatch("GET", "/cart/my-cart", {}, client)
+    _, total = api.dispatch("GET", f"/cart/{cart['cartId']}/total", {}, client)
+
+    assert item["quantity"] == 3
+    assert cart["items"][0]["product"]["category"]["name"] == "Caps"
+    assert total == {"itemCount": 3, "total": 59.97}
+    with pytest.raises(HttpError) as no_stock:
+        api.dispatch("POST", "/cart/add-item", {"productId": 1, "quantity": 1}, client)
+    assert no_stock.value.status == 400
+
+
+def test_errors_use_the_nest_error_body(api):
+    with pytest.raises(HttpError) as missing:
+        api.dispatch("GET", "/products/7", {}, "")
+    with pytest.raises(HttpError) as not_numeric:
+        api.dispatch("GET", "/products/abc", {}, "")
+    with pytest.raises(HttpError) as unknown:
+        api.dispatch("GET", "/wishlist", {}, "")
+    with pytest.raises(HttpError) as invalid:
+        api.dispatch("POST", "/categories", {}, "")
+
+    assert missing.value.body == {"statusCode": 404, "message": "Product with ID 7 not found", "error": "Not Found"}
+    assert not_numeric.value.status == 400
+    assert unknown.value.body["message"] == "Cannot GET /wishlist"
+    assert invalid.value.body["message"] == ["name should not be empty"]
+
+
+def test_server_answers_over_http(store):
+    backend = StubBackend(store=store).start()
+    try:
+        with urllib.request.urlopen(f"{backend.url}/") as response:
+            assert json.loads(response.read()) == "Hello World!"
+        request = urllib.request.Request(
+            f"{backend.url}/categories", data=json.dumps({"name": "Socks"}).encode(), method="POST",
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(request) as response:
+            assert response.status == 201
+            assert response.headers["Access-Control-Allow-Origin"] == "*"
+        assert len(store.all("categories")) == 2
+    finally:
+        backend.stop()
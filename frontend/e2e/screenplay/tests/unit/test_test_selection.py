@@ -0,0 +1,177 @@
+"""
+Unit - Change-Based Test Selection
+The test map built from a small Angular app and suite, and the tests a diff selects from it
+"""
+from pathlib import Path
+from types import SimpleNamespace
+
+from plugins import test_selection
+from plugins.test_selection import SCREENPLAY_DIR, AngularApp, SuiteSources, build_map, select
+
+APP_FILES = {
+    "app.routes.ts": """
+import { CartComponent } from './cart/cart.component';
+import { AdminComponent } from './admin/admin.component';
+import { AuthGuard, AdminGuard } from './guards/auth.guard';
+export const routes = [
+  { path: 'cart', component: CartComponent, canActivate: [AuthGuard] },
+  { path: 'admin', component: AdminComponent, canActivate: [AdminGuard] },
+];
+""",
+    "cart/cart.component.ts": """
+import { CartService } from '../services/cart.service';
+@Component({ selector: 'app-cart', templateUrl: './cart.component.html', styleUrls: ['./cart.component.css'] })
+export class CartComponent {}
+""",
+    "cart/cart.component.html": '<div class="cart-drawer"><app-cart-item></app-cart-item></div>',
+    "cart/cart.component.css": ".cart-drawer { display: flex; }",
+    "cart/cart-item.component.ts": """
+@Component({ selector: 'app-cart-item', templateUrl: './cart-item.component.html' })
+export class CartItemComponent {}
+""",
+    "cart/cart-item.component.html": '<li class="cart-item-row"></li>',
+    "product/product.component.ts": """
+@Component({ selector: 'app-product', templateUrl: './product.component.html' })
+export class ProductComponent {}
+""",
+    "product/product.component.html": '<article class="product-card"></article>',
+    "services/cart.service.ts": "export class CartService { key = 'vallmere_carts'; }",
+    "admin/admin.component.ts": """
+@Component({ selector: 'app-admin', templateUrl: './admin.component.html' })
+export class AdminComponent {}
+""",
+    "admin/admin.component.html": '<section class="admin-panel"></section>',
+    "guards/auth.guard.ts": "export class AuthGuard {}\nexport class AdminGuard {}",
+}
+
+SUITE_FILES = {
+    "pages/__init__.py": "",
+    "pages/cart_page.py": 'CART_DRAWER = ".cart-drawer"\n',
+    "tests/test_cart.py": (
+        "from pages.cart_page import CART_DRAWER\n\n\n"
+        "def test_cart(browser):\n    browser.get(\"http://localhost:4200/cart\")\n"
+    ),
+    "tests/test_product.py": 'def test_product(browser):\n    browser.find_element("css selector", ".product-card")\n',
+    "actions/__init__.py": "",
+    "actions/authenticate_directly.py": (
+        "class AuthenticateDirectly:\n"
+        "    @classmethod\n    def as_admin(cls):\n        return cls(route=\"/admin\")\n\n"
+        "    def perform_as(self, actor):\n        browser.get(f\"{BASE_URL}/login\")\n"
+    ),
+    "pages/admin_page.py": 'ADMIN_PANEL = ".admin-panel"\n',
+    "tests/test_admin_direct.py": (
+        "from actions.authenticate_directly import AuthenticateDirectly\n\n\n"
+        "def test_admin_direct(actor):\n    actor.attempts_to(AuthenticateDirectly.as_admin())\n"
+    ),
+    "tests/test_admin_form.py": (
+        "from pages.admin_page import ADMIN_PANEL\n\n\n"
+        "def test_admin_form(browser):\n    browser.find_element(\"css selector\", ADMIN_PANEL)\n"
+    ),
+    "tests/test_storage.py": (
+        'CARTS_KEY = "vallmere_carts"\n\n\n'
+        "def test_storage(browser):\n    browser.execute_script(\"return localStorage.getItem(arguments[0])\", CARTS_KEY)\n"
+    ),
+}
+
+# select() reads the real layout: the suite under frontend/e2e/screenplay, the app under frontend/src
+REPO_ROOT = SCREENPLAY_DIR.parents[2]
+SUITE = "frontend/e2e/screenplay/"
+CART_TEMPLATE = "frontend/src/app/cart/cart.component.html"
+MAPPING = {
+    f"{SUITE}tests/test_cart.py": {
+        "python": [f"{SUITE}pages/cart_page.py", f"{SUITE}tests/test_cart.py"],
+        "app": {CART_TEMPLATE: "app-cart (route /cart)"},
+    },
+    f"{SUITE}tests/test_product.py": {"python": [f"{SUITE}tests/test_product.py"], "app": {}},
+}
+
+
+def write_tree(root: Path, files: dict) -> None:
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+
+
+def test_build_map_follows_routes_selectors_and_storage_keys(tmp_path):
+    write_tree(tmp_path / "src" / "app", APP_FILES)
+    write_tree(tmp_path / "screenplay", SUITE_FILES)
+
+    mapping = build_map(AngularApp(tmp_path / "src" / "app"), SuiteSources(tmp_path / "screenplay"), tmp_path)
+
+    cart = mapping["screenplay/tests/test_cart.py"]
+    assert cart["python"] == ["screenplay/pages/cart_page.py", "screenplay/tests/test_cart.py"]
+    assert set(cart["app"]) == {
+        "src/app/cart/cart.component.ts",
+        "src/app/cart/cart.component.html",
+        "src/app/cart/cart.component.css",
+        "src/app/cart/cart-item.component.ts",
+        "src/app/cart/cart-item.component.html",
+        "src/app/services/cart.service.ts",
+        "src/app/guards/auth.guard.ts",
+    }
+    assert cart["app"]["src/app/guards/auth.guard.ts"] == "guard of route /cart"
+    assert set(mapping["screenplay/tests/test_product.py"]["app"]) == {
+        "src/app/product/product.component.ts",
+        "src/app/product/product.component.html",
+    }
+    assert mapping["screenplay/tests/test_storage.py"]["app"] == {
+        "src/app/services/cart.service.ts": "string 'vallmere_carts'",
+    }
+
+
+def test_a_guard_change_selects_the_tests_behind_it(tmp_path, monkeypatch):
+    screenplay, app_dir = tmp_path / "frontend" / "e2e" / "screenplay", tmp_path / "frontend" / "src" / "app"
+    write_tree(app_dir, APP_FILES)
+    write_tree(screenplay, SUITE_FILES)
+    monkeypatch.setattr(test_selection, "SCREENPLAY_DIR", screenplay)
+    monkeypatch.setattr(test_selection, "APP_DIR", app_dir)
+
+    mapping = build_map(AngularApp(app_dir), SuiteSources(screenplay), tmp_path)
+    selected = select(["frontend/src/app/guards/auth.guard.ts"], mapping, tmp_path)
+
+    # The admin tests reach /admin through the action's route and through the admin panel they wait for
+    assert sorted(Path(test).name for test in selected) == ["test_admin_direct.py", "test_admin_form.py", "test_cart.py"]
+    assert SuiteSources.navigations_in(screenplay / "actions" / "authenticate_directly.py") == {"/login"}
+    direct = mapping["frontend/e2e/screenplay/tests/test_admin_direct.py"]["app"]
+    assert direct["frontend/src/app/admin/admin.component.ts"] == "app-admin (route /admin)"
+
+
+def test_select_by_changed_file():
+    def selected(*changed):
+        return sorted(Path(test).name for test in select(changed, MAPPING, REPO_ROOT))
+
+    assert selected(f"{SUITE}pages/cart_page.py") == ["test_cart.py"]
+    assert selected(CART_TEMPLATE) == ["test_cart.py"]
+    assert selected(f"{SUITE}tests/conftest.py") == ["test_cart.py", "test_product.py"]
+    assert selected("frontend/src/app/app.routes.ts") == ["test_cart.py", "test_product.py"]
+    assert selected("frontend/angular.json") == ["test_cart.py", "test_product.py"]
+    assert selected("frontend/src/app/cart/cart.component.spec.ts") == []
+    assert selected("frontend/src/app/orders/orders.component.ts") == []
+    assert selected("frontend/README.md", "backend/app.py") == []
+
+
+def test_select_lists_every_change_behind_a_test():
+    changed = [f"{SUITE}pages/cart_page.py", CART_TEMPLATE]
+
+    assert select(changed, MAPPING, REPO_ROOT) == {f"{SUITE}tests/test_cart.py": changed}
+
+
+def test_deselect_keeps_affected_and_unmapped_tests(monkeypatch):
+    monkeypatch.setattr(test_selection, "repository_root", lambda: REPO_ROOT)
+    monkeypatch.setattr(test_selection, "load_map", lambda repo_root: MAPPING)
+    monkeypatch.setattr(test_selection, "changed_files", lambda base, repo_root: [CART_TEMPLATE])
+    deselected = []
+    config = SimpleNamespace(
+        getoption=lambda name: "origin/main",
+        hook=SimpleNamespace(pytest_deselected=lambda items: deselected.extend(items)),
+    )
+    items = [
+        SimpleNamespace(fspath=REPO_ROOT / SUITE / "tests" / name)
+        for name in ("test_cart.py", "test_product.py", "unit/test_scheduler.py")
+    ]
+
+    test_selection.deselect_unaffected(config, items)
+
+    assert [Path(item.fspath).name for item in items] == ["test_cart.py", "test_scheduler.py"]
+    assert [Path(item.fspath).name for item in deselected] == ["test_product.py"]
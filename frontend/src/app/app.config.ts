@@ -1,13 +1,23 @@
 import { ApplicationConfig, provideZoneChangeDetection } from '@angular/core';
 import { provideRouter } from '@angular/router';
+import { provideProtractorTestingSupport } from '@angular/platform-browser';
 import { provideAnimations } from '@angular/platform-browser/animations';
-import { provideToastr } from 'ngx-toastr';
+import { GlobalConfig, provideToastr } from 'ngx-toastr';
 import { routes } from './app.routes';
+import { environment } from '../environments/environment';
+
+// Toastr options the E2E suite sets before the app boots (e2e/screenplay/actors/animations.py);
+// production builds ignore them
+const e2eToastrConfig: Partial<GlobalConfig> = environment.e2e
+  ? (globalThis as unknown as { __vallmereE2E?: { toastr?: Partial<GlobalConfig> } }).__vallmereE2E?.toastr ?? {}
+  : {};
 
 export const appConfig: ApplicationConfig = {
   providers: [
     provideZoneChangeDetection({ eventCoalescing: true }),
     provideRouter(routes),
+    // Exposes window.getAllAngularTestabilities() for the E2E suite's WaitForAngular action; not in production builds
+    ...(environment.e2e ? [provideProtractorTestingSupport()] : []),
     provideAnimations(),
     provideToastr({
       timeOut: 3000,
@@ -25,7 +35,8 @@ export const appConfig: ApplicationConfig = {
       messageClass: 'toast-message',
       tapToDismiss: true,
       easeTime: 300,
-      easing: 'ease-in'
+      easing: 'ease-in',
+      ...e2eToastrConfig
     })
   ]
 };
@@ -0,0 +1,7 @@
+import { environment as production } from './environment.prod';
+
+// The production build plus the hooks the E2E suites rely on (ng build --configuration e2e)
+export const environment = {
+  ...production,
+  e2e: true
+};
@@ -1,5 +1,6 @@
 export const environment = {
   production: true,
+  e2e: false,
   oauth: {
     google: {
       clientId: '709306551500-2ad9db76j4riiuhl2p65gq1rbhsdlthi.apps.googleusercontent.com'
@@ -1,5 +1,7 @@
 export const environment = {
   production: false,
+  // Test hooks for the E2E suites (Angular testability, toastr overrides)
+  e2e: true,
   oauth: {
     google: {
       clientId: '709306551500-2ad9db76j4riiuhl2p65gq1rbhsdlthi.apps.googleusercontent.com'